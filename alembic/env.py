@@ -30,6 +30,8 @@ from app.models.interview import Interview, Question, Answer
 from app.models.analysis import Analysis
 from app.models.passed_resume import PassedResume
 from app.models.video_analysis import VideoAnalysis
+from app.models.spell_check_cache import SpellCheckCache
+from app.models.llm_response_cache import LLMResponseCache
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
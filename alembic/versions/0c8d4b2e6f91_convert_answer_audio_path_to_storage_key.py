@@ -0,0 +1,37 @@
+"""Convert answer audio_path to storage key
+
+Revision ID: 0c8d4b2e6f91
+Revises: a3c5e8f17d20
+Create Date: 2026-10-19 18:26:44.105273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c8d4b2e6f91'
+down_revision: Union[str, Sequence[str], None] = 'a3c5e8f17d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 값 "audio_files/<uuid>.wav"(작업 디렉터리 기준 경로)를 로컬 저장소 루트 기준 키 "<uuid>.wav"로 변환
+    # (샤딩되지 않은 키도 로컬 저장소에서 그대로 유효)
+    op.execute(
+        r"UPDATE answer SET audio_path = regexp_replace(audio_path, '^audio_files[/\\]', '') "
+        r"WHERE audio_path ~ '^audio_files[/\\]'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 손실 있는 되돌리기: 샤딩되지 않은 키("<uuid>.wav")만 이전 경로로 되돌림.
+    # 이후에 저장된 샤딩 키("ab/cd/<uuid>.opus")는 이전 코드가 찾는 위치에 파일이 없으므로 그대로 둠
+    op.execute(
+        "UPDATE answer SET audio_path = 'audio_files/' || audio_path "
+        "WHERE audio_path IS NOT NULL AND audio_path NOT LIKE '%/%'"
+    )
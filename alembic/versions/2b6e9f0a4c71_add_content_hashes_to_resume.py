@@ -0,0 +1,76 @@
+"""Add file and content hashes to Resume table
+
+Revision ID: 2b6e9f0a4c71
+Revises: e7b04c9d3a18
+Create Date: 2026-10-19 14:05:12.640389
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import hashlib
+import unicodedata
+
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2b6e9f0a4c71'
+down_revision: Union[str, Sequence[str], None] = 'e7b04c9d3a18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 200
+
+
+# Frozen copy of app.utils.content_hash.content_sha256 as of this revision,
+# so replaying the migration does not depend on the app version.
+def content_sha256(text):
+    if not text:
+        return None
+    text = unicodedata.normalize("NFC", text)
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    normalized = "\n".join(line for line in lines if line)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resume', sa.Column('file_sha256', sa.String(length=64), nullable=True))
+    op.add_column('resume', sa.Column('content_sha256', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_resume_file_sha256'), 'resume', ['file_sha256'], unique=False)
+    op.create_index(op.f('ix_resume_content_sha256'), 'resume', ['content_sha256'], unique=False)
+
+    # Backfill the text hash for existing resumes (original file bytes are not kept)
+    resume = sa.table(
+        'resume',
+        sa.column('resume_id', sa.BigInteger()),
+        sa.column('content', sa.Text()),
+        sa.column('content_sha256', sa.String()),
+    )
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(resume.c.resume_id, resume.c.content)
+            .where(resume.c.content.isnot(None), resume.c.resume_id > last_id)
+            .order_by(resume.c.resume_id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for resume_id, content in rows:
+            bind.execute(
+                resume.update()
+                .where(resume.c.resume_id == resume_id)
+                .values(content_sha256=content_sha256(content))
+            )
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_resume_content_sha256'), table_name='resume')
+    op.drop_index(op.f('ix_resume_file_sha256'), table_name='resume')
+    op.drop_column('resume', 'content_sha256')
+    op.drop_column('resume', 'file_sha256')
@@ -0,0 +1,86 @@
+"""Add audio metric columns to Answer table
+
+Revision ID: 5d2f8b61e0a4
+Revises: c4e1a7d92b3f
+Create Date: 2026-10-19 11:03:47.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8b61e0a4'
+down_revision: Union[str, Sequence[str], None] = 'c4e1a7d92b3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+# Frozen copy of app.utils.audio_analysis.summarize_whisper_result as of this
+# revision, so replaying the migration does not depend on the app version.
+def summarize_whisper_result(whisper_result):
+    if not whisper_result:
+        return {"speech_rate": None, "silence_ratio": None, "duration": None}
+
+    segments = whisper_result.get("segments") or []
+    duration = float(segments[-1]["end"]) if segments else 0.0
+    full_text = (whisper_result.get("text") or "").strip()
+    if not segments or not full_text or duration == 0:
+        return {"speech_rate": 0.0, "silence_ratio": 0.0, "duration": duration}
+
+    wpm = len(full_text.split()) / (duration / 60)
+
+    silence = sum(
+        max(segments[i + 1]["start"] - segments[i]["end"], 0.0) for i in range(len(segments) - 1)
+    )
+    silence += max(segments[0]["start"], 0.0)
+    silence_ratio = silence / duration * 100
+
+    avg_no_speech_prob = sum(seg.get("no_speech_prob", 0.0) for seg in segments) / len(segments)
+    if avg_no_speech_prob > 0.2 and silence_ratio < 5.0:
+        silence_ratio += avg_no_speech_prob * 10
+
+    return {"speech_rate": float(wpm), "silence_ratio": float(silence_ratio), "duration": duration}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('answer', sa.Column('speech_rate', sa.Float(), nullable=True))
+    op.add_column('answer', sa.Column('silence_ratio', sa.Float(), nullable=True))
+    op.add_column('answer', sa.Column('duration', sa.Float(), nullable=True))
+
+    # Backfill metrics for answers saved before this revision
+    answer = sa.table(
+        'answer',
+        sa.column('answer_id', sa.BigInteger()),
+        sa.column('whisper_result', sa.JSON()),
+        sa.column('speech_rate', sa.Float()),
+        sa.column('silence_ratio', sa.Float()),
+        sa.column('duration', sa.Float()),
+    )
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(answer.c.answer_id, answer.c.whisper_result)
+            .where(answer.c.whisper_result.isnot(None), answer.c.answer_id > last_id)
+            .order_by(answer.c.answer_id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for answer_id, whisper_result in rows:
+            metrics = summarize_whisper_result(whisper_result)
+            bind.execute(answer.update().where(answer.c.answer_id == answer_id).values(**metrics))
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('answer', 'duration')
+    op.drop_column('answer', 'silence_ratio')
+    op.drop_column('answer', 'speech_rate')
@@ -0,0 +1,110 @@
+"""Slim whisper_result storage with compressed detail column
+
+Revision ID: 9a7c3e15f6b2
+Revises: 5d2f8b61e0a4
+Create Date: 2026-10-19 11:48:15.904672
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import json
+import zlib
+
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a7c3e15f6b2'
+down_revision: Union[str, Sequence[str], None] = '5d2f8b61e0a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 200
+
+# Frozen copies of the app.utils.whisper_storage helpers as of this revision,
+# so replaying the migration does not depend on the app version.
+SLIM_SEGMENT_FIELDS = ("start", "end", "text", "no_speech_prob")
+SLIM_TOP_LEVEL_FIELDS = ("text", "language")
+
+
+def slim_whisper_result(whisper_result):
+    slim = {key: whisper_result[key] for key in SLIM_TOP_LEVEL_FIELDS if key in whisper_result}
+    slim["segments"] = [
+        {key: segment[key] for key in SLIM_SEGMENT_FIELDS if key in segment}
+        for segment in whisper_result.get("segments") or []
+    ]
+    return slim
+
+
+def is_slim(whisper_result):
+    if set(whisper_result) - set(SLIM_TOP_LEVEL_FIELDS) - {"segments"}:
+        return False
+    return all(set(segment) <= set(SLIM_SEGMENT_FIELDS) for segment in whisper_result.get("segments") or [])
+
+
+def compress_whisper_result(whisper_result):
+    payload = json.dumps(whisper_result, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"), level=6)
+
+
+def decompress_whisper_result(blob):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+answer = sa.table(
+    'answer',
+    sa.column('answer_id', sa.BigInteger()),
+    sa.column('whisper_result', sa.JSON()),
+    sa.column('whisper_result_detail', sa.LargeBinary()),
+)
+
+
+def _batches(bind, where):
+    """Yields (answer_id, whisper_result, whisper_result_detail) rows in id order."""
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(answer.c.answer_id, answer.c.whisper_result, answer.c.whisper_result_detail)
+            .where(where, answer.c.answer_id > last_id)
+            .order_by(answer.c.answer_id)
+            .limit(BATCH_SIZE)
+        ).fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('answer', sa.Column('whisper_result_detail', sa.LargeBinary(), nullable=True))
+
+    # Compact existing rows: move the full result into the compressed column
+    bind = op.get_bind()
+    for rows in _batches(bind, answer.c.whisper_result.isnot(None)):
+        for answer_id, whisper_result, _ in rows:
+            if is_slim(whisper_result):
+                continue
+            bind.execute(
+                answer.update()
+                .where(answer.c.answer_id == answer_id)
+                .values(
+                    whisper_result=slim_whisper_result(whisper_result),
+                    whisper_result_detail=compress_whisper_result(whisper_result),
+                )
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Restore full results before dropping the compressed column
+    bind = op.get_bind()
+    for rows in _batches(bind, answer.c.whisper_result_detail.isnot(None)):
+        for answer_id, _, detail in rows:
+            bind.execute(
+                answer.update()
+                .where(answer.c.answer_id == answer_id)
+                .values(whisper_result=decompress_whisper_result(detail))
+            )
+
+    op.drop_column('answer', 'whisper_result_detail')
@@ -0,0 +1,41 @@
+"""Add audio_expires_at to answer
+
+Revision ID: a3c5e8f17d20
+Revises: 6f3d91c2a7e5
+Create Date: 2026-10-19 17:41:09.362815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e8f17d20'
+down_revision: Union[str, Sequence[str], None] = '6f3d91c2a7e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# AUDIO_MAX_RETENTION_MINUTES의 기본값 (마이그레이션 작성 시점 값으로 고정)
+MAX_RETENTION_MINUTES = 180
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('answer', sa.Column('audio_expires_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_answer_audio_expires_at'), 'answer', ['audio_expires_at'], unique=False)
+
+    # 기존 음성 파일은 삭제 예약이 메모리에만 있었으므로 최대 보관 시간 뒤에 만료 처리
+    # (배포 직후 진행 중인 면접의 음성을 바로 지우지 않도록 지금이 아닌 최대 보관 시간 이후로 설정)
+    op.execute(
+        "UPDATE answer SET audio_expires_at = (now() AT TIME ZONE 'utc') "
+        f"+ interval '{MAX_RETENTION_MINUTES} minutes' "
+        "WHERE audio_path IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_answer_audio_expires_at'), table_name='answer')
+    op.drop_column('answer', 'audio_expires_at')
@@ -0,0 +1,36 @@
+"""Add audio_archived_at to answer
+
+Revision ID: b8e2d4f6a019
+Revises: 0c8d4b2e6f91
+Create Date: 2026-10-19 21:02:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2d4f6a019'
+down_revision: Union[str, Sequence[str], None] = '0c8d4b2e6f91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('answer', sa.Column('audio_archived_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_answer_audio_archived_at'), 'answer', ['audio_archived_at'], unique=False)
+
+    # 기존 음성은 보관 작업이 이미 끝났거나 메모리에서 사라졌으므로 다시 처리할 수 없음: 보관 완료로 표시
+    op.execute(
+        "UPDATE answer SET audio_archived_at = (now() AT TIME ZONE 'utc') "
+        "WHERE audio_path IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_answer_audio_archived_at'), table_name='answer')
+    op.drop_column('answer', 'audio_archived_at')
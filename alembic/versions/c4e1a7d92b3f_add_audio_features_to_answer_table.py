@@ -0,0 +1,28 @@
+"""Add audio_features to Answer table
+
+Revision ID: c4e1a7d92b3f
+Revises: 8b39a4aafe42
+Create Date: 2026-10-19 10:12:04.512331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1a7d92b3f'
+down_revision: Union[str, Sequence[str], None] = '8b39a4aafe42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('answer', sa.Column('audio_features', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('answer', 'audio_features')
@@ -0,0 +1,37 @@
+"""Add spell_check_cache table
+
+Revision ID: e7b04c9d3a18
+Revises: 9a7c3e15f6b2
+Create Date: 2026-10-19 13:20:51.377402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b04c9d3a18'
+down_revision: Union[str, Sequence[str], None] = '9a7c3e15f6b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('spell_check_cache',
+    sa.Column('line_hash', sa.String(length=64), nullable=False),
+    sa.Column('checked_text', sa.Text(), nullable=False),
+    sa.Column('hit_count', sa.BigInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.Column('last_used_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('line_hash')
+    )
+    op.create_index(op.f('ix_spell_check_cache_last_used_at'), 'spell_check_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_spell_check_cache_last_used_at'), table_name='spell_check_cache')
+    op.drop_table('spell_check_cache')
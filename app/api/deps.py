@@ -1,16 +1,25 @@
+from dataclasses import dataclass
 from typing import Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 from sqlalchemy.orm import Session
 
-from app import crud, models
+from app import crud, models, schemas
 from app.core.config import SECRET_KEY, ALGORITHM # SECRET_KEY, ALGORITHM 직접 임포트
 from app.db.session import SessionLocal # SessionLocal 임포트 경로 수정
+from app.utils.user_cache import user_cache
 from jose.exceptions import JWTError
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/login/token")
 
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller, built from verified JWT claims only (no DB access)."""
+    user_id: int
+
+
 def get_db() -> Generator:
     try:
         db = SessionLocal()
@@ -18,21 +27,68 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-def get_user_from_token(db: Session, token: str) -> models.User:
+def get_principal_from_token(token: str) -> Principal:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Invalid token")
-    except JWTError:
+        user_id = int(payload.get("sub"))
+    except (JWTError, TypeError, ValueError):
         raise HTTPException(status_code=401, detail="Invalid token")
-    
-    user = crud.crud_user.get(db, user_id=int(user_id))
+
+    # 이 프로세스에서 삭제된 사용자의 토큰은 만료 전이라도 거부
+    # (다른 워커에서 삭제된 경우는 쓰기 시점에 raise_if_user_deleted로 처리)
+    if user_cache.is_deleted(user_id):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return Principal(user_id=user_id)
+
+def raise_if_user_deleted(db: Session, user_id: int) -> None:
+    """
+    Call after an IntegrityError on a write owned by user_id.
+
+    The claims-only check cannot see users deleted by another worker, so their
+    tokens keep passing until they expire; the first write then violates the
+    user foreign key. If the user row is gone, answer 401 (and remember the
+    deletion in this process) instead of a 500. Returns when the user exists,
+    so the caller can re-raise the original error.
+    """
+    db.rollback()
+    if crud.crud_user.get(db, user_id=user_id) is None:
+        user_cache.invalidate(user_id, deleted=True)
+        raise HTTPException(status_code=401, detail="User no longer exists")
+
+def get_user_from_token(db: Session, token: str) -> models.User:
+    principal = get_principal_from_token(token)
+    user = crud.crud_user.get(db, user_id=principal.user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
+def get_current_principal(token: str = Depends(oauth2_scheme)) -> Principal:
+    """
+    Lightweight auth for endpoints that only need the caller's user_id.
+    Trusts the signed claims and skips the per-request user query.
+    """
+    return get_principal_from_token(token)
+
 def get_current_user(
     db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
 ) -> models.User:
-    return get_user_from_token(db=db, token=token)
\ No newline at end of file
+    """Loads the caller's User row; use when the endpoint modifies the user."""
+    return get_user_from_token(db=db, token=token)
+
+def get_current_user_cached(
+    principal: Principal = Depends(get_current_principal), db: Session = Depends(get_db)
+) -> schemas.User:
+    """
+    Read-only profile of the caller, served from the short-TTL user cache.
+    The DB is queried only on a cache miss (the session connects lazily).
+    """
+    cached = user_cache.get(principal.user_id)
+    if cached is not None:
+        return cached
+
+    user = crud.crud_user.get(db, user_id=principal.user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    snapshot = schemas.User.model_validate(user)
+    user_cache.set(snapshot)
+    return snapshot
@@ -1,136 +1,69 @@
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends, UploadFile, File
-from typing import List, Any, Dict
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from typing import List, Any, Dict, Optional
 import os
 import base64
-import uuid
 import re
 import io
-import json
 import asyncio
-import google.generativeai as genai
-import google.cloud.texttospeech as tts
-import whisper
-import anthropic
-import httpx
-from pydub import AudioSegment
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.db.session import SessionLocal
 from app import crud, models
+from app.core.config import AUDIO_RETENTION_MINUTES
 from app.api import deps
 from app.schemas.interview import InterviewCreate, QuestionCreate, AnswerCreate, InterviewSession, VideoAnalysisRequest
 from app.schemas.analysis import Analysis, AnalysisCreate
 from app.schemas.video_analysis import VideoAnalysisCreate
-from app.utils.audio_analysis import analyze_whisper_result
+from app.schemas.generated_question import GeneratedQuestionCreate
+from app.utils.audio_analysis import summarize_whisper_result, extract_audio_features_async
+from app.utils.audio_archive import audio_archiver
+from app.utils.audio_storage import get_audio_storage
+from app.utils.whisper_storage import prepare_whisper_result_for_storage
 from app.utils.video_analysis import analyze_video_landmarks
-from app.prompts import get_question_generation_prompt, get_interview_analysis_prompt
+from app.utils.llm_cache import llm_cache_key, llm_response_cache
+from app.utils.question_generation import generate_question_texts
+from app.utils.question_pregeneration import wait_for_pregeneration
+from app.utils.tts import get_question_audio
+from app.utils.structured_output import StructuredOutputError
+from app.utils.admission import AdmissionRejected, interview_admission
+from app.utils.session_store import get_session_store
+from app.utils.transcription import get_transcription_dispatcher
+from app.utils.prompt_cache import cached_system_blocks, log_prompt_cache_usage
+from app.utils.llm_stream import SSE_HEADERS, sse_event, stream_claude_text, stream_and_persist
+from app.prompts import (
+    INTERVIEW_ANALYSIS_SYSTEM_PROMPT,
+    get_interview_analysis_prompt,
+    get_interview_analysis_user_prompt,
+)
 
 load_dotenv()
 
-if os.path.exists("ffmpeg.exe"):
-    AudioSegment.converter = os.path.abspath("ffmpeg.exe")
 
 router = APIRouter()
 
-# Module-level Whisper model cache (better than using globals())
-_whisper_model = None
-
-def get_whisper_model():
-    """Lazy-load and cache the Whisper model."""
-    global _whisper_model
-    if _whisper_model is None:
-        print("Loading Whisper model for the first time...")
-        _whisper_model = whisper.load_model("small")
-        print("Whisper model loaded successfully.")
-    return _whisper_model
-
-def clean_text_for_tts(text: str) -> str:
-    """
-    TTS 음성 생성을 위해 텍스트를 정제합니다.
-    이모티콘, 태그, 특수 기호 등을 제거합니다.
-
-    Args:
-        text: 원본 질문 텍스트
-
-    Returns:
-        정제된 텍스트
-    """
-    if not text:
-        return text
-
-    # 1. [공통], [압박] 같은 대괄호 태그와 뒤의 공백 제거
-    text = re.sub(r'\[.*?\]\s*', '', text)
-
-    # 2. 🌶️ 같은 특정 이모티콘 제거 (더 안전한 방법)
-    # 일반적인 이모티콘만 제거
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F300-\U0001F9FF"  # 대부분의 이모티콘
-        "\U00002600-\U000027BF"  # 기타 기호
-        "]+",
-        flags=re.UNICODE
-    )
-    text = emoji_pattern.sub('', text)
-
-    # 3. 연속된 공백을 하나로 축소
-    text = re.sub(r'\s+', ' ', text)
-
-    # 4. 앞뒤 공백 제거
-    text = text.strip()
-
-    # 5. 안전장치: 텍스트가 비어있으면 경고
-    if not text:
-        print(f"WARNING: clean_text_for_tts resulted in empty string!")
-        return "질문을 준비 중입니다"  # 폴백 텍스트
-
-    return text
-
-async def cleanup_audio_files_after_delay(interview_id: int, delay_minutes: int = 5):
-    """
-    면접 종료 후 일정 시간(기본 5분) 후 해당 면접의 오디오 파일들을 자동으로 삭제합니다.
-
-    Args:
-        interview_id: 면접 ID
-        delay_minutes: 삭제 전 대기 시간 (분)
-    """
-    await asyncio.sleep(delay_minutes * 60)  # 분을 초로 변환
-
-    print(f"Starting audio file cleanup for interview {interview_id} after {delay_minutes} minute(s) delay...")
-
-    db = SessionLocal()
-    try:
-        # 해당 면접의 모든 답변 조회
-        answers = crud.interview.get_answers_by_interview(db, interview_id=interview_id)
-
-        deleted_count = 0
-        error_count = 0
+# 세션 상태에 기록하는 이 프로세스의 식별자 (호스트:PID)
+NODE_NAME = f"{socket.gethostname()}:{os.getpid()}"
 
-        for answer in answers:
-            if answer.audio_path:
-                try:
-                    if os.path.exists(answer.audio_path):
-                        os.remove(answer.audio_path)
-                        deleted_count += 1
-                        print(f"Deleted audio file: {answer.audio_path}")
-                    else:
-                        print(f"Audio file not found (already deleted?): {answer.audio_path}")
-                except Exception as e:
-                    error_count += 1
-                    print(f"Error deleting audio file {answer.audio_path}: {e}")
-
-        print(f"Audio cleanup completed for interview {interview_id}: {deleted_count} files deleted, {error_count} errors")
-    except Exception as e:
-        print(f"Error during audio cleanup for interview {interview_id}: {e}")
-    finally:
-        db.close()
+def get_audio_segment_class():
+    """pydub is imported on first use (it probes for ffmpeg at import time)."""
+    from pydub import AudioSegment
+    if os.path.exists("ffmpeg.exe"):
+        AudioSegment.converter = os.path.abspath("ffmpeg.exe")
+    return AudioSegment
 
 @router.get("/", response_model=List[Dict[str, Any]])
 def get_user_interviews(
     *,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: deps.Principal = Depends(deps.get_current_principal)
 ):
     """
     Get all interviews for the current user with resume information and Q&A data.
@@ -140,8 +73,8 @@ def get_user_interviews(
 
     result = []
     for interview in interviews:
-        # Get resume information
-        resume = crud.resume.get(db, resume_id=interview.resume_id)
+        # Get resume information (title only)
+        resume = crud.resume.get_summary(db, resume_id=interview.resume_id)
 
         # Get questions and answers
         questions = crud.interview.get_questions_by_interview(db, interview_id=interview.interview_id)
@@ -177,29 +110,49 @@ def get_user_interviews(
 
     return result
 
+@router.get("/audio-archive/stats")
+def read_audio_archive_stats(
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """Storage savings and transcoding throughput of answer audio archiving (this process)."""
+    return audio_archiver.get_stats()
+
+@router.get("/admission/stats")
+async def read_admission_stats(
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """
+    Active sessions, queue depth and wait times of interview admission control.
+    `active` is cluster-wide with SESSION_STORE_BACKEND=redis; the queue and counters are this process's.
+    """
+    return await interview_admission.get_stats()
+
 @router.post("/", response_model=InterviewSession)
 def create_interview_session(
     *,
     db: Session = Depends(deps.get_db),
     resume_id: int,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: deps.Principal = Depends(deps.get_current_principal)
 ):
     """
     Creates an interview session.
     It uses questions already associated with the resume.
     If no questions exist, it generates them on the fly and saves them to the fly and saves them to the resume.
     """
-    resume = crud.resume.get(db, resume_id=resume_id)
-    if not resume or resume.user_id != current_user.user_id:
+    if crud.resume.get_owner_id(db, resume_id=resume_id) != current_user.user_id:
         raise HTTPException(status_code=404, detail="Resume not found or access denied")
 
     questions_text = []
-    if resume.generated_questions:
-        print(f"Found {len(resume.generated_questions)} existing questions for resume {resume_id}.")
-        questions_text = [q.question_text for q in resume.generated_questions]
+    existing_questions = crud.generated_question.get_questions_by_resume(db, resume_id=resume_id)
+    if not existing_questions and wait_for_pregeneration(resume_id):
+        # 업로드 직후 백그라운드 사전 생성이 진행 중이었음 → 완료된 결과 사용
+        existing_questions = crud.generated_question.get_questions_by_resume(db, resume_id=resume_id)
+    if existing_questions:
+        print(f"Found {len(existing_questions)} existing questions for resume {resume_id}.")
+        questions_text = [q.question_text for q in existing_questions]
     else:
         print(f"No questions found for resume {resume_id}. Generating new ones.")
-        content = resume.content or ""
+        content = crud.resume.get_content(db, resume_id=resume_id) or ""
         if not content:
             raise HTTPException(status_code=400, detail="Resume content is empty, cannot generate questions.")
 
@@ -209,61 +162,32 @@ def create_interview_session(
             if not google_api_key or not gemini_model_name:
                 raise HTTPException(status_code=500, detail="AI model configuration missing")
 
-            genai.configure(api_key=google_api_key)
-            model = genai.GenerativeModel(gemini_model_name)
-
-            # 개선된 프롬프트 모듈 사용
-            prompt = get_question_generation_prompt(content)
-            response = model.generate_content(prompt)
+            temp_questions = generate_question_texts(
+                db, content, api_key=google_api_key, model_name=gemini_model_name
+            )
 
-            # JSON 형식으로 파싱 시도
-            temp_questions = []
-            try:
-                # 응답에서 JSON 부분 추출
-                response_text = response.text.strip()
-                if "```json" in response_text:
-                    json_start = response_text.find("```json") + 7
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                elif "```" in response_text:
-                    json_start = response_text.find("```") + 3
-                    json_end = response_text.find("```", json_start)
-                    json_str = response_text[json_start:json_end].strip()
-                else:
-                    json_str = response_text
-
-                parsed_response = json.loads(json_str)
-                # 태그와 이모티콘 유지 (프론트엔드에서 질문 유형 구분용)
-                temp_questions = [q["text"] for q in parsed_response.get("questions", [])]
-            except (json.JSONDecodeError, KeyError) as json_error:
-                # JSON 파싱 실패 시 기존 방식으로 폴백
-                print(f"JSON parsing failed, falling back to text split: {json_error}")
-                raw_questions = response.text.split('\n')
-                for q in raw_questions:
-                    q = q.strip()
-                    if not q or "예상 면접 질문 리스트" in q:
-                        continue
-                    # 번호만 제거, 태그와 이모티콘은 유지
-                    q = re.sub(r'^\d+\.\s*', '', q).strip()
-                    if q:
-                        temp_questions.append(q)
-            
-            if not temp_questions:
-                raise HTTPException(status_code=500, detail="Failed to generate questions.")
-            
             # Save the newly generated questions to the resume
             for q_text in temp_questions:
-                q_in = {"resume_id": resume.resume_id, "question_text": q_text}
-                crud.generated_question.create(db=db, obj_in=q_in)
+                q_in = GeneratedQuestionCreate(resume_id=resume_id, question_text=q_text)
+                crud.generated_question.create_question(db=db, obj_in=q_in)
             
             questions_text = temp_questions
             print(f"Generated and saved {len(questions_text)} new questions for resume {resume_id}.")
 
+        except HTTPException:
+            raise
+        except StructuredOutputError as e:
+            # 검증되지 않은 질문으로는 세션/TTS를 진행하지 않음
+            raise HTTPException(status_code=502, detail=f"AI returned invalid questions: {e}")
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"AI question generation failed: {str(e)}")
 
     interview_create = InterviewCreate(user_id=current_user.user_id, resume_id=resume_id)
-    interview = crud.interview.create_interview(db=db, obj_in=interview_create)
+    try:
+        interview = crud.interview.create_interview(db=db, obj_in=interview_create)
+    except IntegrityError:
+        deps.raise_if_user_deleted(db, current_user.user_id)
+        raise
 
     for q_text in questions_text:
         question_create = QuestionCreate(interview_id=interview.interview_id, question_text=q_text)
@@ -272,41 +196,42 @@ def create_interview_session(
     return InterviewSession(interview_id=interview.interview_id, questions=questions_text)
 
 
-@router.get("/{interview_id}/results", response_model=Analysis)
-async def get_interview_results(
-    interview_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
-):
-    """
-    Get the comprehensive analysis results for a finished interview.
-    This is the single trigger for generating the final report.
+def _analysis_to_dict(analysis: models.Analysis, resume_id: int) -> Dict[str, Any]:
+    # Add resume_id for re-interview functionality
+    return {
+        "analysis_id": analysis.analysis_id,
+        "interview_id": analysis.interview_id,
+        "resume_id": resume_id,
+        "feedback_text": analysis.feedback_text,
+        "speech_rate": analysis.speech_rate,
+        "silence_ratio": analysis.silence_ratio,
+        "gaze_stability": analysis.gaze_stability,
+        "expression_stability": analysis.expression_stability,
+        "posture_stability": analysis.posture_stability,
+        "created_at": analysis.created_at
+    }
+
+
+def _get_claude_settings():
+    api_key = os.getenv("CLAUDE_API_KEY")
+    claude_model = os.getenv("CLAUDE_MODEL")
+    if not api_key or not claude_model:
+        raise HTTPException(status_code=500, detail="Claude API configuration missing.")
+    return api_key.strip().strip('"').strip("'"), claude_model
+
+
+def _build_interview_report_request(db: Session, interview: models.Interview) -> Dict[str, Any]:
     """
-    interview = crud.interview.get_interview(db, interview_id=interview_id)
-    if not interview or interview.user_id != current_user.user_id:
-        raise HTTPException(status_code=404, detail="Interview not found or access denied")
+    Gathers resume, conversation, audio and video data for the final report.
 
-    # If a full analysis already exists, return it to prevent re-generation.
-    analysis = crud.analysis.get_analysis_by_interview(db, interview_id=interview_id)
-    if analysis:
-        # Add resume_id for re-interview functionality
-        analysis_dict = {
-            "analysis_id": analysis.analysis_id,
-            "interview_id": analysis.interview_id,
-            "resume_id": interview.resume_id,
-            "feedback_text": analysis.feedback_text,
-            "speech_rate": analysis.speech_rate,
-            "silence_ratio": analysis.silence_ratio,
-            "gaze_stability": analysis.gaze_stability,
-            "expression_stability": analysis.expression_stability,
-            "posture_stability": analysis.posture_stability,
-            "created_at": analysis.created_at
-        }
-        return analysis_dict
+    Returns the per-candidate user prompt (the static instructions go in the cached
+    system block), the full prompt text used as the response-cache key, and the
+    metrics stored on the Analysis row.
+    """
+    interview_id = interview.interview_id
 
     # --- Gather All Data ---
-    resume = crud.resume.get(db, resume_id=interview.resume_id)
-    resume_content = resume.content if resume else ""
+    resume_content = crud.resume.get_content(db, resume_id=interview.resume_id) or ""
 
     questions = crud.interview.get_questions_by_interview(db, interview_id=interview_id)
     conversation_history = ""
@@ -320,23 +245,12 @@ async def get_interview_results(
 
     # --- Audio Analysis ---
     audio_analysis_summary = ""
-    total_speech_rate = 0
-    total_silence_ratio = 0
-    num_answers_with_audio = 0
-    avg_speech_rate = None
-    avg_silence_ratio = None
+    # 답변 저장 시 계산해 둔 지표를 DB에서 바로 평균 냄
+    avg_speech_rate, avg_silence_ratio, num_answers_with_audio = crud.interview.get_audio_metric_averages(
+        db, interview_id=interview_id
+    )
 
-    for q in questions:
-        if q.answers and q.answers[0].whisper_result:
-            answer = q.answers[0]
-            speech_rate, silence_ratio = analyze_whisper_result(answer.whisper_result)
-            total_speech_rate += speech_rate
-            total_silence_ratio += silence_ratio
-            num_answers_with_audio += 1
-    
     if num_answers_with_audio > 0:
-        avg_speech_rate = total_speech_rate / num_answers_with_audio
-        avg_silence_ratio = total_silence_ratio / num_answers_with_audio
         audio_analysis_summary = f"""
 ---
 ### **음성 분석 (말하기 습관)**
@@ -367,21 +281,13 @@ async def get_interview_results(
 (참고: 이 지표들은 신체의 미세한 움직임의 표준편차를 나타내며, 수치가 낮을수록 시선, 표정, 자세가 안정적이고 자신감 있어 보임을 의미합니다.)
 """
 
-    # --- AI Feedback Generation ---
     print(f"Starting AI feedback generation for interview {interview_id}")
     print(f"- Resume content length: {len(resume_content)}")
     print(f"- Conversation history length: {len(conversation_history)}")
     print(f"- Audio data: speech_rate={avg_speech_rate}, silence_ratio={avg_silence_ratio}")
     print(f"- Video data: gaze={gaze_stability}, expression={expression_stability}, posture={posture_stability}")
 
-    api_key = os.getenv("CLAUDE_API_KEY")
-    claude_model = os.getenv("CLAUDE_MODEL")
-    if not api_key or not claude_model:
-        raise HTTPException(status_code=500, detail="Claude API configuration missing.")
-    api_key = api_key.strip().strip('"').strip("'")
-
-    # 개선된 프롬프트 모듈 사용
-    prompt = get_interview_analysis_prompt(
+    prompt_inputs = dict(
         resume_content=resume_content,
         conversation_history=conversation_history,
         audio_analysis_summary=audio_analysis_summary,
@@ -393,6 +299,64 @@ async def get_interview_results(
         posture_stability=posture_stability
     )
 
+    return {
+        "user_prompt": get_interview_analysis_user_prompt(**prompt_inputs),
+        "prompt": get_interview_analysis_prompt(**prompt_inputs),
+        "metrics": {
+            "speech_rate": avg_speech_rate,
+            "silence_ratio": avg_silence_ratio,
+            "gaze_stability": gaze_stability,
+            "expression_stability": expression_stability,
+            "posture_stability": posture_stability,
+        },
+    }
+
+
+def _save_interview_analysis(
+    db: Session, interview: models.Interview, feedback_text: str, metrics: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Stores the generated report; if a concurrent request already did, returns that one."""
+    analysis_create = AnalysisCreate(interview_id=interview.interview_id, feedback_text=feedback_text, **metrics)
+    try:
+        new_analysis = crud.analysis.create_analysis(db=db, obj_in=analysis_create)
+        return _analysis_to_dict(new_analysis, interview.resume_id)
+    except IntegrityError:
+        # Another request already created the analysis (race condition)
+        # Rollback and fetch the existing analysis
+        db.rollback()
+        print(f"Analysis for interview {interview.interview_id} already exists (race condition detected). Fetching existing analysis.")
+        existing_analysis = crud.analysis.get_analysis_by_interview(db, interview_id=interview.interview_id)
+        if existing_analysis:
+            return _analysis_to_dict(existing_analysis, interview.resume_id)
+        # This should rarely happen
+        raise HTTPException(status_code=500, detail="Failed to create or retrieve analysis")
+
+
+@router.get("/{interview_id}/results", response_model=Analysis)
+async def get_interview_results(
+    interview_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+):
+    """
+    Get the comprehensive analysis results for a finished interview.
+    This is the single trigger for generating the final report.
+    """
+    interview = crud.interview.get_interview(db, interview_id=interview_id)
+    if not interview or interview.user_id != current_user.user_id:
+        raise HTTPException(status_code=404, detail="Interview not found or access denied")
+
+    # If a full analysis already exists, return it to prevent re-generation.
+    analysis = crud.analysis.get_analysis_by_interview(db, interview_id=interview_id)
+    if analysis:
+        return _analysis_to_dict(analysis, interview.resume_id)
+
+    report_request = _build_interview_report_request(db, interview)
+    api_key, claude_model = _get_claude_settings()
+
+    # --- AI Feedback Generation ---
+    import httpx  # 첫 호출 시 로드 (앱 import 시간 단축)
+
     headers = {
         "x-api-key": api_key,
         "anthropic-version": "2023-06-01",
@@ -402,9 +366,15 @@ async def get_interview_results(
     payload = {
         "model": claude_model,
         "max_tokens": 4096,
-        "messages": [{"role": "user", "content": prompt}]
+        "system": cached_system_blocks(INTERVIEW_ANALYSIS_SYSTEM_PROMPT),
+        "messages": [{"role": "user", "content": report_request["user_prompt"]}]
     }
 
+    cache_key = llm_cache_key("anthropic", claude_model, report_request["prompt"], {"max_tokens": 4096})
+    cached_feedback = llm_response_cache.lookup(db, cache_key, "anthropic")
+    if cached_feedback is not None:
+        return _save_interview_analysis(db, interview, cached_feedback, report_request["metrics"])
+
     try:
         print(f"Calling Claude API for interview {interview_id}...")
         async with httpx.AsyncClient() as client:
@@ -418,47 +388,15 @@ async def get_interview_results(
             response.raise_for_status()
 
             response_data = response.json()
+            log_prompt_cache_usage(f"interview-report {interview_id}", response_data.get("usage", {}))
             feedback_text = response_data['content'][0]['text']
             print(f"Successfully received feedback ({len(feedback_text)} characters)")
 
-        analysis_create = AnalysisCreate(
-            interview_id=interview_id,
-            feedback_text=feedback_text,
-            speech_rate=avg_speech_rate,
-            silence_ratio=avg_silence_ratio,
-            gaze_stability=gaze_stability,
-            expression_stability=expression_stability,
-            posture_stability=posture_stability
-        )
-
-        try:
-            new_analysis = crud.analysis.create_analysis(db=db, obj_in=analysis_create)
-            # Add resume_id for re-interview functionality
-            new_analysis_dict = {
-                "analysis_id": new_analysis.analysis_id,
-                "interview_id": new_analysis.interview_id,
-                "resume_id": interview.resume_id,
-                "feedback_text": new_analysis.feedback_text,
-                "speech_rate": new_analysis.speech_rate,
-                "silence_ratio": new_analysis.silence_ratio,
-                "gaze_stability": new_analysis.gaze_stability,
-                "expression_stability": new_analysis.expression_stability,
-                "posture_stability": new_analysis.posture_stability,
-                "created_at": new_analysis.created_at
-            }
-            return new_analysis_dict
-        except IntegrityError:
-            # Another request already created the analysis (race condition)
-            # Rollback and fetch the existing analysis
-            db.rollback()
-            print(f"Analysis for interview {interview_id} already exists (race condition detected). Fetching existing analysis.")
-            existing_analysis = crud.analysis.get_analysis_by_interview(db, interview_id=interview_id)
-            if existing_analysis:
-                return existing_analysis
-            else:
-                # This should rarely happen
-                raise HTTPException(status_code=500, detail="Failed to create or retrieve analysis")
+        llm_response_cache.store(db, cache_key, "anthropic", claude_model, feedback_text)
+        return _save_interview_analysis(db, interview, feedback_text, report_request["metrics"])
 
+    except HTTPException:
+        raise
     except httpx.HTTPStatusError as e:
         error_message = f"Claude API request failed with status {e.response.status_code} and response: {e.response.text}"
         print(error_message)
@@ -469,6 +407,110 @@ async def get_interview_results(
         raise HTTPException(status_code=500, detail=error_message)
 
 
+@router.get("/{interview_id}/results/stream")
+async def stream_interview_results(
+    interview_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> StreamingResponse:
+    """
+    Streaming variant of the results endpoint (Server-Sent Events).
+
+    Emits `delta` events ({"text": ...}) while the report is generated and a final
+    `done` event with the saved Analysis once the stream completes. An existing
+    report is replayed as a single delta followed by `done`.
+    """
+    interview = crud.interview.get_interview(db, interview_id=interview_id)
+    if not interview or interview.user_id != current_user.user_id:
+        raise HTTPException(status_code=404, detail="Interview not found or access denied")
+
+    analysis = crud.analysis.get_analysis_by_interview(db, interview_id=interview_id)
+    if analysis:
+        existing = _analysis_to_dict(analysis, interview.resume_id)
+
+        async def replay():
+            yield sse_event("delta", {"text": existing["feedback_text"]})
+            yield sse_event("done", existing)
+
+        return StreamingResponse(replay(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+    report_request = _build_interview_report_request(db, interview)
+    api_key, claude_model = _get_claude_settings()
+    cache_key = llm_cache_key("anthropic", claude_model, report_request["prompt"], {"max_tokens": 4096})
+
+    cached_feedback = llm_response_cache.lookup(db, cache_key, "anthropic")
+    if cached_feedback is not None:
+        saved = _save_interview_analysis(db, interview, cached_feedback, report_request["metrics"])
+
+        async def replay_cached():
+            yield sse_event("delta", {"text": saved["feedback_text"]})
+            yield sse_event("done", saved)
+
+        return StreamingResponse(replay_cached(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+    async def save_report(feedback_text: str) -> Dict[str, Any]:
+        print(f"Streamed feedback for interview {interview_id} completed ({len(feedback_text)} characters)")
+        # 스트림이 끝나는 시점에는 요청 세션이 이미 닫혔을 수 있으므로 별도 세션을 사용
+        session = SessionLocal()
+        try:
+            llm_response_cache.store(session, cache_key, "anthropic", claude_model, feedback_text)
+            db_interview = crud.interview.get_interview(session, interview_id=interview_id)
+            if db_interview is None:
+                # 스트리밍 중에 면접이 삭제됨: 결과는 클라이언트에 전달됐으므로 저장만 생략
+                print(f"Interview {interview_id} was deleted while streaming the report; not saving it.")
+                return {"interview_id": interview_id, "feedback_text": feedback_text, "saved": False}
+            return _save_interview_analysis(session, db_interview, feedback_text, report_request["metrics"])
+        finally:
+            session.close()
+
+    print(f"Streaming Claude API response for interview {interview_id}...")
+    chunks = stream_claude_text(
+        report_request["user_prompt"],
+        api_key=api_key,
+        model=claude_model,
+        max_tokens=4096,
+        system=INTERVIEW_ANALYSIS_SYSTEM_PROMPT,
+        label=f"interview-report-stream {interview_id}",
+    )
+    return StreamingResponse(
+        stream_and_persist(chunks, save_report), media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
+def _session_state(status: str, question_number: Optional[int] = None) -> Dict[str, Any]:
+    return {
+        "status": status,
+        "question_number": question_number,
+        "node": NODE_NAME,
+        "updated_at": time.time(),
+    }
+
+
+async def _close_superseded(websocket: WebSocket, interview_id: int) -> None:
+    print(f"Interview {interview_id}: session taken over by a newer connection; closing this one.")
+    try:
+        await websocket.send_json({"type": "system", "message": "Session continued on another connection.", "status": "superseded"})
+    except Exception:
+        pass
+
+
+@router.get("/{interview_id}/session")
+async def read_interview_session(
+    interview_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """Live WebSocket session state of an interview (shared across workers with SESSION_STORE_BACKEND=redis)."""
+    interview = await run_in_threadpool(crud.interview.get_interview, db, interview_id=interview_id)
+    if not interview or interview.user_id != current_user.user_id:
+        raise HTTPException(status_code=404, detail="Interview not found or access denied")
+    state = await get_session_store().get(interview_id)
+    if not state:
+        return {"active": False}
+    state.pop("owner", None)
+    return {"active": True, **state}
+
+
 @router.websocket("/ws/{interview_id}")
 async def websocket_interview(
     websocket: WebSocket,
@@ -476,10 +518,16 @@ async def websocket_interview(
     token: str,
 ):
     db: Session = SessionLocal()
+    interview_completed = False
+    admitted = False
+    next_audio = None
+    session_store = get_session_store()
+    connection_id = uuid.uuid4().hex
     try:
         # Authenticate user BEFORE accepting the WebSocket connection
+        # (서명된 토큰 클레임만 검증; 소유권은 아래 interview 조회로 확인)
         try:
-            user = deps.get_user_from_token(db=db, token=token)
+            user = deps.get_principal_from_token(token)
         except HTTPException as e:
             print(f"WebSocket authentication failed for interview {interview_id}: {e.detail}")
             await websocket.close(code=1008, reason=f"Authentication failed: {e.detail}")
@@ -494,192 +542,203 @@ async def websocket_interview(
         # Accept connection only after successful authentication and authorization
         await websocket.accept()
 
+        # 동시 세션 수 제한: 여유가 없으면 FIFO 대기열에서 순번을 안내하며 대기
+        async def send_queue_position(position: int, queue_length: int):
+            await websocket.send_json({
+                "type": "queue",
+                "status": "waiting",
+                "position": position,
+                "queue_length": queue_length,
+                "message": f"Waiting for an interview slot. You are number {position} in line.",
+            })
+
+        db.close()  # 대기하는 동안 DB 연결을 풀에 반납 (세션은 이후 다시 연결됨)
+        try:
+            waited = await interview_admission.acquire(connection_id, on_position=send_queue_position)
+        except AdmissionRejected as e:
+            print(f"Interview {interview_id} not admitted: {e}")
+            await websocket.send_json({"type": "error", "message": f"Server is busy, please try again later. ({e})"})
+            await websocket.close(code=1013)
+            return
+        admitted = True
+        if waited > 0:
+            print(f"Interview {interview_id} admitted after waiting {waited:.1f}s")
+            await websocket.send_json({"type": "system", "status": "admitted", "message": "Your interview is starting.", "waited_seconds": round(waited, 1)})
+
+        # 가장 최근 연결이 세션을 넘겨받음 (다른 워커/노드에 남은 이전 연결은 다음 단계에서 종료)
+        previous_owner = await session_store.claim(interview_id, connection_id, _session_state("connected"))
+        if previous_owner:
+            print(f"Interview {interview_id}: connection {connection_id} took over from {previous_owner}")
+
         questions = crud.interview.get_questions_by_interview(db, interview_id=interview_id)
         if not questions:
             await websocket.send_json({"type": "error", "message": "Interview questions not found."})
             await websocket.close(code=1008)
             return
 
-        await websocket.send_json({"type": "system", "message": f"Interview session started. {len(questions)} questions will be asked.", "status": "connected"})
+        # 재연결 시 이미 답변이 저장된 질문은 건너뛰고 첫 미답변 질문부터 이어서 진행
+        answered_ids = crud.interview.get_answered_question_ids(db, interview_id=interview_id)
+        pending = [(index, q) for index, q in enumerate(questions) if q.question_id not in answered_ids]
+        if answered_ids:
+            print(f"Resuming interview {interview_id}: {len(answered_ids)} answered, {len(pending)} remaining")
+            await websocket.send_json({
+                "type": "system",
+                "message": f"Interview session resumed. {len(pending)} of {len(questions)} questions remaining.",
+                "status": "connected",
+                "resumed": True,
+                "answered_questions": len(questions) - len(pending),
+            })
+        else:
+            await websocket.send_json({"type": "system", "message": f"Interview session started. {len(questions)} questions will be asked.", "status": "connected"})
+
+        audio_storage = get_audio_storage()
+        loop = asyncio.get_running_loop()
+
+        def fetch_question_audio(question):
+            # 사전 생성된 음성이 있으면 캐시에서 바로 읽고, 없으면 합성 (이벤트 루프 차단 방지)
+            return loop.run_in_executor(None, get_question_audio, question.question_text)
 
-        # 생성된 오디오 파일 경로를 추적 (에러 발생 시 정리용)
-        created_audio_files = []
+        next_audio = fetch_question_audio(pending[0][1]) if pending else None
 
-        for index, question in enumerate(questions):
+        for position, (index, question) in enumerate(pending):
+            if not await session_store.update(interview_id, connection_id, _session_state("asking", index + 1)):
+                await _close_superseded(websocket, interview_id)
+                return
             await websocket.send_json({"type": "question", "text": question.question_text, "question_number": index + 1, "total_questions": len(questions)})
             
             try:
-                tts_model_name = os.getenv("TTS_MODEL_NAME", "gemini-2.5-flash-tts")
-                tts_voice_name = os.getenv("TTS_VOICE_NAME", "Charon")  # Gemini TTS voice
-
-                # TTS용 텍스트 정제 (이모티콘, 태그 제거)
-                cleaned_text = clean_text_for_tts(question.question_text)
-                print(f"Original question: {question.question_text}")
-                print(f"Cleaned for TTS: {cleaned_text}")
-
-                tts_client = tts.TextToSpeechClient()
-
-                # Gemini TTS 모델 체크
-                is_gemini_tts = "gemini" in tts_model_name.lower()
-
-                # synthesis_input 생성
-                if is_gemini_tts:
-                    # Gemini TTS: prompt 사용 시도
-                    try:
-                        style_prompt = os.getenv(
-                            "TTS_STYLE_PROMPT",
-                            "당신은 경험이 풍부한 전문 면접관입니다. 친절하면서도 전문적인 톤으로, "
-                            "명확하고 또렷하게 질문을 전달합니다. 아주 살짝 빠른 속도로 말하며, "
-                            "지원자가 편안하게 답변할 수 있도록 격려적인 분위기를 조성합니다."
-                        )
-                        synthesis_input = tts.SynthesisInput(
-                            text=cleaned_text,
-                            prompt=style_prompt
-                        )
-                        print(f"Attempting Gemini TTS with style prompt")
-                    except:
-                        # Fallback: prompt 없이
-                        synthesis_input = tts.SynthesisInput(text=cleaned_text)
-                        print(f"Gemini TTS fallback: using text only")
-                else:
-                    # Standard TTS: text만 사용
-                    synthesis_input = tts.SynthesisInput(text=cleaned_text)
-                    print(f"Using Standard TTS")
-
-                # Voice 설정
-                if is_gemini_tts:
-                    # Gemini TTS 음성은 model_name 필수
-                    voice = tts.VoiceSelectionParams(
-                        language_code="ko-KR",
-                        name=tts_voice_name,
-                        model_name=tts_model_name
-                    )
-                else:
-                    # Standard TTS는 model_name 불필요
-                    voice = tts.VoiceSelectionParams(
-                        language_code="ko-KR",
-                        name=tts_voice_name
-                    )
-
-                audio_config = tts.AudioConfig(
-                    audio_encoding=tts.AudioEncoding.MP3
-                )
-
-                response = tts_client.synthesize_speech(
-                    input=synthesis_input,
-                    voice=voice,
-                    audio_config=audio_config
-                )
-
-                await websocket.send_bytes(response.audio_content)
-                print(f"TTS audio sent successfully using {tts_model_name} with voice {tts_voice_name}")
+                audio_content = await next_audio
+                await websocket.send_bytes(audio_content)
+                print(f"TTS audio sent for question {index + 1}")
             except Exception as tts_error:
                 print(f"TTS Error: {tts_error}")
                 print(f"TTS Error details: {type(tts_error).__name__}: {str(tts_error)}")
                 await websocket.send_json({"type": "error", "message": "Could not generate audio for the question."})
 
+            # 답변을 기다리는 동안 다음 질문 음성을 미리 준비 (연결이 끊겨도 디스크 캐시에 남음)
+            next_audio = fetch_question_audio(pending[position + 1][1]) if position + 1 < len(pending) else None
+
             print("Waiting to receive audio data as base64 text...")
             base64_audio_data = await websocket.receive_text()
             print("Base64 text received. Decoding...")
             audio_bytes = base64.b64decode(base64_audio_data)
+            if not await session_store.update(interview_id, connection_id, _session_state("processing", index + 1)):
+                # 새 연결이 같은 질문을 다시 묻고 있으므로 이 답변은 저장하지 않음
+                await _close_superseded(websocket, interview_id)
+                return
             print(f"Decoded {len(audio_bytes)} bytes. Proceeding to conversion and transcription.")
 
-            audio_dir = "audio_files"
-            os.makedirs(audio_dir, exist_ok=True)
-
-            audio_filename = f"{uuid.uuid4()}.wav"
-            audio_path = os.path.join(audio_dir, audio_filename)
+            # 분석(Whisper/특징 추출)은 로컬 스테이징 WAV로 하고, 답변 저장 후 보관 코덱으로 변환해 저장
+            audio_key = audio_archiver.new_key()
+            staging_path = audio_storage.staging_path(".wav")
             audio_file_created = False
             result = None  # Initialize to avoid NameError
+            audio_features = None
+            features_task = None
 
             try:
                 # Load audio from bytes and export as WAV
-                audio_segment = AudioSegment.from_file(io.BytesIO(audio_bytes))
-                audio_segment.export(audio_path, format="wav")
+                audio_segment = get_audio_segment_class().from_file(io.BytesIO(audio_bytes))
+                audio_segment.export(staging_path, format="wav")
                 audio_file_created = True
-                created_audio_files.append(audio_path)  # 추적 리스트에 추가
-                print(f"Successfully converted and saved audio to {audio_path}")
+                print(f"Successfully converted and staged audio at {staging_path}")
+
+                # 음성 특징 추출은 워커 프로세스에서 전사와 병렬로 진행
+                features_task = asyncio.ensure_future(extract_audio_features_async(staging_path))
 
-                # Use the cached Whisper model
-                model = get_whisper_model()
-                result = model.transcribe(audio_path, language="ko")
+                # 전사는 이 프로세스 또는 별도 음성 인식 워커에서 (TRANSCRIPTION_DISPATCH)
+                result = await get_transcription_dispatcher().transcribe(
+                    audio_path=staging_path, source_bytes=audio_bytes, language="ko"
+                )
                 print(f"Whisper transcription result: {result}")
                 answer_text = result.get("text", "")
             except Exception as e:
                 print(f"Error during audio processing or transcription: {e}")
                 answer_text = ""
-                # 에러 발생 시 생성된 파일 즉시 삭제
-                if audio_file_created and os.path.exists(audio_path):
-                    try:
-                        os.remove(audio_path)
-                        created_audio_files.remove(audio_path)
-                        print(f"Cleaned up audio file after error: {audio_path}")
-                    except Exception as cleanup_error:
-                        print(f"Failed to cleanup audio file {audio_path}: {cleanup_error}")
+                # 특징 추출이 파일을 읽는 중일 수 있으므로 삭제 전에 종료를 기다림
+                if features_task is not None:
+                    await asyncio.gather(features_task, return_exceptions=True)
+                    features_task = None
+                # 에러 발생 시 스테이징 파일 즉시 삭제
+                audio_file_created = False
+
+            if features_task is not None:
+                try:
+                    audio_features = await features_task
+                except Exception as feature_error:
+                    # 특징 추출 실패는 답변 저장을 막지 않음
+                    print(f"Audio feature extraction failed for {staging_path}: {feature_error}")
+
+            if not await session_store.update(interview_id, connection_id, _session_state("processing", index + 1)):
+                # 처리 중에 새 연결이 세션을 넘겨받음: 중복 답변이 생기지 않도록 저장하지 않음
+                audio_storage.discard_staging(staging_path)
+                await _close_superseded(websocket, interview_id)
+                return
 
             # DB 저장
             try:
+                # 리포트 생성 시 재계산하지 않도록 음성 지표를 저장 시점에 한 번만 계산
+                audio_metrics = summarize_whisper_result(result)
+                # 행에는 분석용 필드만, 전체 결과는 압축해 지연 로딩 컬럼에 보관
+                stored_result, result_detail = prepare_whisper_result_for_storage(result)
                 answer_create = AnswerCreate(
                     question_id=question.question_id,
                     answer_text=answer_text,
-                    audio_path=audio_path if audio_file_created else None,
-                    whisper_result=result  # Save the full result (None if error occurred)
+                    audio_path=audio_key if audio_file_created else None,  # 저장소 키
+                    whisper_result=stored_result,  # None if error occurred
+                    whisper_result_detail=result_detail,
+                    audio_features=audio_features,
+                    **audio_metrics
                 )
-                crud.interview.create_answer(db=db, obj_in=answer_create)
+                answer = crud.interview.create_answer(db=db, obj_in=answer_create)
             except Exception as db_error:
                 print(f"Error saving answer to database: {db_error}")
-                # DB 저장 실패 시 오디오 파일 정리
-                if audio_file_created and os.path.exists(audio_path):
-                    try:
-                        os.remove(audio_path)
-                        if audio_path in created_audio_files:
-                            created_audio_files.remove(audio_path)
-                        print(f"Cleaned up audio file after DB error: {audio_path}")
-                    except Exception as cleanup_error:
-                        print(f"Failed to cleanup audio file {audio_path}: {cleanup_error}")
+                # DB 저장 실패 시 스테이징 음성 정리
+                audio_storage.discard_staging(staging_path)
                 raise  # Re-raise to trigger WebSocket error handling
+
+            if audio_file_created:
+                # 압축 변환과 저장은 백그라운드에서 (WAV는 답변 ID 이름으로 보관 대기, 완료 후 삭제)
+                audio_archiver.submit(staging_path, audio_key, answer.answer_id)
+            else:
+                audio_storage.discard_staging(staging_path)
             
             await websocket.send_json({"type": "system", "message": f"Answer for question {index + 1} received.", "status": "processing"})
 
+        interview_completed = True
         await websocket.send_json({"type": "system", "message": "Interview finished. Thank you.", "status": "finished"})
 
     except WebSocketDisconnect:
-        print(f"Client for interview {interview_id} disconnected.")
-        # 연결 중단 시 추적 중인 파일들 즉시 정리
-        if 'created_audio_files' in locals():
-            for audio_file in created_audio_files:
-                try:
-                    if os.path.exists(audio_file):
-                        os.remove(audio_file)
-                        print(f"Cleaned up audio file after disconnect: {audio_file}")
-                except Exception as cleanup_error:
-                    print(f"Failed to cleanup audio file {audio_file}: {cleanup_error}")
+        # 저장된 답변과 음성은 유지 (재연결 시 이어서 진행, 음성은 최대 보관 시간 후 정리)
+        print(f"Client for interview {interview_id} disconnected. Answers so far are kept for resume.")
     except Exception as e:
         print(f"Unexpected error in WebSocket for interview {interview_id}: {e}")
         try:
             await websocket.send_json({"type": "error", "message": str(e)})
         except:
             pass  # WebSocket might be closed already
-        # 에러 발생 시에도 추적 중인 파일들 즉시 정리
-        if 'created_audio_files' in locals():
-            for audio_file in created_audio_files:
-                try:
-                    if os.path.exists(audio_file):
-                        os.remove(audio_file)
-                        print(f"Cleaned up audio file after error: {audio_file}")
-                except Exception as cleanup_error:
-                    print(f"Failed to cleanup audio file {audio_file}: {cleanup_error}")
     finally:
-        # 정상 종료된 경우에만 5분 후 자동 삭제 예약
-        # (중단/에러 시에는 이미 위에서 정리됨)
-        interview_completed = 'created_audio_files' in locals() and len(created_audio_files) > 0
-
+        if admitted:
+            await interview_admission.release(connection_id)
+        if next_audio is not None:
+            # 미리 요청한 음성 합성은 계속 진행되어 캐시에 저장됨; 예외만 소비
+            next_audio.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        # 모든 질문에 답한 경우 AUDIO_RETENTION_MINUTES 후 삭제되도록 DB에 만료 시각 기록
+        # (주기적 정리 작업이 삭제; 중단된 세션은 답변 저장 시 기록한 최대 보관 시각까지 유지)
         if interview_completed:
-            asyncio.create_task(cleanup_audio_files_after_delay(interview_id, delay_minutes=5))
-            print(f"Interview {interview_id} completed. Scheduled audio cleanup in 5 minutes")
+            try:
+                expires_at = datetime.utcnow() + timedelta(minutes=AUDIO_RETENTION_MINUTES)
+                crud.interview.set_audio_expiry(db, interview_id=interview_id, expires_at=expires_at)
+                print(f"Interview {interview_id} completed. Audio files expire at {expires_at} UTC")
+            except Exception as expiry_error:
+                # 실패해도 답변 저장 시 기록한 최대 보관 시각에 삭제됨
+                db.rollback()
+                print(f"Failed to schedule audio expiry for interview {interview_id}: {expiry_error}")
         else:
-            print(f"Interview {interview_id} did not complete normally. Files already cleaned up if any.")
+            print(f"Interview {interview_id} did not complete. Saved answers are kept for resume.")
 
+        await session_store.release(interview_id, connection_id)
         db.close()
         try:
             await websocket.close()
@@ -692,7 +751,7 @@ def handle_video_analysis(
     interview_id: int,
     request_data: VideoAnalysisRequest,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ):
     """
     Receive video landmark data, analyze it, and save the results to the
@@ -1,17 +1,26 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app import crud
-from app.core.security import verify_password, create_access_token
+from app.core.password_hashing import password_hasher
+from app.core.security import create_access_token
 from app.api import deps
 
 router = APIRouter()
 
 @router.post("/token")
-def login_for_access_token(db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()):
-    user = crud.crud_user.get_by_email(db, email=form_data.username)
-    if not user or not verify_password(form_data.password, user.password):
+async def login_for_access_token(db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()):
+    # DB 조회는 스레드풀, bcrypt 검증은 전용 해싱 풀에서 실행 (이벤트 루프/스레드풀 점유 방지)
+    user = await run_in_threadpool(crud.crud_user.get_by_email, db, email=form_data.username)
+    valid = False
+    if user:
+        valid, new_hash = await password_hasher.verify_and_update(form_data.password, user.password)
+        if valid and new_hash:
+            # BCRYPT_ROUNDS가 바뀐 경우 현재 비용으로 재해싱한 값을 저장
+            await run_in_threadpool(crud.crud_user.update_password_hash, db, user_id=user.user_id, hashed_password=new_hash)
+    if not valid:
         raise HTTPException(
             status_code=401,
             detail="Incorrect email or password",
@@ -19,3 +28,10 @@ def login_for_access_token(db: Session = Depends(deps.get_db), form_data: OAuth2
         )
     access_token = create_access_token(subject=user.user_id)
     return {"access_token": access_token, "token_type": "bearer"}
+
+@router.get("/hash-stats")
+def read_password_hash_stats(
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+):
+    """Timing and admission statistics of the password hashing pool (this process)."""
+    return password_hasher.get_stats()
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from typing import List
 from sqlalchemy.orm import Session
 
-from app import crud, models
+from app import crud
 from app.api import deps
 from app.schemas.passed_resume import PassedResume, PassedResumeCreate, SimilarResume
 
@@ -14,7 +14,7 @@ def create_passed_resume(
     db: Session = Depends(deps.get_db),
     passed_resume_in: PassedResumeCreate,
     # This should be a superuser-only endpoint in a real app
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> PassedResume:
     """
     Create a new passed resume. (For admin/data-loading purposes)
@@ -25,23 +25,23 @@ def create_passed_resume(
 def find_similar_passed_resumes(
     resume_id: int,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> List[SimilarResume]:
     """
     Find passed resumes similar to a user's resume.
     """
-    user_resume = crud.resume.get(db, resume_id=resume_id)
-    if not user_resume or user_resume.user_id != current_user.user_id:
+    if crud.resume.get_owner_id(db, resume_id=resume_id) != current_user.user_id:
         raise HTTPException(status_code=404, detail="Resume not found or access denied")
 
-    if not user_resume.content:
+    resume_content = crud.resume.get_content(db, resume_id=resume_id)
+    if not resume_content:
         raise HTTPException(status_code=400, detail="Resume content is empty")
 
-    similar_resumes = crud.passed_resume.find_similar_resumes(db, resume_content=user_resume.content)
+    similar_resumes = crud.passed_resume.find_similar_resumes(db, resume_content=resume_content)
     
     # Calculate similarity scores and format the response
     results = []
-    user_embedding = crud.passed_resume.model.encode(user_resume.content)
+    user_embedding = crud.passed_resume.get_embedding_model().encode(resume_content)
     for sr in similar_resumes:
         # Cosine similarity is 1 - (L2 distance)^2 / 2 for normalized vectors
         l2_dist = sr.embedding.l2_distance(user_embedding)
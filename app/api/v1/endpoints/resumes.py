@@ -1,41 +1,100 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from typing import List, Any
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form
+from fastapi.responses import StreamingResponse
+from typing import List, Any, Optional
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 import os
-import io
-import json
-import re
-import docx
-from PyPDF2 import PdfReader
-from hanspell import spell_checker
-import anthropic
-import google.generativeai as genai
 from dotenv import load_dotenv
 
 from app import crud, models
 from app.api import deps
-from app.schemas.resume import Resume, ResumeCreate, ResumeUpdate, ResumeDetail
+from app.db.session import SessionLocal
+from app.schemas.resume import Resume, ResumeCreate, ResumeUpdate, ResumeDetail, ResumeSummary
 from app.schemas.generated_question import GeneratedQuestionCreate
-from app.prompts import get_resume_feedback_prompt, get_question_generation_prompt
+from app.prompts import (
+    RESUME_FEEDBACK_SYSTEM_PROMPT,
+    get_resume_feedback_prompt,
+    get_resume_feedback_user_prompt,
+)
+from app.utils.grammar_check import grammar_check_engine
+from app.utils.resume_parser import spool_upload, parse_spooled_upload
+from app.utils.spell_check_cache import spell_check_cache
+from app.utils.content_hash import content_sha256
+from app.utils.llm_cache import llm_cache_key, llm_response_cache
+from app.utils.llm_clients import get_anthropic_client
+from app.utils.question_generation import generate_question_texts
+from app.utils.question_pregeneration import pregenerate_interview_assets
+from app.utils.structured_output import StructuredOutputError
+from app.utils.prompt_cache import cached_system_blocks, log_prompt_cache_usage
+from app.utils.llm_stream import SSE_HEADERS, sse_event, stream_claude_text, stream_and_persist
 
 load_dotenv()
 
 router = APIRouter()
 
-# --- Helper Functions (File Parsers) ---
-def _parse_docx(file_content: bytes) -> str:
-    try:
-        document = docx.Document(io.BytesIO(file_content))
-        return "\n".join([para.text for para in document.paragraphs])
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error parsing DOCX file: {e}")
+# --- Helper Functions (Duplicate Detection) ---
+def _analysis_score(resume: models.Resume):
+    return (bool(resume.corrected_content), bool(resume.ai_feedback), len(resume.generated_questions))
+
+def _find_duplicate(db: Session, resume: models.Resume, predicate) -> Optional[models.Resume]:
+    """Another resume of the same user with identical normalized text that satisfies predicate."""
+    if not resume.content_sha256:
+        return None
+    candidates = crud.crud_resume.get_by_content_hash(
+        db, user_id=resume.user_id, content_sha256=resume.content_sha256, exclude_resume_id=resume.resume_id
+    )
+    return next((other for other in candidates if predicate(other)), None)
+
+# --- Helper Functions (AI Feedback) ---
+def _feedback_response(resume: models.Resume, feedback_text: str) -> dict:
+    return {
+        "resume_id": resume.resume_id,
+        "title": resume.title,
+        "content": resume.content,
+        "corrected_content": resume.corrected_content,
+        "ai_feedback": feedback_text,
+        "generated_questions": [
+            {"question_id": q.question_id, "resume_id": q.resume_id, "question_text": q.question_text}
+            for q in resume.generated_questions
+        ]
+    }
+
+def _prepare_feedback(db: Session, resume_id: int, current_user: deps.Principal):
+    """
+    Loads the resume and resolves feedback that needs no Claude call.
 
-def _parse_pdf(file_content: bytes) -> str:
-    try:
-        reader = PdfReader(io.BytesIO(file_content))
-        return "\n".join([page.extract_text() for page in reader.pages])
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error parsing PDF file: {e}")
+    Returns (resume, existing_feedback). existing_feedback is set when the resume
+    already has feedback or an identical sibling resume's feedback was reused.
+    """
+    resume = crud.crud_resume.get(db=db, resume_id=resume_id)
+    if not resume or resume.user_id != current_user.user_id:
+        raise HTTPException(status_code=404, detail="Resume not found or access denied")
+
+    if resume.ai_feedback:
+        return resume, resume.ai_feedback
+
+    corrected_content = resume.corrected_content
+    if not corrected_content:
+        raise HTTPException(status_code=400, detail="Corrected content not found. Please run grammar check first.")
+
+    duplicate = _find_duplicate(
+        db, resume, lambda other: bool(other.ai_feedback) and other.corrected_content == corrected_content
+    )
+    if duplicate:
+        print(f"Reusing AI feedback of identical resume {duplicate.resume_id}.")
+        resume = crud.crud_resume.update(db=db, db_obj=resume, obj_in={"ai_feedback": duplicate.ai_feedback})
+        return resume, resume.ai_feedback
+
+    return resume, None
+
+def _claude_settings():
+    api_key = os.getenv("CLAUDE_API_KEY")
+    if not api_key:
+        raise HTTPException(status_code=500, detail="CLAUDE_API_KEY not set.")
+    claude_model = os.getenv("CLAUDE_MODEL")
+    if not claude_model:
+        raise HTTPException(status_code=500, detail="CLAUDE_MODEL environment variable not set.")
+    return api_key, claude_model
 
 # --- Resume CRUD Endpoints ---
 
@@ -44,42 +103,85 @@ def read_resumes(
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """Retrieve resumes for the current user."""
     resumes = crud.crud_resume.get_multi_by_owner(db, owner_id=current_user.user_id, skip=skip, limit=limit)
     return resumes
 
+@router.get("/summary", response_model=List[ResumeSummary])
+def read_resume_summaries(
+    db: Session = Depends(deps.get_db),
+    skip: int = 0,
+    limit: int = 100,
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """Retrieve resume metadata (no content/feedback/questions) for the current user."""
+    return crud.crud_resume.get_multi_by_owner(
+        db, owner_id=current_user.user_id, skip=skip, limit=limit, summary=True
+    )
+
 @router.post("/", response_model=Resume)
 async def create_resume(
     *,
     db: Session = Depends(deps.get_db),
     title: str = Form(...),
     file: UploadFile = File(...),
-    current_user: models.User = Depends(deps.get_current_user),
+    reuse_analysis: bool = Form(True),
+    background_tasks: BackgroundTasks,
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
-    """Create new resume from an uploaded file for the current user."""
-    file_content = await file.read()
-    content = ""
-    if file.content_type == "application/pdf":
-        content = _parse_pdf(file_content)
-    elif file.content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        content = _parse_docx(file_content)
-    else:
-        raise HTTPException(status_code=400, detail="Unsupported file type.")
-    
+    """
+    Create new resume from an uploaded file for the current user.
+    If the same user already uploaded identical content, parsing is skipped and
+    (with reuse_analysis) the existing corrected content, feedback and questions are copied.
+    """
+    # 임시 파일로 스트리밍 저장(크기 제한, SHA-256 계산)
+    upload = await spool_upload(file)
+    try:
+        duplicate = crud.crud_resume.get_by_file_hash(
+            db, user_id=current_user.user_id, file_sha256=upload.sha256
+        )
+        if duplicate and duplicate.content:
+            print(f"Upload is identical to resume {duplicate.resume_id}; reusing parsed text.")
+            content = duplicate.content
+        else:
+            # 워커 프로세스에서 페이지 단위로 파싱
+            parsed = await parse_spooled_upload(upload)
+            content = parsed.text
+    finally:
+        upload.cleanup()
+
     if not content:
         raise HTTPException(status_code=400, detail="Could not extract text from file.")
 
+    source = None
+    if reuse_analysis:
+        # 파일이 달라도 추출 텍스트가 같으면 분석 결과를 재사용 (가장 많이 분석된 것 우선)
+        candidates = crud.crud_resume.get_by_content_hash(
+            db, user_id=current_user.user_id, content_sha256=content_sha256(content)
+        )
+        if candidates:
+            source = max(candidates, key=_analysis_score)
+            print(f"Reusing analysis results of resume {source.resume_id} for duplicate upload.")
+
     resume_in = ResumeCreate(title=title, content=content)
-    resume = crud.crud_resume.create(db=db, obj_in=resume_in, user_id=current_user.user_id)
+    try:
+        resume = crud.crud_resume.create(
+            db=db, obj_in=resume_in, user_id=current_user.user_id, file_sha256=upload.sha256, source=source
+        )
+    except IntegrityError:
+        deps.raise_if_user_deleted(db, current_user.user_id)
+        raise
+    # 면접 시작 전에 질문과 TTS 음성을 미리 준비 (응답 전송 후 실행)
+    background_tasks.add_task(pregenerate_interview_assets, resume.resume_id)
     return resume
 
 @router.get("/{resume_id}", response_model=ResumeDetail)
 def read_resume_detail(
     resume_id: int,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """Get a resume with all its details including feedback and questions."""
     resume = crud.crud_resume.get(db=db, resume_id=resume_id)
@@ -93,13 +195,18 @@ def update_resume(
     *,
     db: Session = Depends(deps.get_db),
     resume_in: ResumeUpdate,
-    current_user: models.User = Depends(deps.get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """Update a resume. User can only update their own resume."""
-    resume = crud.crud_resume.get(db=db, resume_id=resume_id)
+    resume = crud.crud_resume.get_summary(db=db, resume_id=resume_id)
     if not resume or resume.user_id != current_user.user_id:
         raise HTTPException(status_code=404, detail="Resume not found or access denied")
+    previous_content_hash = resume.content_sha256
     resume = crud.crud_resume.update(db=db, db_obj=resume, obj_in=resume_in)
+    if resume.content_sha256 != previous_content_hash:
+        # 내용이 바뀌면 기존 질문은 맞지 않으므로 백그라운드에서 다시 생성
+        background_tasks.add_task(pregenerate_interview_assets, resume.resume_id, regenerate=True)
     return resume
 
 @router.delete("/{resume_id}", response_model=Resume)
@@ -107,11 +214,10 @@ def delete_resume(
     resume_id: int,
     *,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """Delete a resume. User can only delete their own resume."""
-    resume = crud.crud_resume.get(db=db, resume_id=resume_id)
-    if not resume or resume.user_id != current_user.user_id:
+    if crud.crud_resume.get_owner_id(db=db, resume_id=resume_id) != current_user.user_id:
         raise HTTPException(status_code=404, detail="Resume not found or access denied")
     resume = crud.crud_resume.remove(db=db, resume_id=resume_id)
     return resume
@@ -122,7 +228,7 @@ def delete_resume(
 def check_resume_grammar(
     resume_id: int,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Check resume grammar and save the corrected content.
@@ -134,67 +240,79 @@ def check_resume_grammar(
     if resume.corrected_content:
         return resume
 
+    duplicate = _find_duplicate(db, resume, lambda other: bool(other.corrected_content))
+    if duplicate:
+        print(f"Reusing corrected content of identical resume {duplicate.resume_id}.")
+        return crud.crud_resume.update(db=db, db_obj=resume, obj_in={"corrected_content": duplicate.corrected_content})
+
     content = resume.content or ""
-    lines = content.split('\n')
-    corrected_lines = []
-    for line in lines:
-        if not line.strip():
-            corrected_lines.append(line)
-            continue
-        try:
-            result = spell_checker.check(line)
-            corrected_lines.append(result.checked)
-        except Exception:
-            corrected_lines.append(line)
-    corrected_content = '\n'.join(corrected_lines)
+    # 캐시에 없는 줄만 최대 크기 요청 단위로 묶어 병렬로 검사하고 원래 순서로 재조립
+    corrected_content = grammar_check_engine.check_text(content, db=db)
 
     update_data = {"corrected_content": corrected_content}
     updated_resume = crud.crud_resume.update(db=db, db_obj=resume, obj_in=update_data)
     return updated_resume
 
+@router.get("/grammar-check/cache-stats")
+def read_grammar_cache_stats(
+    db: Session = Depends(deps.get_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """Hit-rate statistics of the spell-check result cache (this process + persistent tier)."""
+    return {
+        "process": spell_check_cache.get_stats(),
+        "persistent": crud.spell_check_cache.get_totals(db),
+    }
+
+@router.get("/llm-cache/stats")
+def read_llm_cache_stats(
+    db: Session = Depends(deps.get_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> Any:
+    """Hit/miss statistics of the LLM response cache (this process + persistent tier)."""
+    return {
+        "process": llm_response_cache.get_stats(),
+        "persistent": crud.llm_response_cache.get_totals(db),
+    }
+
 @router.post("/{resume_id}/feedback")
 def get_ai_feedback(
     resume_id: int,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Get AI feedback on a resume. If feedback doesn't exist, generate and save it.
     """
-    resume = crud.crud_resume.get(db=db, resume_id=resume_id)
-    if not resume or resume.user_id != current_user.user_id:
-        raise HTTPException(status_code=404, detail="Resume not found or access denied")
-
-    if resume.ai_feedback:
+    resume, existing_feedback = _prepare_feedback(db, resume_id, current_user)
+    if existing_feedback:
         return resume
 
     corrected_content = resume.corrected_content
-    if not corrected_content:
-        raise HTTPException(status_code=400, detail="Corrected content not found. Please run grammar check first.")
-
-    api_key = os.getenv("CLAUDE_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="CLAUDE_API_KEY not set.")
-    claude_model = os.getenv("CLAUDE_MODEL")
-    if not claude_model:
-        raise HTTPException(status_code=500, detail="CLAUDE_MODEL environment variable not set.")
+    api_key, claude_model = _claude_settings()
 
     try:
-        # 개선된 프롬프트 모듈 사용
-        prompt = get_resume_feedback_prompt(corrected_content)
-
-        client = anthropic.Anthropic(api_key=api_key)
-        message = client.messages.create(
-            model=claude_model,
-            max_tokens=4096,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
-        )
-        feedback_text = message.content[0].text
+        # 고정 지시문은 캐시되는 system 블록으로, 자기소개서 내용만 사용자 메시지로 전달
+        user_prompt = get_resume_feedback_user_prompt(corrected_content)
+
+        cache_key = llm_cache_key("anthropic", claude_model, get_resume_feedback_prompt(corrected_content), {"max_tokens": 4096})
+        feedback_text = llm_response_cache.lookup(db, cache_key, "anthropic")
+        if feedback_text is None:
+            client = get_anthropic_client(api_key)
+            message = client.messages.create(
+                model=claude_model,
+                max_tokens=4096,
+                system=cached_system_blocks(RESUME_FEEDBACK_SYSTEM_PROMPT),
+                messages=[
+                    {
+                        "role": "user",
+                        "content": user_prompt
+                    }
+                ]
+            )
+            log_prompt_cache_usage(f"resume-feedback {resume_id}", message.usage)
+            feedback_text = message.content[0].text
+            llm_response_cache.store(db, cache_key, "anthropic", claude_model, feedback_text)
 
         # --- DEBUG: Claude API 응답을 파일에 저장 ---
         with open("claude_response.txt", "w", encoding="utf-8") as f:
@@ -206,28 +324,85 @@ def get_ai_feedback(
         crud.crud_resume.update(db=db, db_obj=resume, obj_in=update_data)
 
         # 2. 수동으로 JSON 응답을 구성하여 반환합니다.
-        response_data = {
-            "resume_id": resume.resume_id,
-            "title": resume.title,
-            "content": resume.content,
-            "corrected_content": resume.corrected_content,
-            "ai_feedback": feedback_text,  # Claude에서 받은 텍스트를 직접 사용
-            "generated_questions": [
-                {"question_id": q.question_id, "resume_id": q.resume_id, "question_text": q.question_text}
-                for q in resume.generated_questions
-            ]
-        }
-        return response_data
+        return _feedback_response(resume, feedback_text)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calling Claude API: {e}")
 
 
+@router.post("/{resume_id}/feedback/stream")
+def stream_ai_feedback(
+    resume_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
+) -> StreamingResponse:
+    """
+    Streaming variant of the feedback endpoint (Server-Sent Events).
+
+    Emits `delta` events ({"text": ...}) as Claude generates the feedback, then a
+    `done` event with the same payload as POST /{resume_id}/feedback once the
+    full text has been saved. Failures are reported as an `error` event.
+    """
+    resume, existing_feedback = _prepare_feedback(db, resume_id, current_user)
+
+    if existing_feedback:
+        cached_response = _feedback_response(resume, existing_feedback)
+
+        async def replay():
+            yield sse_event("delta", {"text": existing_feedback})
+            yield sse_event("done", cached_response)
+
+        return StreamingResponse(replay(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+    api_key, claude_model = _claude_settings()
+    cache_key = llm_cache_key(
+        "anthropic", claude_model, get_resume_feedback_prompt(resume.corrected_content), {"max_tokens": 4096}
+    )
+
+    cached_feedback = llm_response_cache.lookup(db, cache_key, "anthropic")
+    if cached_feedback is not None:
+        resume = crud.crud_resume.update(db=db, db_obj=resume, obj_in={"ai_feedback": cached_feedback})
+        cached_response = _feedback_response(resume, cached_feedback)
+
+        async def replay_cached():
+            yield sse_event("delta", {"text": cached_feedback})
+            yield sse_event("done", cached_response)
+
+        return StreamingResponse(replay_cached(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+    async def save_feedback(feedback_text: str) -> dict:
+        # 스트림이 끝나는 시점에는 요청 세션이 이미 닫혔을 수 있으므로 별도 세션을 사용
+        session = SessionLocal()
+        try:
+            llm_response_cache.store(session, cache_key, "anthropic", claude_model, feedback_text)
+            db_resume = crud.crud_resume.get(db=session, resume_id=resume_id)
+            if db_resume is None:
+                # 스트리밍 중에 이력서가 삭제됨: 결과는 클라이언트에 전달됐으므로 저장만 생략
+                print(f"Resume {resume_id} was deleted while streaming feedback; not saving it.")
+                return {"resume_id": resume_id, "ai_feedback": feedback_text, "saved": False}
+            db_resume = crud.crud_resume.update(db=session, db_obj=db_resume, obj_in={"ai_feedback": feedback_text})
+            return _feedback_response(db_resume, feedback_text)
+        finally:
+            session.close()
+
+    chunks = stream_claude_text(
+        get_resume_feedback_user_prompt(resume.corrected_content),
+        api_key=api_key,
+        model=claude_model,
+        max_tokens=4096,
+        system=RESUME_FEEDBACK_SYSTEM_PROMPT,
+        label=f"resume-feedback-stream {resume_id}",
+    )
+    return StreamingResponse(
+        stream_and_persist(chunks, save_feedback), media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
 @router.post("/{resume_id}/generate-questions", response_model=ResumeDetail)
 def generate_interview_questions(
     resume_id: int,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: deps.Principal = Depends(deps.get_current_principal),
 ) -> Any:
     """
     Generate and save interview questions if they don't exist.
@@ -243,6 +418,15 @@ def generate_interview_questions(
     if not content:
         raise HTTPException(status_code=400, detail="Resume content is empty.")
 
+    duplicate = _find_duplicate(db, resume, lambda other: bool(other.generated_questions))
+    if duplicate:
+        print(f"Reusing generated questions of identical resume {duplicate.resume_id}.")
+        crud.crud_generated_question.create_many(
+            db=db, resume_id=resume_id, question_texts=[q.question_text for q in duplicate.generated_questions]
+        )
+        db.refresh(resume)
+        return resume
+
     google_api_key = os.getenv("GOOGLE_API_KEY")
     if not google_api_key:
         raise HTTPException(status_code=500, detail="GOOGLE_API_KEY not set.")
@@ -251,48 +435,7 @@ def generate_interview_questions(
         raise HTTPException(status_code=500, detail="GEMINI_MODEL environment variable not set.")
 
     try:
-        genai.configure(api_key=google_api_key)
-        model = genai.GenerativeModel(gemini_model)
-
-        # 개선된 프롬프트 모듈 사용
-        prompt = get_question_generation_prompt(content)
-
-        response = model.generate_content(prompt)
-
-        # JSON 형식으로 파싱 시도
-        try:
-            # 응답에서 JSON 부분 추출 (```json ... ``` 형태일 수 있음)
-            response_text = response.text.strip()
-            if "```json" in response_text:
-                # JSON 코드 블록에서 추출
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                # 일반 코드 블록에서 추출
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                # 코드 블록 없이 바로 JSON
-                json_str = response_text
-
-            parsed_response = json.loads(json_str)
-            # 태그와 이모티콘 유지 (프론트엔드에서 질문 유형 구분용)
-            questions = [q["text"] for q in parsed_response.get("questions", [])]
-        except (json.JSONDecodeError, KeyError) as json_error:
-            # JSON 파싱 실패 시 기존 방식으로 폴백
-            print(f"JSON parsing failed, falling back to text split: {json_error}")
-            questions = []
-            raw_questions = response.text.split('\n')
-            for q in raw_questions:
-                q = q.strip()
-                if not q or "예상 면접 질문 리스트" in q:
-                    continue
-                # 번호만 제거, 태그와 이모티콘은 유지
-                q = re.sub(r'^\d+\.\s*', '', q).strip()
-                if q:
-                    questions.append(q)
+        questions = generate_question_texts(db, content, api_key=google_api_key, model_name=gemini_model)
 
         for q_text in questions:
             q_in = GeneratedQuestionCreate(resume_id=resume_id, question_text=q_text)
@@ -301,5 +444,8 @@ def generate_interview_questions(
         db.refresh(resume)
         return resume
 
+    except StructuredOutputError as e:
+        # 검증되지 않은 질문은 저장하지 않음
+        raise HTTPException(status_code=502, detail=f"Gemini returned invalid questions: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calling Gemini API: {e}")
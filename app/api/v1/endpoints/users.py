@@ -1,23 +1,25 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Any
 from sqlalchemy.orm import Session
 
 from app import crud, schemas, models
 from app.api import deps
+from app.core.password_hashing import password_hasher
 
 router = APIRouter()
 
 @router.get("/me", response_model=schemas.User)
 def read_user_me(
-    current_user: models.User = Depends(deps.get_current_user),
+    current_user: schemas.User = Depends(deps.get_current_user_cached),
 ) -> Any:
     """
-    Get current user.
+    Get current user (served from the short-TTL user cache).
     """
     return current_user
 
 @router.put("/me", response_model=schemas.User)
-def update_user_me(
+async def update_user_me(
     user_in: schemas.UserUpdate,
     current_user: models.User = Depends(deps.get_current_user),
     db: Session = Depends(deps.get_db),
@@ -25,7 +27,10 @@ def update_user_me(
     """
     Update current user.
     """
-    user = crud.user.update(db, db_obj=current_user, obj_in=user_in)
+    hashed_password = await password_hasher.hash(user_in.password) if user_in.password else None
+    user = await run_in_threadpool(
+        crud.user.update, db, db_obj=current_user, obj_in=user_in, hashed_password=hashed_password
+    )
     return user
 
 @router.get("/", response_model=List[schemas.User])
@@ -39,7 +44,7 @@ def read_users(
     return users
 
 @router.post("/", response_model=schemas.User)
-def create_user(
+async def create_user(
     *, 
     db: Session = Depends(deps.get_db),
     user_in: schemas.UserCreate,
@@ -47,7 +52,8 @@ def create_user(
         """
         Create new user.
         """
-        user = crud.user.create(db=db, obj_in=user_in)
+        hashed_password = await password_hasher.hash(user_in.password)
+        user = await run_in_threadpool(crud.user.create, db=db, obj_in=user_in, hashed_password=hashed_password)
         return user
 
 @router.get("/{user_id}", response_model=schemas.User)
@@ -62,17 +68,20 @@ def read_user_by_id(
     return user
 
 @router.put("/{user_id}", response_model=schemas.User)
-def update_user(
+async def update_user(
     user_id: int,
     *, 
     db: Session = Depends(deps.get_db),
     user_in: schemas.UserUpdate,
 ) -> Any:
     """Update a user."""
-    user = crud.user.get(db=db, user_id=user_id)
+    user = await run_in_threadpool(crud.user.get, db=db, user_id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    user = crud.user.update(db=db, db_obj=user, obj_in=user_in)
+    hashed_password = await password_hasher.hash(user_in.password) if user_in.password else None
+    user = await run_in_threadpool(
+        crud.user.update, db=db, db_obj=user, obj_in=user_in, hashed_password=hashed_password
+    )
     return user
 
 @router.delete("/{user_id}", response_model=schemas.User)
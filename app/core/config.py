@@ -1,4 +1,5 @@
 import os
+import socket
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -7,3 +8,125 @@ SECRET_KEY = os.getenv("SECRET_KEY", "a_super_secret_key_that_should_be_in_env")
 ALGORITHM = "HS256"
 # 면접이 길어질 수 있으므로 2시간으로 연장 (환경변수로 오버라이드 가능)
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 120))
+
+# 답변 음성 특징 추출(피치/에너지/머뭇거림)에 사용할 워커 프로세스 수
+AUDIO_ANALYSIS_WORKERS = int(os.getenv("AUDIO_ANALYSIS_WORKERS", 2))
+
+# Whisper 결과 저장 방식
+# - "slim": answer 행에는 분석에 필요한 필드(start/end/text/no_speech_prob)만 저장
+# - "full": Whisper 전체 결과를 그대로 저장 (기존 방식)
+WHISPER_RESULT_STORAGE = os.getenv("WHISPER_RESULT_STORAGE", "slim").lower()
+# slim 모드에서 전체 결과를 압축해 지연 로딩 컬럼(whisper_result_detail)에 보관할지 여부
+WHISPER_RESULT_KEEP_DETAIL = os.getenv("WHISPER_RESULT_KEEP_DETAIL", "true").lower() == "true"
+
+# 맞춤법 검사: 요청당 최대 글자 수(hanspell 제한)와 동시 요청 수 (hanspell 세션의 기본 연결 풀 10개 이하로 유지)
+GRAMMAR_CHECK_MAX_CHARS = int(os.getenv("GRAMMAR_CHECK_MAX_CHARS", 500))
+GRAMMAR_CHECK_CONCURRENCY = int(os.getenv("GRAMMAR_CHECK_CONCURRENCY", 8))
+
+# 맞춤법 검사 결과 캐시: 프로세스 메모리 LRU 크기와 DB(영구) 캐시 최대 항목 수,
+# DB 캐시 정리(항목 수 확인 후 오래된 항목 삭제) 주기(초)
+GRAMMAR_CACHE_MEMORY_SIZE = int(os.getenv("GRAMMAR_CACHE_MEMORY_SIZE", 5000))
+GRAMMAR_CACHE_MAX_ENTRIES = int(os.getenv("GRAMMAR_CACHE_MAX_ENTRIES", 200000))
+GRAMMAR_CACHE_EVICT_INTERVAL_SECONDS = float(os.getenv("GRAMMAR_CACHE_EVICT_INTERVAL_SECONDS", 600))
+
+# 이력서 업로드 파싱 제한 및 워커 프로세스 수
+RESUME_MAX_UPLOAD_BYTES = int(os.getenv("RESUME_MAX_UPLOAD_MB", 10)) * 1024 * 1024
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", 30))
+RESUME_PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", 2))
+
+# LLM 응답 캐시: 사용 여부, TTL(초), 프로세스 메모리 LRU 크기, DB(영구) 캐시 최대 항목 수,
+# DB 캐시 정리(만료 항목 삭제, 항목 수 확인 후 오래된 항목 삭제) 주기(초)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+LLM_CACHE_MEMORY_SIZE = int(os.getenv("LLM_CACHE_MEMORY_SIZE", 256))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 20000))
+LLM_CACHE_EVICT_INTERVAL_SECONDS = float(os.getenv("LLM_CACHE_EVICT_INTERVAL_SECONDS", 600))
+
+# 면접 질문 생성: 구조화 출력(JSON) 검증 실패 시 최대 시도 횟수 (첫 시도 포함)
+QUESTION_GENERATION_MAX_ATTEMPTS = int(os.getenv("QUESTION_GENERATION_MAX_ATTEMPTS", 2))
+
+# 질문 TTS 음성 캐시: 저장 디렉터리와 최대 파일 수 (초과 시 오래된 파일부터 삭제),
+# 정리 작업 주기(초, 새 파일이 저장된 경우에만 백그라운드로 실행)
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", "tts_cache")
+TTS_CACHE_MAX_FILES = int(os.getenv("TTS_CACHE_MAX_FILES", 5000))
+TTS_CACHE_TRIM_INTERVAL_SECONDS = float(os.getenv("TTS_CACHE_TRIM_INTERVAL_SECONDS", 300))
+
+# 이력서 업로드/수정 직후 면접 질문과 TTS 음성을 백그라운드에서 미리 생성할지 여부
+QUESTION_PREGENERATION_ENABLED = os.getenv("QUESTION_PREGENERATION_ENABLED", "true").lower() == "true"
+# 면접 세션 생성 시 진행 중인 사전 생성 작업을 기다리는 최대 시간(초)
+QUESTION_PREGENERATION_WAIT_SECONDS = float(os.getenv("QUESTION_PREGENERATION_WAIT_SECONDS", 60))
+
+# 모델 레지스트리: 서버 시작 시 백그라운드로 미리 로드할 모델 목록 (쉼표 구분, 비우면 요청 시 로드)
+# 음성 인식을 Redis 워커에 맡기는 경우(TRANSCRIPTION_DISPATCH=redis) API 서버는 Whisper를 로드하지 않음
+_PRELOAD_MODELS_DEFAULT = "embedding" if os.getenv("TRANSCRIPTION_DISPATCH", "local").lower() == "redis" else "whisper,embedding"
+PRELOAD_MODELS = [name.strip() for name in os.getenv("PRELOAD_MODELS", _PRELOAD_MODELS_DEFAULT).split(",") if name.strip()]
+WHISPER_MODEL_NAME = os.getenv("WHISPER_MODEL_NAME", "small")
+# 음성 인식 엔진: openai(openai-whisper, PyTorch) | faster(faster-whisper, CTranslate2 - CPU 서버 권장)
+# 장치(auto|cpu|cuda), 연산 타입(faster 전용: int8 | int8_float16 | float16 | float32),
+# CPU 스레드 수(0이면 라이브러리 기본값), 빔 크기(1이면 greedy 디코딩)
+WHISPER_BACKEND = os.getenv("WHISPER_BACKEND", "openai").lower()
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto").lower()
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "int8")
+WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", 0))
+WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", 1))
+EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL", "jhgan/ko-sroberta-multitask")
+
+# 개발용 옵션: 시작 시 테스트 사용자(user_id=1) 생성, 등록된 라우트 출력
+CREATE_DUMMY_USER = os.getenv("CREATE_DUMMY_USER", "false").lower() == "true"
+PRINT_ROUTES = os.getenv("PRINT_ROUTES", "false").lower() == "true"
+
+# 인증 사용자 캐시: 프로세스 메모리에 보관하는 사용자 정보의 TTL(초)과 최대 항목 수
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", 30))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", 1024))
+
+# 비밀번호 해싱: bcrypt 비용(rounds, 변경 시 로그인할 때 자동 재해싱),
+# 전용 스레드 수, 대기 가능한 최대 작업 수 (초과 시 503으로 즉시 거절)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 16))
+
+# 답변 음성 파일 보관: 면접 종료 후 보관 시간(분), 면접이 끝나지 않은 경우의 최대 보관 시간(분),
+# 만료 파일 정리 주기(초)와 한 번에 정리할 답변 수
+AUDIO_RETENTION_MINUTES = int(os.getenv("AUDIO_RETENTION_MINUTES", 5))
+AUDIO_MAX_RETENTION_MINUTES = int(os.getenv("AUDIO_MAX_RETENTION_MINUTES", 180))
+AUDIO_SWEEP_ENABLED = os.getenv("AUDIO_SWEEP_ENABLED", "true").lower() == "true"
+AUDIO_SWEEP_INTERVAL_SECONDS = int(os.getenv("AUDIO_SWEEP_INTERVAL_SECONDS", 60))
+AUDIO_SWEEP_BATCH_SIZE = int(os.getenv("AUDIO_SWEEP_BATCH_SIZE", 200))
+# 비정상 종료로 남은 스테이징 파일(AUDIO_FILES_DIR/.staging) 정리 주기(초), 호스트별로 한 프로세스가 수행
+AUDIO_STAGING_SWEEP_INTERVAL_SECONDS = int(os.getenv("AUDIO_STAGING_SWEEP_INTERVAL_SECONDS", 3600))
+
+# 답변 음성 저장소: local(AUDIO_FILES_DIR 아래 해시 접두사로 분산된 디렉터리) 또는 s3(S3 호환, MinIO 포함)
+AUDIO_STORAGE_BACKEND = os.getenv("AUDIO_STORAGE_BACKEND", "local").lower()
+AUDIO_FILES_DIR = os.getenv("AUDIO_FILES_DIR", "audio_files")
+AUDIO_S3_BUCKET = os.getenv("AUDIO_S3_BUCKET", "")
+AUDIO_S3_ENDPOINT_URL = os.getenv("AUDIO_S3_ENDPOINT_URL") or None  # 예: http://localhost:9000 (MinIO)
+AUDIO_S3_PREFIX = os.getenv("AUDIO_S3_PREFIX", "answers/")
+AUDIO_S3_REGION = os.getenv("AUDIO_S3_REGION") or None
+
+# 답변 음성 보관 코덱: opus(권장) | flac(무손실) | wav(변환 안 함). 분석이 끝난 뒤 백그라운드에서 변환
+AUDIO_ARCHIVE_FORMAT = os.getenv("AUDIO_ARCHIVE_FORMAT", "opus").lower()
+AUDIO_TRANSCODE_WORKERS = int(os.getenv("AUDIO_TRANSCODE_WORKERS", 1))
+# 재시작 등으로 보관(변환/저장)이 끝나지 않은 답변 음성을 다시 처리하기까지 기다리는 시간(분)
+AUDIO_ARCHIVE_RETRY_MINUTES = int(os.getenv("AUDIO_ARCHIVE_RETRY_MINUTES", 10))
+
+# 면접 WebSocket 수평 확장: 세션 상태 저장소(memory | redis)와 음성 인식 작업 분배(local | redis)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+SESSION_STORE_BACKEND = os.getenv("SESSION_STORE_BACKEND", "memory").lower()
+SESSION_STATE_TTL_SECONDS = int(os.getenv("SESSION_STATE_TTL_SECONDS", 3600))
+TRANSCRIPTION_DISPATCH = os.getenv("TRANSCRIPTION_DISPATCH", "local").lower()
+TRANSCRIPTION_QUEUE = os.getenv("TRANSCRIPTION_QUEUE", "transcription:jobs")
+# 음성 인식 워커 이름: 처리 중인 작업 목록(<큐>:processing:<이름>)의 키로, 재시작해도 같은 이름이어야 남은 작업을 다시 처리함
+# (기본값: 호스트 이름, 한 호스트에서 여러 워커를 실행하면 워커마다 다르게 지정)
+TRANSCRIPTION_WORKER_NAME = os.getenv("TRANSCRIPTION_WORKER_NAME") or socket.gethostname()
+TRANSCRIPTION_JOB_TIMEOUT_SECONDS = int(os.getenv("TRANSCRIPTION_JOB_TIMEOUT_SECONDS", 300))
+# 전사 전 무음 제거: energy(에너지 기반 VAD로 앞뒤 무음과 긴 멈춤을 잘라내고 타임스탬프는 원본 기준으로 복원) | off
+TRANSCRIPTION_VAD = os.getenv("TRANSCRIPTION_VAD", "energy").lower()
+
+# 면접 WebSocket 동시 세션 제한: 동시에 진행할 세션 수(음성 인식 처리 용량), 대기열 최대 길이,
+# 최대 대기 시간(초), 대기 순번 갱신 주기(초). SESSION_STORE_BACKEND=redis 이면 동시 세션 수는 모든 워커/노드 합계이고
+# (Redis 임대, 임대 유효 시간(초)은 INTERVIEW_ADMISSION_LEASE_SECONDS), memory 이면 프로세스별 (워커 수로 나눠 설정)
+INTERVIEW_MAX_ACTIVE_SESSIONS = int(os.getenv("INTERVIEW_MAX_ACTIVE_SESSIONS", 8))
+INTERVIEW_MAX_QUEUED_SESSIONS = int(os.getenv("INTERVIEW_MAX_QUEUED_SESSIONS", 50))
+INTERVIEW_QUEUE_TIMEOUT_SECONDS = float(os.getenv("INTERVIEW_QUEUE_TIMEOUT_SECONDS", 600))
+INTERVIEW_QUEUE_UPDATE_SECONDS = float(os.getenv("INTERVIEW_QUEUE_UPDATE_SECONDS", 2))
+INTERVIEW_ADMISSION_LEASE_SECONDS = int(os.getenv("INTERVIEW_ADMISSION_LEASE_SECONDS", 60))
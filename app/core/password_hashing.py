@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
+
+from app.core.config import BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_PENDING
+from app.core.security import pwd_context
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop in a small dedicated thread pool.
+
+    bcrypt is deliberately slow, so a login burst would otherwise occupy every
+    threadpool worker and stall unrelated endpoints. Jobs beyond
+    `max_pending` (queued + running) are rejected with 503 instead of queueing
+    without bound. Hash/verify timings are kept for get_stats().
+    """
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._rejected = 0
+        self._rehashed = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    def _record(self, operation: str, seconds: float) -> None:
+        with self._lock:
+            op = self._stats.setdefault(operation, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            op["count"] += 1
+            op["total_ms"] += seconds * 1000
+            op["max_ms"] = max(op["max_ms"], seconds * 1000)
+
+    def _timed(self, operation: str, fn: Callable[..., Any], *args) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            self._record(operation, time.perf_counter() - start)
+
+    async def _run(self, operation: str, fn: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Authentication service is busy. Please retry shortly.",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._timed, operation, fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hashes a password with the configured bcrypt cost."""
+        return await self._run("hash", pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verifies a password against its stored hash.
+
+        Returns (valid, new_hash). new_hash is set when the password is valid
+        but the stored hash was made with a different cost (BCRYPT_ROUNDS
+        changed); the caller should persist it.
+        """
+        valid, new_hash = await self._run("verify", pwd_context.verify_and_update, password, hashed_password)
+        if new_hash:
+            with self._lock:
+                self._rehashed += 1
+        return valid, new_hash
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = {
+                name: {
+                    "count": int(op["count"]),
+                    "avg_ms": round(op["total_ms"] / op["count"], 2) if op["count"] else 0.0,
+                    "max_ms": round(op["max_ms"], 2),
+                }
+                for name, op in self._stats.items()
+            }
+            return {
+                "bcrypt_rounds": BCRYPT_ROUNDS,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "rejected": self._rejected,
+                "rehashed": self._rehashed,
+                "operations": operations,
+            }
+
+
+password_hasher = PasswordHasher()
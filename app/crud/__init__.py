@@ -5,4 +5,5 @@ from . import crud_resume as resume
 from . import crud_user as user
 from . import crud_video_analysis as video_analysis
 from . import crud_generated_question as generated_question
-
+from . import crud_spell_check_cache as spell_check_cache
+from . import crud_llm_response_cache as llm_response_cache
@@ -10,4 +10,21 @@ def create_question(db: Session, obj_in: GeneratedQuestionCreate) -> GeneratedQu
     return db_obj
 
 def get_questions_by_resume(db: Session, resume_id: int) -> list[GeneratedQuestion]:
-    return db.query(GeneratedQuestion).filter(GeneratedQuestion.resume_id == resume_id).all()
+    # 면접 재개/재시도 시에도 같은 순서로 질문하도록 생성 순서로 정렬
+    return (
+        db.query(GeneratedQuestion)
+        .filter(GeneratedQuestion.resume_id == resume_id)
+        .order_by(GeneratedQuestion.question_id)
+        .all()
+    )
+
+def create_many(db: Session, *, resume_id: int, question_texts: list[str]) -> list[GeneratedQuestion]:
+    db_objs = [GeneratedQuestion(resume_id=resume_id, question_text=text) for text in question_texts]
+    db.add_all(db_objs)
+    db.commit()
+    return db_objs
+
+def replace_for_resume(db: Session, *, resume_id: int, question_texts: list[str]) -> list[GeneratedQuestion]:
+    """이력서의 기존 질문을 새 질문으로 한 트랜잭션에서 교체합니다."""
+    db.query(GeneratedQuestion).filter(GeneratedQuestion.resume_id == resume_id).delete()
+    return create_many(db, resume_id=resume_id, question_texts=question_texts)
@@ -1,8 +1,13 @@
-from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime, timedelta
 
+from sqlalchemy import func
+from sqlalchemy.orm import Session, undefer
+from typing import List, Optional, Tuple, Dict, Any
+
+from app.core.config import AUDIO_MAX_RETENTION_MINUTES
 from app.models.interview import Interview, Question, Answer
 from app.schemas.interview import InterviewCreate, QuestionCreate, AnswerCreate
+from app.utils.whisper_storage import decompress_whisper_result
 
 # CRUD for Interview
 def get_interview(db: Session, interview_id: int) -> Interview | None:
@@ -54,13 +59,126 @@ def create_answer(db: Session, *, obj_in: AnswerCreate) -> Answer:
         question_id=obj_in.question_id,
         answer_text=obj_in.answer_text,
         audio_path=obj_in.audio_path,
-        whisper_result=obj_in.whisper_result  # Whisper 결과 저장
+        # 면접이 정상 종료되지 않아도 음성 파일이 남지 않도록 최대 보관 시각을 먼저 기록
+        audio_expires_at=(
+            datetime.utcnow() + timedelta(minutes=AUDIO_MAX_RETENTION_MINUTES) if obj_in.audio_path else None
+        ),
+        whisper_result=obj_in.whisper_result,  # Whisper 결과 저장
+        whisper_result_detail=obj_in.whisper_result_detail,
+        audio_features=obj_in.audio_features,  # 음성 특징 (피치/에너지/머뭇거림)
+        speech_rate=obj_in.speech_rate,
+        silence_ratio=obj_in.silence_ratio,
+        duration=obj_in.duration
     )
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
     return db_obj
 
+def get_answered_question_ids(db: Session, interview_id: int) -> set:
+    """IDs of the interview's questions that already have a saved answer (for session resume)."""
+    rows = (
+        db.query(Answer.question_id)
+        .join(Question, Question.question_id == Answer.question_id)
+        .filter(Question.interview_id == interview_id)
+        .distinct()
+        .all()
+    )
+    return {row.question_id for row in rows}
+
+def set_audio_expiry(db: Session, *, interview_id: int, expires_at: datetime) -> int:
+    """Sets the audio deletion time of every answer of an interview that still has a file."""
+    question_ids = db.query(Question.question_id).filter(Question.interview_id == interview_id)
+    updated = (
+        db.query(Answer)
+        .filter(Answer.question_id.in_(question_ids), Answer.audio_path.isnot(None))
+        .update({Answer.audio_expires_at: expires_at}, synchronize_session=False)
+    )
+    db.commit()
+    return updated
+
+def claim_expired_audio(db: Session, *, now: datetime, limit: int) -> List[Tuple[int, str]]:
+    """
+    Locks up to `limit` answers whose audio has expired and returns (answer_id, audio_path).
+
+    FOR UPDATE SKIP LOCKED lets sweepers in several workers run concurrently without
+    picking the same rows; the lock is held until the caller commits.
+    """
+    return (
+        db.query(Answer.answer_id, Answer.audio_path)
+        .filter(Answer.audio_expires_at <= now, Answer.audio_path.isnot(None))
+        .order_by(Answer.audio_expires_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+def set_audio_path(db: Session, *, answer_id: int, audio_path: str) -> None:
+    """Points an answer at a different stored audio object (e.g. after archival transcoding)."""
+    db.query(Answer).filter(Answer.answer_id == answer_id).update(
+        {Answer.audio_path: audio_path}, synchronize_session=False
+    )
+    db.commit()
+
+def clear_audio_paths(db: Session, *, answer_ids: List[int]) -> None:
+    """Forgets the audio files of the given answers once they have been deleted."""
+    if answer_ids:
+        db.query(Answer).filter(Answer.answer_id.in_(answer_ids)).update(
+            {Answer.audio_path: None, Answer.audio_expires_at: None}, synchronize_session=False
+        )
+    db.commit()
+
+def mark_audio_archived(db: Session, *, answer_id: int) -> None:
+    """Records that the answer's audio has been stored in its archival codec."""
+    db.query(Answer).filter(Answer.answer_id == answer_id).update(
+        {Answer.audio_archived_at: datetime.utcnow()}, synchronize_session=False
+    )
+    db.commit()
+
+def get_pending_audio_archives(db: Session, *, created_after: datetime, created_before: datetime, limit: int) -> List[Tuple[int, str]]:
+    """
+    Returns (answer_id, audio_path) of answers created in the window whose
+    audio has not been archived yet (the job was lost, e.g. in a restart).
+    """
+    return (
+        db.query(Answer.answer_id, Answer.audio_path)
+        .filter(
+            Answer.audio_archived_at.is_(None),
+            Answer.audio_path.isnot(None),
+            Answer.created_at > created_after,
+            Answer.created_at <= created_before,
+        )
+        .order_by(Answer.created_at)
+        .limit(limit)
+        .all()
+    )
+
+def get_pending_archive_ids(db: Session, *, answer_ids: List[int]) -> set:
+    """Returns which of the given answers still have audio waiting to be archived."""
+    if not answer_ids:
+        return set()
+    rows = (
+        db.query(Answer.answer_id)
+        .filter(Answer.answer_id.in_(answer_ids), Answer.audio_archived_at.is_(None), Answer.audio_path.isnot(None))
+        .all()
+    )
+    return {row.answer_id for row in rows}
+
+def get_full_whisper_result(db: Session, answer_id: int) -> Optional[Dict[str, Any]]:
+    """
+    답변의 Whisper 전체 결과를 반환합니다.
+    압축 보관된 상세 결과가 있으면 그것을, 없으면 행에 저장된 결과를 반환합니다.
+    """
+    answer = (
+        db.query(Answer)
+        .options(undefer(Answer.whisper_result_detail))
+        .filter(Answer.answer_id == answer_id)
+        .first()
+    )
+    if not answer:
+        return None
+    return decompress_whisper_result(answer.whisper_result_detail) or answer.whisper_result
+
 def get_answers_by_interview(db: Session, interview_id: int) -> List[Answer]:
     """
     특정 면접의 모든 답변을 조회합니다.
@@ -71,3 +189,33 @@ def get_answers_by_interview(db: Session, interview_id: int) -> List[Answer]:
         .filter(Question.interview_id == interview_id)
         .all()
     )
+
+def get_audio_metric_averages(db: Session, interview_id: int) -> Tuple[Optional[float], Optional[float], int]:
+    """
+    면접 답변들의 평균 말하기 속도/침묵 비율을 단일 AVG 쿼리로 계산합니다.
+    질문마다 첫 답변(가장 작은 answer_id)만 집계하며 (세션 재개 등으로 답변이 여러 개여도
+    리포트와 같은 기준), 음성 지표가 없는 답변(NULL)은 평균에서 제외됩니다.
+
+    Returns:
+        (avg_speech_rate, avg_silence_ratio, num_answers_with_audio)
+    """
+    first_answer_ids = (
+        db.query(func.min(Answer.answer_id))
+        .join(Question, Answer.question_id == Question.question_id)
+        .filter(Question.interview_id == interview_id)
+        .group_by(Answer.question_id)
+    )
+    avg_speech_rate, avg_silence_ratio, num_answers = (
+        db.query(
+            func.avg(Answer.speech_rate),
+            func.avg(Answer.silence_ratio),
+            func.count(Answer.speech_rate),
+        )
+        .filter(Answer.answer_id.in_(first_answer_ids))
+        .one()
+    )
+    return (
+        float(avg_speech_rate) if avg_speech_rate is not None else None,
+        float(avg_silence_ratio) if avg_silence_ratio is not None else None,
+        num_answers,
+    )
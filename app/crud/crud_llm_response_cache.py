@@ -0,0 +1,97 @@
+from datetime import timedelta
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from typing import Dict, Optional, Tuple
+
+from app.models.llm_response_cache import LLMResponseCache
+
+
+def get(db: Session, *, cache_key: str) -> Optional[Tuple[str, float]]:
+    """만료되지 않은 캐시 응답과 남은 TTL(초)을 반환하고 사용 시각/횟수를 갱신합니다."""
+    row = (
+        db.query(
+            LLMResponseCache.response_text,
+            func.extract("epoch", LLMResponseCache.expires_at - func.now()),
+        )
+        .filter(LLMResponseCache.cache_key == cache_key, LLMResponseCache.expires_at > func.now())
+        .first()
+    )
+    if row is None:
+        return None
+    (
+        db.query(LLMResponseCache)
+        .filter(LLMResponseCache.cache_key == cache_key)
+        .update(
+            {
+                LLMResponseCache.last_used_at: func.now(),
+                LLMResponseCache.hit_count: LLMResponseCache.hit_count + 1,
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    response_text, ttl_remaining = row
+    return response_text, float(ttl_remaining)
+
+
+def upsert(db: Session, *, cache_key: str, provider: str, model: str, response_text: str, ttl_seconds: int) -> None:
+    """응답을 저장합니다. 이미 있는 키는 응답과 만료 시각을 갱신합니다."""
+    expires_at = func.now() + timedelta(seconds=ttl_seconds)
+    stmt = insert(LLMResponseCache).values(
+        cache_key=cache_key,
+        provider=provider,
+        model=model,
+        response_text=response_text,
+        hit_count=0,
+        expires_at=expires_at,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LLMResponseCache.cache_key],
+        set_={
+            "response_text": stmt.excluded.response_text,
+            "expires_at": stmt.excluded.expires_at,
+            "last_used_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def evict(db: Session, *, max_entries: int) -> int:
+    """만료된 항목을 삭제하고, 그래도 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다."""
+    deleted = (
+        db.query(LLMResponseCache)
+        .filter(LLMResponseCache.expires_at <= func.now())
+        .delete(synchronize_session=False)
+    )
+    total = db.query(func.count(LLMResponseCache.cache_key)).scalar() or 0
+    overflow = total - max_entries
+    if overflow > 0:
+        oldest = (
+            db.query(LLMResponseCache.cache_key)
+            .order_by(LLMResponseCache.last_used_at.asc())
+            .limit(overflow)
+            .subquery()
+        )
+        deleted += (
+            db.query(LLMResponseCache)
+            .filter(LLMResponseCache.cache_key.in_(db.query(oldest.c.cache_key)))
+            .delete(synchronize_session=False)
+        )
+    db.commit()
+    return deleted
+
+
+def get_totals(db: Session) -> Dict[str, Dict[str, int]]:
+    """provider별 저장 항목 수와 누적 적중 횟수."""
+    rows = (
+        db.query(
+            LLMResponseCache.provider,
+            func.count(LLMResponseCache.cache_key),
+            func.coalesce(func.sum(LLMResponseCache.hit_count), 0),
+        )
+        .group_by(LLMResponseCache.provider)
+        .all()
+    )
+    return {provider: {"entries": int(entries), "total_hits": int(hits)} for provider, entries, hits in rows}
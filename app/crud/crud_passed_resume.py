@@ -1,17 +1,16 @@
-import os
 from sqlalchemy.orm import Session
 from typing import List
-from sentence_transformers import SentenceTransformer
 
 from app.models.passed_resume import PassedResume
 from app.schemas.passed_resume import PassedResumeCreate
+from app.utils.model_registry import model_registry
 
-# Load the sentence transformer model from environment variable
-model_name = os.getenv("EMBEDDING_MODEL", 'jhgan/ko-sroberta-multitask')
-model = SentenceTransformer(model_name)
+def get_embedding_model():
+    """The sentence transformer model (EMBEDDING_MODEL), loaded via the model registry."""
+    return model_registry.get("embedding")
 
 def create_passed_resume(db: Session, *, obj_in: PassedResumeCreate) -> PassedResume:
-    embedding = model.encode(obj_in.content)
+    embedding = get_embedding_model().encode(obj_in.content)
     db_obj = PassedResume(
         company=obj_in.company,
         job_title=obj_in.job_title,
@@ -24,7 +23,7 @@ def create_passed_resume(db: Session, *, obj_in: PassedResumeCreate) -> PassedRe
     return db_obj
 
 def find_similar_resumes(db: Session, resume_content: str, limit: int = 5) -> List[PassedResume]:
-    embedding = model.encode(resume_content)
+    embedding = get_embedding_model().encode(resume_content)
     
     # L2 distance is the default, which is fine for normalized embeddings
     similar_resumes = db.query(PassedResume).order_by(PassedResume.embedding.l2_distance(embedding)).limit(limit).all()
@@ -1,34 +1,102 @@
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group, load_only
 from typing import List, Any, Dict, Optional, Union
 
 from app.models.resume import Resume
 from app.schemas.resume import ResumeCreate, ResumeUpdate
 from app import models # models 임포트 추가
+from app.models.generated_question import GeneratedQuestion
+from app.utils.content_hash import content_sha256
+
+# --- Load profiles ---
+# content / corrected_content / ai_feedback are deferred on the model (group "text").
+# - ownership check: get_owner_id  -> only user_id
+# - list view:       get_summary / get_multi_by_owner(summary=True) -> metadata columns only
+# - detail view:     get / get_multi_by_owner -> text columns + generated questions
+
+_SUMMARY_COLUMNS = (Resume.resume_id, Resume.user_id, Resume.title, Resume.created_at, Resume.updated_at)
+
+def _detail_options():
+    return (undefer_group("text"), selectinload(Resume.generated_questions))
+
+def get_owner_id(db: Session, resume_id: int) -> Optional[int]:
+    """Returns the owner's user_id (for authorization checks) without loading the resume."""
+    return db.query(Resume.user_id).filter(Resume.resume_id == resume_id).scalar()
+
+def get_summary(db: Session, resume_id: int) -> Optional[Resume]:
+    return db.query(Resume).options(load_only(*_SUMMARY_COLUMNS)).filter(Resume.resume_id == resume_id).first()
+
+def get_content(db: Session, resume_id: int) -> Optional[str]:
+    return db.query(Resume.content).filter(Resume.resume_id == resume_id).scalar()
 
 def get(db: Session, resume_id: int) -> Optional[Resume]:
-    return db.query(Resume).options(joinedload(models.Resume.generated_questions)).filter(Resume.resume_id == resume_id).first()
+    return db.query(Resume).options(*_detail_options()).filter(Resume.resume_id == resume_id).first()
+
+def get_by_file_hash(db: Session, *, user_id: int, file_sha256: str) -> Optional[Resume]:
+    """Most recent resume of the user uploaded from identical file bytes (detail profile)."""
+    return (
+        db.query(Resume)
+        .options(*_detail_options())
+        .filter(Resume.user_id == user_id, Resume.file_sha256 == file_sha256)
+        .order_by(Resume.resume_id.desc())
+        .first()
+    )
+
+def get_by_content_hash(
+    db: Session, *, user_id: int, content_sha256: str, exclude_resume_id: Optional[int] = None
+) -> List[Resume]:
+    """The user's resumes with identical normalized text, newest first (detail profile)."""
+    query = db.query(Resume).options(*_detail_options()).filter(
+        Resume.user_id == user_id, Resume.content_sha256 == content_sha256
+    )
+    if exclude_resume_id is not None:
+        query = query.filter(Resume.resume_id != exclude_resume_id)
+    return query.order_by(Resume.resume_id.desc()).all()
 
 def get_multi(db: Session, skip: int = 0, limit: int = 100) -> List[Resume]:
     return db.query(Resume).offset(skip).limit(limit).all()
 
 def get_multi_by_owner(
-    db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+    db: Session, *, owner_id: int, skip: int = 0, limit: int = 100, summary: bool = False
 ) -> List[Resume]:
+    options = (load_only(*_SUMMARY_COLUMNS),) if summary else _detail_options()
     return (
         db.query(Resume)
+        .options(*options)
         .filter(Resume.user_id == owner_id)
         .offset(skip)
         .limit(limit)
         .all()
     )
 
-def create(db: Session, *, obj_in: ResumeCreate, user_id: int) -> Resume:
+def create(
+    db: Session,
+    *,
+    obj_in: ResumeCreate,
+    user_id: int,
+    file_sha256: Optional[str] = None,
+    source: Optional[Resume] = None,
+) -> Resume:
+    """
+    Creates a resume. When source (a duplicate of the same user) is given, its
+    corrected content, AI feedback and generated questions are copied over.
+    """
     db_obj = Resume(
         title=obj_in.title,
         content=obj_in.content,
-        user_id=user_id
+        user_id=user_id,
+        file_sha256=file_sha256,
+        content_sha256=content_sha256(obj_in.content),
     )
+    if source is not None:
+        db_obj.corrected_content = source.corrected_content
+        db_obj.ai_feedback = source.ai_feedback
     db.add(db_obj)
+    db.flush()
+    if source is not None:
+        db.add_all([
+            GeneratedQuestion(resume_id=db_obj.resume_id, question_text=question.question_text)
+            for question in source.generated_questions
+        ])
     db.commit()
     db.refresh(db_obj)
     return db_obj
@@ -41,14 +109,18 @@ def update(db: Session, *, db_obj: Resume, obj_in: Union[ResumeUpdate, Dict[str,
     
     for field in update_data:
         setattr(db_obj, field, update_data[field])
+    if "content" in update_data:
+        db_obj.content_sha256 = content_sha256(update_data["content"])
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
     return db_obj
 
 def remove(db: Session, *, resume_id: int) -> Optional[Resume]:
-    # Eagerly load related entities
+    # Eagerly load related entities (and the deferred text columns, which are
+    # returned to the client after the row is gone)
     obj = db.query(Resume).options(
+        undefer_group("text"),
         joinedload(Resume.generated_questions)
     ).filter(Resume.resume_id == resume_id).first()
 
@@ -0,0 +1,73 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from typing import Dict, List
+
+from app.models.spell_check_cache import SpellCheckCache
+
+
+def get_many(db: Session, *, line_hashes: List[str]) -> Dict[str, str]:
+    """해시 목록에 해당하는 캐시된 교정 결과를 반환하고 사용 시각/횟수를 갱신합니다."""
+    if not line_hashes:
+        return {}
+    rows = (
+        db.query(SpellCheckCache.line_hash, SpellCheckCache.checked_text)
+        .filter(SpellCheckCache.line_hash.in_(line_hashes))
+        .all()
+    )
+    found = {line_hash: checked_text for line_hash, checked_text in rows}
+    if found:
+        (
+            db.query(SpellCheckCache)
+            .filter(SpellCheckCache.line_hash.in_(list(found)))
+            .update(
+                {
+                    SpellCheckCache.last_used_at: func.now(),
+                    SpellCheckCache.hit_count: SpellCheckCache.hit_count + 1,
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+    return found
+
+
+def upsert_many(db: Session, *, entries: Dict[str, str]) -> None:
+    """교정 결과를 저장합니다. 이미 있는 해시는 결과와 사용 시각만 갱신합니다."""
+    if not entries:
+        return
+    stmt = insert(SpellCheckCache).values(
+        [{"line_hash": line_hash, "checked_text": text, "hit_count": 0} for line_hash, text in entries.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SpellCheckCache.line_hash],
+        set_={"checked_text": stmt.excluded.checked_text, "last_used_at": func.now()},
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+def evict_lru(db: Session, *, max_entries: int) -> int:
+    """항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다."""
+    total = db.query(func.count(SpellCheckCache.line_hash)).scalar() or 0
+    overflow = total - max_entries
+    if overflow <= 0:
+        return 0
+    oldest = (
+        db.query(SpellCheckCache.line_hash)
+        .order_by(SpellCheckCache.last_used_at.asc())
+        .limit(overflow)
+        .subquery()
+    )
+    deleted = (
+        db.query(SpellCheckCache)
+        .filter(SpellCheckCache.line_hash.in_(db.query(oldest.c.line_hash)))
+        .delete(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def get_totals(db: Session) -> Dict[str, int]:
+    entries, hits = db.query(func.count(SpellCheckCache.line_hash), func.coalesce(func.sum(SpellCheckCache.hit_count), 0)).one()
+    return {"entries": int(entries), "total_hits": int(hits)}
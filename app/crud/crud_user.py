@@ -1,9 +1,12 @@
+from typing import Optional
+
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.utils.user_cache import user_cache
 
 
 def get(db: Session, user_id: int):
@@ -15,7 +18,8 @@ def get_by_email(db: Session, email: str):
 def get_multi(db: Session, skip: int = 0, limit: int = 100):
     return db.query(User).offset(skip).limit(limit).all()
 
-def create(db: Session, *, obj_in: UserCreate) -> User:
+def create(db: Session, *, obj_in: UserCreate, hashed_password: Optional[str] = None) -> User:
+    """hashed_password: obj_in.password already hashed off the request thread (password_hasher)."""
     # Pre-check if user exists
     if get_by_email(db, email=obj_in.email):
         raise HTTPException(
@@ -23,7 +27,8 @@ def create(db: Session, *, obj_in: UserCreate) -> User:
             detail="The user with this email already exists in the system.",
         )
 
-    hashed_password = get_password_hash(obj_in.password)
+    if hashed_password is None:
+        hashed_password = get_password_hash(obj_in.password)
     db_obj = User(
         user_name=obj_in.user_name,
         email=obj_in.email,
@@ -34,10 +39,11 @@ def create(db: Session, *, obj_in: UserCreate) -> User:
     db.refresh(db_obj)
     return db_obj
 
-def update(db: Session, *, db_obj: User, obj_in: UserUpdate) -> User:
+def update(db: Session, *, db_obj: User, obj_in: UserUpdate, hashed_password: Optional[str] = None) -> User:
     update_data = obj_in.dict(exclude_unset=True)
     if "password" in update_data and update_data["password"]:
-        hashed_password = get_password_hash(update_data["password"])
+        if hashed_password is None:
+            hashed_password = get_password_hash(update_data["password"])
         update_data["password"] = hashed_password
 
     for field, value in update_data.items():
@@ -49,10 +55,19 @@ def update(db: Session, *, db_obj: User, obj_in: UserUpdate) -> User:
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    user_cache.invalidate(db_obj.user_id)
     return db_obj
 
+def update_password_hash(db: Session, *, user_id: int, hashed_password: str) -> None:
+    """Stores a re-computed hash (e.g. after the bcrypt cost changed) without loading the row."""
+    db.query(User).filter(User.user_id == user_id).update(
+        {User.password: hashed_password}, synchronize_session=False
+    )
+    db.commit()
+
 def remove(db: Session, *, user_id: int) -> User:
     obj = db.query(User).get(user_id)
     db.delete(obj)
     db.commit()
+    user_cache.invalidate(user_id, deleted=True)
     return obj
@@ -8,15 +8,34 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 os.environ["PATH"] = f"{project_root};{os.environ['PATH']}"
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 from app.api.v1.api import api_router
+from app.core.config import PRELOAD_MODELS, CREATE_DUMMY_USER, PRINT_ROUTES, AUDIO_SWEEP_ENABLED, TRANSCRIPTION_DISPATCH
 from app.db.session import SessionLocal
 from app.models.user import User
+from app.utils.audio_retention import audio_retention_sweeper
+from app.utils.model_registry import model_registry
 
 app = FastAPI(title="JobPrep API")
 
 @app.on_event("startup")
 def on_startup():
+    # 무거운 모델(Whisper, 임베딩)은 백그라운드에서 로드하여 첫 요청의 콜드 스타트를 제거
+    preload = PRELOAD_MODELS
+    if TRANSCRIPTION_DISPATCH == "redis" and "whisper" in preload:
+        # 전사는 음성 인식 워커가 담당: 프런트엔드의 준비 상태가 Whisper 로드를 기다리지 않도록 제외
+        print("TRANSCRIPTION_DISPATCH=redis: not preloading 'whisper' on this API server")
+        preload = [name for name in preload if name != "whisper"]
+    model_registry.preload(preload)
+
+    # 만료된 답변 음성 파일을 주기적으로 삭제 (삭제 시각은 DB에 있으므로 재시작해도 유지,
+    # 모든 워커에서 시작하지만 리더 잠금을 얻은 프로세스 하나만 실제로 정리)
+    if AUDIO_SWEEP_ENABLED:
+        audio_retention_sweeper.start()
+
+    if not CREATE_DUMMY_USER:
+        return
     db = SessionLocal()
     # Create a dummy user for testing if not exists
     user = db.query(User).filter(User.user_id == 1).first()
@@ -32,21 +51,40 @@ def on_startup():
     db.close()
 
 
+@app.on_event("shutdown")
+def on_shutdown():
+    audio_retention_sweeper.stop()
+
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the JobPrep API"}
 
 
+@app.get("/health/ready")
+def readiness():
+    """
+    Readiness probe: 200 once every preloaded model is loaded, 503 otherwise.
+    Reports per-model load state and load time so cold starts are measurable.
+    """
+    ready = model_registry.is_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "models": model_registry.status()},
+    )
+
+
 app.include_router(api_router, prefix="/api/v1")
 
-# Add diagnostic code to print all registered routes
-from fastapi.routing import APIRoute
+# Diagnostic: print all registered routes (PRINT_ROUTES=true)
+if PRINT_ROUTES:
+    from fastapi.routing import APIRoute
 
-print("--- Registered API Routes ---")
-for route in app.routes:
-    if isinstance(route, APIRoute):
-        print(f"Path: {route.path}, Name: {route.name}, Methods: {route.methods}")
-print("-----------------------------")
+    print("--- Registered API Routes ---")
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            print(f"Path: {route.path}, Name: {route.name}, Methods: {route.methods}")
+    print("-----------------------------")
 
 
 if __name__ == "__main__":
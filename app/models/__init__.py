@@ -2,4 +2,6 @@ from .user import User
 from .resume import Resume
 from .interview import Interview, Question, Answer
 from .analysis import Analysis
-from .passed_resume import PassedResume
\ No newline at end of file
+from .passed_resume import PassedResume
+from .spell_check_cache import SpellCheckCache
+from .llm_response_cache import LLMResponseCache
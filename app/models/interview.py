@@ -1,5 +1,5 @@
-from sqlalchemy import Column, BigInteger, String, Text, DateTime, ForeignKey, Identity
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, String, Text, DateTime, ForeignKey, Identity, Float, LargeBinary
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from sqlalchemy.types import JSON
 from datetime import datetime
@@ -40,8 +40,20 @@ class Answer(Base):
     answer_id = Column(BigInteger, Identity(start=1), primary_key=True)
     question_id = Column(BigInteger, ForeignKey('question.question_id'), nullable=False)
     answer_text = Column(Text, nullable=False)
-    audio_path = Column(String(255), nullable=True)  # Path to the audio file
+    audio_path = Column(String(255), nullable=True)  # Audio storage key (app/utils/audio_storage.py), not a path
+    # 음성 파일 삭제 예정 시각 (UTC); 주기적 정리 작업이 이 인덱스로 만료 파일을 찾음
+    audio_expires_at = Column(DateTime, nullable=True, index=True)
+    # 보관 코덱으로 변환해 저장소에 저장한 시각 (UTC); NULL이면 보관 대기 중이며 재시작 후 다시 처리됨
+    audio_archived_at = Column(DateTime, nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    whisper_result = Column(JSON, nullable=True)  # Store full whisper result
+    whisper_result = Column(JSON, nullable=True)  # Whisper result (slim by default, see WHISPER_RESULT_STORAGE)
+    # zlib-compressed full Whisper result; deferred so normal Answer loads never fetch it
+    whisper_result_detail = deferred(Column(LargeBinary, nullable=True))
+    audio_features = Column(JSON, nullable=True)  # Pitch/energy/pause features from the PCM
+
+    # Audio metrics computed once when the answer is saved
+    speech_rate = Column(Float, nullable=True)  # WPM (어절/분)
+    silence_ratio = Column(Float, nullable=True)  # %
+    duration = Column(Float, nullable=True)  # seconds
 
     question = relationship("Question", back_populates="answers")
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, BigInteger, String, Text, DateTime
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+class LLMResponseCache(Base):
+    """LLM 응답 캐시 (provider/model/프롬프트 해시/파라미터 → 응답 텍스트)"""
+    __tablename__ = "llm_response_cache"
+
+    cache_key = Column(String(64), primary_key=True)
+    provider = Column(String(20), nullable=False)
+    model = Column(String(100), nullable=False)
+    response_text = Column(Text, nullable=False)
+    hit_count = Column(BigInteger, nullable=False, default=0)
+    created_at = Column(DateTime, server_default=func.now())
+    expires_at = Column(DateTime, nullable=False, index=True)  # TTL 만료 시각
+    last_used_at = Column(DateTime, server_default=func.now(), index=True)  # LRU eviction 기준
@@ -1,5 +1,5 @@
 from sqlalchemy import Column, BigInteger, String, DateTime, Text, ForeignKey, Identity
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -11,12 +11,18 @@ class Resume(Base):
     title = Column(String(50), nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
-    content = Column(Text, nullable=True)
+    # 본문/분석 결과 컬럼은 수십 KB까지 커질 수 있으므로 기본적으로 지연 로딩 (group="text")
+    # 필요한 조회에서만 crud_resume의 상세 프로필로 함께 로딩합니다.
+    content = deferred(Column(Text, nullable=True), group="text")
     resume_file = Column(String(255), nullable=True)
 
     # 분석 결과를 저장할 컬럼 추가
-    corrected_content = Column(Text, nullable=True)
-    ai_feedback = Column(Text, nullable=True)
+    corrected_content = deferred(Column(Text, nullable=True), group="text")
+    ai_feedback = deferred(Column(Text, nullable=True), group="text")
+
+    # 중복 업로드 감지용 해시 (업로드 파일 원본 / 정규화된 추출 텍스트)
+    file_sha256 = Column(String(64), nullable=True, index=True)
+    content_sha256 = Column(String(64), nullable=True, index=True)
 
     owner = relationship("User")
     # 생성된 질문과의 관계 설정
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, BigInteger, String, Text, DateTime
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+class SpellCheckCache(Base):
+    """맞춤법 검사 결과 캐시 (정규화된 문장의 SHA-256 해시 → 교정 결과)"""
+    __tablename__ = "spell_check_cache"
+
+    line_hash = Column(String(64), primary_key=True)
+    checked_text = Column(Text, nullable=False)
+    hit_count = Column(BigInteger, nullable=False, default=0)
+    created_at = Column(DateTime, server_default=func.now())
+    last_used_at = Column(DateTime, server_default=func.now(), index=True)  # LRU eviction 기준
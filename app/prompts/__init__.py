@@ -6,13 +6,21 @@ LLM에 전달하는 프롬프트들을 중앙 관리합니다.
 from .interview_prompts import (
     get_question_generation_prompt,
     get_interview_analysis_prompt,
+    get_interview_analysis_user_prompt,
+    INTERVIEW_ANALYSIS_SYSTEM_PROMPT,
 )
 from .resume_prompts import (
     get_resume_feedback_prompt,
+    get_resume_feedback_user_prompt,
+    RESUME_FEEDBACK_SYSTEM_PROMPT,
 )
 
 __all__ = [
     "get_question_generation_prompt",
     "get_interview_analysis_prompt",
+    "get_interview_analysis_user_prompt",
+    "INTERVIEW_ANALYSIS_SYSTEM_PROMPT",
     "get_resume_feedback_prompt",
+    "get_resume_feedback_user_prompt",
+    "RESUME_FEEDBACK_SYSTEM_PROMPT",
 ]
\ No newline at end of file
@@ -92,81 +92,12 @@ def get_question_generation_prompt(resume_content: str, job_title: str = None, c
 위 자기소개서를 분석하고, JSON 형식으로 면접 질문을 생성해 주세요."""
 
 
-def get_interview_analysis_prompt(
-    resume_content: str,
-    conversation_history: str,
-    audio_analysis_summary: str,
-    video_analysis_summary: str,
-    avg_speech_rate: float = None,
-    avg_silence_ratio: float = None,
-    gaze_stability: float = None,
-    expression_stability: float = None,
-    posture_stability: float = None,
-) -> str:
-    """
-    면접 분석 리포트 생성 프롬프트
-
-    Args:
-        resume_content: 자기소개서 내용
-        conversation_history: Q&A 대화록
-        audio_analysis_summary: 음성 분석 요약
-        video_analysis_summary: 영상 분석 요약
-        avg_speech_rate: 평균 말하기 속도 (WPM)
-        avg_silence_ratio: 평균 침묵 비율 (%)
-        gaze_stability: 시선 안정성
-        expression_stability: 표정 안정성
-        posture_stability: 자세 안정성
-
-    Returns:
-        프롬프트 문자열
-    """
-
-    # 수치 해석 가이드 (한국어 어절 기준)
-    speech_guide = ""
-    if avg_speech_rate is not None:
-        if avg_speech_rate < 70:
-            speech_guide = " → 다소 느린 편입니다."
-        elif avg_speech_rate > 130:
-            speech_guide = " → 다소 빠른 편입니다."
-        else:
-            speech_guide = " → 적절한 속도입니다."
-
-    silence_guide = ""
-    if avg_silence_ratio is not None:
-        if avg_silence_ratio > 25:
-            silence_guide = " → 머뭇거림이 많은 편입니다."
-        elif avg_silence_ratio < 8:
-            silence_guide = " → 유창한 편입니다."
-        else:
-            silence_guide = " → 보통 수준입니다."
-
-    # None 값 처리: 포맷팅 가능한 문자열로 변환
-    speech_rate_str = f"{avg_speech_rate:.2f}" if avg_speech_rate is not None else "데이터 없음"
-    silence_ratio_str = f"{avg_silence_ratio:.2f}" if avg_silence_ratio is not None else "데이터 없음"
-    gaze_stability_str = f"{gaze_stability:.4f}" if gaze_stability is not None else "데이터 없음"
-    expression_stability_str = f"{expression_stability:.4f}" if expression_stability is not None else "데이터 없음"
-    posture_stability_str = f"{posture_stability:.4f}" if posture_stability is not None else "데이터 없음"
-
-    return f"""당신은 수많은 면접 경험을 가진 전문 채용 컨설턴트입니다. 당신의 임무는 아래 제공되는 지원자의 "자기소개서", "면접 대화록", "음성 분석 데이터", "영상 분석 데이터"를 종합적으로 분석하여, 지원자의 역량과 개선점에 대한 심층적인 피드백 리포트를 작성하는 것입니다.
+# 면접 분석 리포트의 고정 지시문 (역할/분석 기준/해석 가이드/예시/출력 형식)
+# 지원자별 데이터는 사용자 메시지로 분리하여, 이 블록을 프롬프트 캐시 접두사로 재사용합니다.
+INTERVIEW_ANALYSIS_SYSTEM_PROMPT = """당신은 수많은 면접 경험을 가진 전문 채용 컨설턴트입니다. 당신의 임무는 사용자 메시지로 제공되는 지원자의 "자기소개서", "면접 대화록", "음성 분석 데이터", "영상 분석 데이터"를 종합적으로 분석하여, 지원자의 역량과 개선점에 대한 심층적인 피드백 리포트를 작성하는 것입니다.
 
 반드시 아래의 "분석 기준"과 "출력 형식"을 엄격하게 준수하여 리포트를 작성해 주세요. (영상 분석 데이터가 없다면 해당 부분은 생략하고 리포트를 작성하세요.)
 
----
-## 자기소개서
-```
-{resume_content}
-```
-
----
-## 면접 대화록
-```
-{conversation_history}
-```
-
-{audio_analysis_summary}
-
-{video_analysis_summary}
-
 ---
 ## 분석 기준
 
@@ -188,15 +119,13 @@ def get_interview_analysis_prompt(
 ## 음성/영상 분석 데이터 해석 가이드
 
 **음성 분석:**
-- 평균 말하기 속도: {speech_rate_str} 어절/분{speech_guide}
-  (이상적 범위: 70-130 어절/분, 한국어 기준)
-- 머뭇거림 비율: {silence_ratio_str}%{silence_guide}
-  (낮을수록 유창함, 8% 미만: 유창, 25% 초과: 머뭇거림 많음)
+- 평균 말하기 속도: 이상적 범위는 70-130 어절/분 (한국어 기준)
+- 머뭇거림 비율: 낮을수록 유창함 (8% 미만: 유창, 25% 초과: 머뭇거림 많음)
 
 **영상 분석:** (모든 수치는 낮을수록 안정적)
-- 시선 안정성: {gaze_stability_str} (0.01 이하: 매우 안정, 0.03 이상: 불안정)
-- 표정 안정성: {expression_stability_str} (0.01 이하: 매우 안정, 0.03 이상: 불안정)
-- 자세 안정성: {posture_stability_str} (0.01 이하: 매우 안정, 0.03 이상: 불안정)
+- 시선 안정성: 0.01 이하: 매우 안정, 0.03 이상: 불안정
+- 표정 안정성: 0.01 이하: 매우 안정, 0.03 이상: 불안정
+- 자세 안정성: 0.01 이하: 매우 안정, 0.03 이상: 불안정
 
 ---
 ## 좋은 피드백 예시
@@ -246,20 +175,20 @@ def get_interview_analysis_prompt(
 - (두 번째 예시)
 
 **👎 개선할 점:**
-- (답변에서 아쉬웤던 부분과 자기소개서의 어떤 경험을 더 어필할 수 있었는지 제안)
+- (답변에서 아쉬웠던 부분과 자기소개서의 어떤 경험을 더 어필할 수 있었는지 제안)
 - (두 번째 예시)
 
 ### 3. 커뮤니케이션 스킬 (음성 및 영상 포함)
 **점수: [1-5점]**
 
 **음성 분석 결과:**
-- 평균 말하기 속도: {speech_rate_str} 어절/분{speech_guide}
-- 머뭇거림 비율: {silence_ratio_str}%{silence_guide}
+- 평균 말하기 속도: (측정 지표의 값과 해석을 그대로 기재)
+- 머뭇거림 비율: (측정 지표의 값과 해석을 그대로 기재)
 
 **영상 분석 결과:**
-- 시선 안정성: {gaze_stability_str}
-- 표정 안정성: {expression_stability_str}
-- 자세 안정성: {posture_stability_str}
+- 시선 안정성: (측정 지표의 값을 그대로 기재)
+- 표정 안정성: (측정 지표의 값을 그대로 기재)
+- 자세 안정성: (측정 지표의 값을 그대로 기재)
 
 **👍 잘한 점:**
 - (자신감 있는 표현, 안정적인 시선 처리, 긍정적인 표정 등 칭찬)
@@ -275,8 +204,126 @@ def get_interview_analysis_prompt(
 **총점: [1, 2, 3 항목의 점수를 합산하여 평균을 계산. 예: (4 + 4 + 3) / 3 = 3.7] / 5.0**
 
 **마지막 조언:**
-> 지원자가 다음 면접에서 최고의 성과를 낼 수 있도록, 가장 중요한 핵심 조언 한 가지를 격려의 메시지와 함께 전달해 주세요.
+> 지원자가 다음 면접에서 최고의 성과를 낼 수 있도록, 가장 중요한 핵심 조언 한 가지를 격려의 메시지와 함께 전달해 주세요."""
+
+
+def get_interview_analysis_user_prompt(
+    resume_content: str,
+    conversation_history: str,
+    audio_analysis_summary: str,
+    video_analysis_summary: str,
+    avg_speech_rate: float = None,
+    avg_silence_ratio: float = None,
+    gaze_stability: float = None,
+    expression_stability: float = None,
+    posture_stability: float = None,
+) -> str:
+    """
+    면접 분석 리포트 생성 프롬프트의 가변 부분 (지원자별 데이터)
+
+    Args:
+        resume_content: 자기소개서 내용
+        conversation_history: Q&A 대화록
+        audio_analysis_summary: 음성 분석 요약
+        video_analysis_summary: 영상 분석 요약
+        avg_speech_rate: 평균 말하기 속도 (WPM)
+        avg_silence_ratio: 평균 침묵 비율 (%)
+        gaze_stability: 시선 안정성
+        expression_stability: 표정 안정성
+        posture_stability: 자세 안정성
+
+    Returns:
+        사용자 메시지 문자열
+    """
+
+    # 수치 해석 가이드 (한국어 어절 기준)
+    speech_guide = ""
+    if avg_speech_rate is not None:
+        if avg_speech_rate < 70:
+            speech_guide = " → 다소 느린 편입니다."
+        elif avg_speech_rate > 130:
+            speech_guide = " → 다소 빠른 편입니다."
+        else:
+            speech_guide = " → 적절한 속도입니다."
+
+    silence_guide = ""
+    if avg_silence_ratio is not None:
+        if avg_silence_ratio > 25:
+            silence_guide = " → 머뭇거림이 많은 편입니다."
+        elif avg_silence_ratio < 8:
+            silence_guide = " → 유창한 편입니다."
+        else:
+            silence_guide = " → 보통 수준입니다."
+
+    # None 값 처리: 포맷팅 가능한 문자열로 변환
+    speech_rate_str = f"{avg_speech_rate:.2f}" if avg_speech_rate is not None else "데이터 없음"
+    silence_ratio_str = f"{avg_silence_ratio:.2f}" if avg_silence_ratio is not None else "데이터 없음"
+    gaze_stability_str = f"{gaze_stability:.4f}" if gaze_stability is not None else "데이터 없음"
+    expression_stability_str = f"{expression_stability:.4f}" if expression_stability is not None else "데이터 없음"
+    posture_stability_str = f"{posture_stability:.4f}" if posture_stability is not None else "데이터 없음"
+
+    return f"""## 자기소개서
+```
+{resume_content}
+```
+
+---
+## 면접 대화록
+```
+{conversation_history}
+```
+
+{audio_analysis_summary}
+
+{video_analysis_summary}
+
+---
+## 측정 지표
+
+**음성 분석:**
+- 평균 말하기 속도: {speech_rate_str} 어절/분{speech_guide}
+- 머뭇거림 비율: {silence_ratio_str}%{silence_guide}
+
+**영상 분석:**
+- 시선 안정성: {gaze_stability_str}
+- 표정 안정성: {expression_stability_str}
+- 자세 안정성: {posture_stability_str}
 
 ---
 
-위 형식에 맞춰 지원자의 면접을 분석하고 피드백을 생성해 주세요."""
\ No newline at end of file
+지시된 출력 형식에 맞춰 지원자의 면접을 분석하고 피드백을 생성해 주세요."""
+
+
+def get_interview_analysis_prompt(
+    resume_content: str,
+    conversation_history: str,
+    audio_analysis_summary: str,
+    video_analysis_summary: str,
+    avg_speech_rate: float = None,
+    avg_silence_ratio: float = None,
+    gaze_stability: float = None,
+    expression_stability: float = None,
+    posture_stability: float = None,
+) -> str:
+    """
+    면접 분석 리포트 생성 프롬프트 (system 블록 없이 단일 문자열로 보낼 때 사용)
+
+    Args:
+        get_interview_analysis_user_prompt와 동일
+
+    Returns:
+        프롬프트 문자열
+    """
+
+    user_prompt = get_interview_analysis_user_prompt(
+        resume_content=resume_content,
+        conversation_history=conversation_history,
+        audio_analysis_summary=audio_analysis_summary,
+        video_analysis_summary=video_analysis_summary,
+        avg_speech_rate=avg_speech_rate,
+        avg_silence_ratio=avg_silence_ratio,
+        gaze_stability=gaze_stability,
+        expression_stability=expression_stability,
+        posture_stability=posture_stability,
+    )
+    return f"{INTERVIEW_ANALYSIS_SYSTEM_PROMPT}\n\n---\n\n{user_prompt}"
@@ -2,18 +2,9 @@
 서류(자기소개서) 관련 프롬프트
 """
 
-def get_resume_feedback_prompt(corrected_content: str) -> str:
-    """
-    자기소개서 피드백 생성 프롬프트
-
-    Args:
-        corrected_content: 맞춤법 교정된 자기소개서 내용
-
-    Returns:
-        프롬프트 문자열
-    """
-
-    return f"""당신은 수많은 지원자를 평가해 온 베테랑 채용 담당자입니다. 당신의 임무는 지원자의 자기소개서를 분석하고, 합격 가능성을 높일 수 있도록 구체적이고 건설적인 피드백을 제공하는 것입니다. 반드시 아래의 규칙과 출력 형식을 엄격하게 준수하여 답변해야 합니다.
+# 자기소개서 피드백의 고정 지시문 (역할/규칙/평가 기준/예시/출력 형식)
+# 모든 호출에서 동일하므로 system 블록으로 보내 프롬프트 캐시 접두사로 재사용합니다.
+RESUME_FEEDBACK_SYSTEM_PROMPT = """당신은 수많은 지원자를 평가해 온 베테랑 채용 담당자입니다. 당신의 임무는 지원자의 자기소개서를 분석하고, 합격 가능성을 높일 수 있도록 구체적이고 건설적인 피드백을 제공하는 것입니다. 반드시 아래의 규칙과 출력 형식을 엄격하게 준수하여 답변해야 합니다.
 
 ## 규칙
 
@@ -100,14 +91,38 @@ def get_resume_feedback_prompt(corrected_content: str) -> str:
 
 ### 📝 총평
 
-(자기소개서 전체에 대한 핵심적인 인상과 종합 평가를 2-3문장으로 요약합니다. 전체적인 강점과 개선 후 기대되는 효과를 언급하세요.)
+(자기소개서 전체에 대한 핵심적인 인상과 종합 평가를 2-3문장으로 요약합니다. 전체적인 강점과 개선 후 기대되는 효과를 언급하세요.)"""
 
----
 
-## 지원자 자기소개서
+def get_resume_feedback_user_prompt(corrected_content: str) -> str:
+    """
+    자기소개서 피드백 생성 프롬프트의 가변 부분 (지원자별 내용)
+
+    Args:
+        corrected_content: 맞춤법 교정된 자기소개서 내용
+
+    Returns:
+        사용자 메시지 문자열
+    """
+
+    return f"""## 지원자 자기소개서
 
 ```
 {corrected_content}
 ```
 
-위 자기소개서를 분석하고 위 형식에 맞춰 피드백을 생성해 주세요."""
\ No newline at end of file
+위 자기소개서를 분석하고 지시된 출력 형식에 맞춰 피드백을 생성해 주세요."""
+
+
+def get_resume_feedback_prompt(corrected_content: str) -> str:
+    """
+    자기소개서 피드백 생성 프롬프트 (system 블록 없이 단일 문자열로 보낼 때 사용)
+
+    Args:
+        corrected_content: 맞춤법 교정된 자기소개서 내용
+
+    Returns:
+        프롬프트 문자열
+    """
+
+    return f"{RESUME_FEEDBACK_SYSTEM_PROMPT}\n\n---\n\n{get_resume_feedback_user_prompt(corrected_content)}"
@@ -1,4 +1,7 @@
-from pydantic import BaseModel
+import re
+from typing import List, Literal
+
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 class GeneratedQuestionBase(BaseModel):
     resume_id: int
@@ -12,3 +15,52 @@ class GeneratedQuestion(GeneratedQuestionBase):
 
     class Config:
         from_attributes = True
+
+
+# --- LLM 질문 생성 결과 (구조화 출력 검증용) ---
+
+COMMON_QUESTION_PREFIX = "[공통]"
+PRESSURE_QUESTION_PREFIX = "🌶️"
+
+class GeneratedQuestionItem(BaseModel):
+    text: str = Field(min_length=5, max_length=500)
+    type: Literal["resume", "common"] = "resume"
+    is_pressure: bool = False
+
+    @field_validator("text", mode="before")
+    @classmethod
+    def strip_numbering(cls, value):
+        # "1. 질문" 형태의 번호와 앞뒤 공백 제거 (태그와 이모티콘은 유지)
+        if isinstance(value, str):
+            value = re.sub(r'^\s*\d+[.)]\s*', '', value).strip()
+        return value
+
+    @model_validator(mode="after")
+    def ensure_prefixes(self):
+        # 프론트엔드는 접두사로 질문 유형을 구분하므로 누락된 접두사를 보정
+        if self.type == "common" and COMMON_QUESTION_PREFIX not in self.text:
+            self.text = f"{COMMON_QUESTION_PREFIX} {self.text}"
+        if self.is_pressure and PRESSURE_QUESTION_PREFIX not in self.text:
+            self.text = f"{PRESSURE_QUESTION_PREFIX} {self.text}"
+        return self
+
+MIN_GENERATED_QUESTIONS = 3
+
+class GeneratedQuestionSet(BaseModel):
+    questions: List[GeneratedQuestionItem] = Field(min_length=MIN_GENERATED_QUESTIONS, max_length=20)
+
+    @model_validator(mode="after")
+    def drop_duplicates(self):
+        # 중복 제거 후에도 최소 질문 수를 만족해야 함 (부족하면 ValidationError로 재시도)
+        seen = set()
+        unique = []
+        for question in self.questions:
+            if question.text not in seen:
+                seen.add(question.text)
+                unique.append(question)
+        if len(unique) < MIN_GENERATED_QUESTIONS:
+            raise ValueError(
+                f"Expected at least {MIN_GENERATED_QUESTIONS} unique questions, got {len(unique)}"
+            )
+        self.questions = unique
+        return self
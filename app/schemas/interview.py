@@ -25,6 +25,11 @@ class AnswerBase(BaseModel):
 class AnswerCreate(AnswerBase):
     question_id: int
     whisper_result: Optional[Dict[str, Any]] = None
+    whisper_result_detail: Optional[bytes] = None
+    audio_features: Optional[Dict[str, Any]] = None
+    speech_rate: Optional[float] = None
+    silence_ratio: Optional[float] = None
+    duration: Optional[float] = None
 
 class AnswerUpdate(AnswerBase):
     pass
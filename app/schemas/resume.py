@@ -26,6 +26,17 @@ class Resume(ResumeBase):
     class Config:
         from_attributes = True
 
+class ResumeSummary(BaseModel):
+    """List view: metadata only, without the (potentially large) text columns."""
+    resume_id: int
+    user_id: int
+    title: str
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class ResumeDetail(Resume):
     corrected_content: Optional[str] = None
     ai_feedback: Optional[str] = None
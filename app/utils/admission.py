@@ -0,0 +1,229 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+from app.core.config import (
+    REDIS_URL,
+    SESSION_STORE_BACKEND,
+    INTERVIEW_MAX_ACTIVE_SESSIONS,
+    INTERVIEW_MAX_QUEUED_SESSIONS,
+    INTERVIEW_QUEUE_TIMEOUT_SECONDS,
+    INTERVIEW_QUEUE_UPDATE_SECONDS,
+    INTERVIEW_ADMISSION_LEASE_SECONDS,
+)
+
+
+class AdmissionRejected(Exception):
+    """The wait queue is full, or the candidate waited longer than the queue timeout."""
+
+
+class AdmissionController:
+    """
+    Caps the number of live interview sessions.
+
+    Every admitted session keeps transcribing answers until it ends, so the cap
+    is the transcription capacity expressed in sessions. Up to `max_active`
+    sessions run at once; later candidates wait in a FIFO queue and are told
+    their position, instead of every session slowing down together.
+
+    This class counts sessions of this process only, so with several workers
+    `max_active` must be the capacity divided by the worker count. See
+    RedisAdmissionController for a limit shared by all workers.
+    """
+
+    def __init__(
+        self,
+        max_active: int = INTERVIEW_MAX_ACTIVE_SESSIONS,
+        max_queued: int = INTERVIEW_MAX_QUEUED_SESSIONS,
+        queue_timeout: float = INTERVIEW_QUEUE_TIMEOUT_SECONDS,
+        update_interval: float = INTERVIEW_QUEUE_UPDATE_SECONDS,
+    ):
+        self.max_active = max_active
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.update_interval = update_interval
+        self.active = 0
+        self._waiters: Deque[object] = deque()
+        # 슬롯이 반납되면 대기자 전체를 깨움 (맨 앞 대기자만 슬롯을 가져감)
+        self._released = asyncio.Event()
+        self._stats = {"admitted": 0, "queued": 0, "rejected": 0, "timed_out": 0, "abandoned": 0}
+        self._waits: Deque[float] = deque(maxlen=1000)
+
+    async def _try_take(self, lease_id: str) -> bool:
+        if self.active >= self.max_active:
+            return False
+        self.active += 1
+        return True
+
+    async def _give_back(self, lease_id: str) -> None:
+        self.active = max(0, self.active - 1)
+
+    def _notify(self) -> None:
+        self._released.set()
+        self._released.clear()
+
+    def position(self, waiter: object) -> int:
+        """1-based position of a waiter in the queue."""
+        for index, queued in enumerate(self._waiters):
+            if queued is waiter:
+                return index + 1
+        return 0
+
+    async def acquire(self, lease_id: str, on_position: Optional[Callable[[int, int], Awaitable[None]]] = None) -> float:
+        """
+        Waits for a session slot held as `lease_id` (pass the same ID to
+        release()); returns the seconds spent waiting.
+
+        on_position(position, queue_length) is awaited when the candidate is
+        queued and whenever its position changes (checked every update_interval).
+        Raises AdmissionRejected when the queue is full or the wait times out.
+        """
+        if not self._waiters and await self._try_take(lease_id):
+            self._stats["admitted"] += 1
+            self._waits.append(0.0)
+            return 0.0
+        if len(self._waiters) >= self.max_queued:
+            self._stats["rejected"] += 1
+            raise AdmissionRejected("Interview waiting queue is full")
+
+        waiter = object()
+        self._waiters.append(waiter)
+        self._stats["queued"] += 1
+        started = time.monotonic()
+        last_position = None
+        try:
+            while True:
+                current = self.position(waiter)
+                if current == 1 and await self._try_take(lease_id):
+                    break
+                if on_position is not None and current != last_position:
+                    last_position = current
+                    await on_position(current, len(self._waiters))
+                remaining = self.queue_timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._stats["timed_out"] += 1
+                    raise AdmissionRejected(f"Waited more than {self.queue_timeout:.0f}s for a free interview slot")
+                # 다른 프로세스에서 반납된 슬롯은 알림이 없으므로 update_interval마다 다시 확인
+                try:
+                    await asyncio.wait_for(self._released.wait(), timeout=min(self.update_interval, remaining))
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException as e:
+            if not isinstance(e, AdmissionRejected):
+                self._stats["abandoned"] += 1
+            raise
+        finally:
+            was_first = self.position(waiter) == 1
+            self._waiters.remove(waiter)
+            if was_first:
+                # 다음 대기자가 남은 슬롯을 바로 확인하도록 깨움
+                self._notify()
+
+        waited = time.monotonic() - started
+        self._stats["admitted"] += 1
+        self._waits.append(waited)
+        return waited
+
+    async def release(self, lease_id: str) -> None:
+        await self._give_back(lease_id)
+        self._notify()
+
+    async def count_active(self) -> int:
+        """Sessions holding a slot under this controller's limit."""
+        return self.active
+
+    async def get_stats(self) -> Dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "max_active": self.max_active,
+            "active": await self.count_active(),
+            "queue_depth": len(self._waiters),
+            "max_queued": self.max_queued,
+            **self._stats,
+            "wait_seconds": {
+                "samples": len(waits),
+                "avg": round(sum(waits) / len(waits), 2) if waits else 0.0,
+                "p95": round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 2) if waits else 0.0,
+                "max": round(waits[-1], 2) if waits else 0.0,
+            },
+        }
+
+
+# 만료된 임대를 지우고, 남은 슬롯이 있으면 임대를 추가하는 Lua 스크립트 (이미 가진 임대는 갱신)
+_TAKE_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[2])
+if not redis.call('ZSCORE', KEYS[1], ARGV[1]) and redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[4]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+return 1
+"""
+
+
+class RedisAdmissionController(AdmissionController):
+    """
+    Admission with `max_active` shared by every worker and node.
+
+    Slots are leases in a Redis sorted set (member: lease ID, score: expiry).
+    Held leases are renewed in the background; a worker that dies without
+    releasing only blocks its slots until the leases expire. The wait queue
+    is still per process, so FIFO order holds within a worker, and queued
+    candidates notice slots freed elsewhere within update_interval.
+    """
+
+    key = "interview_admission:leases"
+
+    def __init__(self, url: str = REDIS_URL, lease_seconds: int = INTERVIEW_ADMISSION_LEASE_SECONDS, **kwargs):
+        import redis.asyncio as aioredis
+
+        super().__init__(**kwargs)
+        self.lease_seconds = lease_seconds
+        self._redis = aioredis.Redis.from_url(url, decode_responses=True)
+        self._take = self._redis.register_script(_TAKE_SCRIPT)
+        self._held: Set[str] = set()
+        self._renewer: Optional[asyncio.Task] = None
+
+    async def _try_take(self, lease_id):
+        now = time.time()
+        taken = await self._take(keys=[self.key], args=[lease_id, now, now + self.lease_seconds, self.max_active])
+        if not taken:
+            return False
+        self._held.add(lease_id)
+        self.active = len(self._held)
+        if self._renewer is None or self._renewer.done():
+            self._renewer = asyncio.create_task(self._renew_leases())
+        return True
+
+    async def _give_back(self, lease_id):
+        self._held.discard(lease_id)
+        self.active = len(self._held)
+        try:
+            await self._redis.zrem(self.key, lease_id)
+        except Exception as e:
+            # 반납하지 못한 임대는 lease_seconds 후 만료됨
+            print(f"Failed to release interview admission lease {lease_id}: {e}")
+
+    async def _renew_leases(self) -> None:
+        while self._held:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not self._held:
+                break
+            expires_at = time.time() + self.lease_seconds
+            try:
+                await self._redis.zadd(self.key, {lease_id: expires_at for lease_id in self._held}, xx=True)
+            except Exception as e:
+                print(f"Failed to renew interview admission leases: {e}")
+
+    async def count_active(self) -> int:
+        return await self._redis.zcount(self.key, time.time(), "+inf")
+
+
+def create_admission_controller() -> AdmissionController:
+    """Cluster-wide limit when sessions are shared through Redis, per-process otherwise."""
+    if SESSION_STORE_BACKEND == "redis":
+        return RedisAdmissionController()
+    return AdmissionController()
+
+
+interview_admission = create_admission_controller()
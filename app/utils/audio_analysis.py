@@ -1,4 +1,11 @@
+import asyncio
 import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from app.core.config import AUDIO_ANALYSIS_WORKERS
+
+_executor: Optional[ProcessPoolExecutor] = None
 
 def analyze_whisper_result(whisper_result: dict):
     """
@@ -42,6 +49,9 @@ def analyze_whisper_result(whisper_result: dict):
     if segments[0]["start"] > 0:
         silence_duration += segments[0]["start"]
 
+    # Pauses removed by VAD before transcription that fall inside a segment
+    silence_duration += sum(seg.get("removed_silence", 0.0) for seg in segments)
+
     # Calculate silence ratio
     # Note: If there's only 1 segment with no gaps, silence_ratio will be minimal
     # We can also use no_speech_prob as an indicator
@@ -57,3 +67,46 @@ def analyze_whisper_result(whisper_result: dict):
             silence_ratio += avg_no_speech_prob * 10  # Scale factor for adjustment
 
     return wpm, silence_ratio
+
+
+def summarize_whisper_result(whisper_result: dict) -> Dict[str, Optional[float]]:
+    """
+    Computes the per-answer audio metrics that are persisted on the Answer row
+    when the answer is saved, so reports never need to re-read whisper_result.
+
+    Returns:
+        {"speech_rate": WPM, "silence_ratio": %, "duration": seconds}
+        All values are None when there is no transcription result.
+    """
+    if not whisper_result:
+        return {"speech_rate": None, "silence_ratio": None, "duration": None}
+
+    speech_rate, silence_ratio = analyze_whisper_result(whisper_result)
+    segments = whisper_result.get("segments") or []
+    duration = float(segments[-1]["end"]) if segments else 0.0
+
+    return {
+        "speech_rate": float(speech_rate),
+        "silence_ratio": float(silence_ratio),
+        "duration": duration,
+    }
+
+
+def _extract_features_in_worker(audio_path: str) -> Dict[str, Any]:
+    # numpy/librosa는 워커 프로세스에서만 import (API 프로세스의 시작 시간 단축)
+    from app.utils.audio_features import extract_audio_features
+    return extract_audio_features(audio_path)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Lazily creates the shared worker pool for audio feature extraction."""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=AUDIO_ANALYSIS_WORKERS)
+    return _executor
+
+
+async def extract_audio_features_async(audio_path: str) -> Dict[str, Any]:
+    """Runs extract_audio_features in the worker pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _extract_features_in_worker, audio_path)
@@ -0,0 +1,258 @@
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set, Tuple
+
+from app import crud
+from app.core.config import (
+    AUDIO_ARCHIVE_FORMAT,
+    AUDIO_TRANSCODE_WORKERS,
+    AUDIO_ARCHIVE_RETRY_MINUTES,
+    AUDIO_MAX_RETENTION_MINUTES,
+    AUDIO_SWEEP_BATCH_SIZE,
+)
+from app.db.session import SessionLocal
+from app.utils.audio_storage import AudioStorage, get_audio_storage, new_audio_key
+
+# format -> (soundfile container, subtype, key suffix)
+ARCHIVE_CODECS = {
+    "opus": ("OGG", "OPUS", ".opus"),
+    "flac": ("FLAC", "PCM_16", ".flac"),
+    "wav": (None, None, ".wav"),
+}
+# libsndfile의 Opus 인코더가 지원하는 샘플레이트 (그 외에는 FLAC으로 보관)
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+_BLOCK_FRAMES = 65536
+# 보관 대기 중인 WAV는 답변 ID로 이름을 붙여 스테이징 디렉터리에 둠 (재시작 후 다시 찾을 수 있도록)
+_PENDING_NAME = re.compile(r"^answer-(\d+)\.wav$")
+
+
+def pending_wav_path(storage: AudioStorage, answer_id: int) -> str:
+    """Staging path of an answer's WAV while it waits to be archived."""
+    return os.path.join(storage.staging_dir, f"answer-{answer_id}.wav")
+
+
+def pending_answer_id(path: str) -> Optional[int]:
+    """The answer a staging file is waiting to be archived for, if it is a pending WAV."""
+    match = _PENDING_NAME.match(os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+
+def archive_suffix(archive_format: str = AUDIO_ARCHIVE_FORMAT) -> str:
+    """Key suffix for audio archived in `archive_format`."""
+    return ARCHIVE_CODECS[archive_format][2]
+
+
+def transcode_wav(wav_path: str, output_path: str, archive_format: str) -> float:
+    """
+    Streams a WAV file into the archival codec block by block (bounded memory).
+    Returns the audio duration in seconds.
+    """
+    import soundfile as sf
+
+    container, subtype, _ = ARCHIVE_CODECS[archive_format]
+    with sf.SoundFile(wav_path) as source:
+        duration = source.frames / source.samplerate
+        with sf.SoundFile(
+            output_path, "w",
+            samplerate=source.samplerate, channels=source.channels,
+            format=container, subtype=subtype,
+        ) as target:
+            for block in source.blocks(blocksize=_BLOCK_FRAMES, dtype="float32", always_2d=True):
+                target.write(block)
+    return duration
+
+
+class AudioArchiver:
+    """
+    Background transcoding of answer audio from the analysis WAV to a compact
+    archival codec (AUDIO_ARCHIVE_FORMAT: opus | flac | wav).
+
+    The answer row is saved with the archive key right away; the job then
+    stores the compressed copy under that key, sets answer.audio_archived_at
+    and drops the staged PCM. If transcoding fails, the WAV is stored instead
+    and the answer's key updated. Jobs only live in memory, so the staged WAV
+    is kept under the answer's ID until then and requeue_pending() picks up
+    answers left unarchived by a restart.
+    Totals (bytes in/out, audio seconds, transcode time) feed get_stats().
+    """
+
+    def __init__(self, archive_format: str = AUDIO_ARCHIVE_FORMAT, workers: int = AUDIO_TRANSCODE_WORKERS):
+        if archive_format not in ARCHIVE_CODECS:
+            raise ValueError(f"Unknown AUDIO_ARCHIVE_FORMAT: {archive_format}")
+        self.archive_format = archive_format
+        self.workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued: Set[int] = set()
+        self._stats = {
+            "files": 0, "failed": 0, "fallback_flac": 0,
+            "input_bytes": 0, "output_bytes": 0,
+            "audio_seconds": 0.0, "transcode_seconds": 0.0,
+        }
+
+    def new_key(self) -> str:
+        return new_audio_key(archive_suffix(self.archive_format))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="audio-archive")
+            return self._executor
+
+    def submit(self, wav_path: str, key: str, answer_id: int) -> None:
+        """Queues archiving of a staged WAV that was saved on answer `answer_id` as `key`."""
+        pending_path = pending_wav_path(get_audio_storage(), answer_id)
+        if wav_path != pending_path:
+            os.replace(wav_path, pending_path)
+        with self._lock:
+            self._queued.add(answer_id)
+        self._get_executor().submit(self._archive, pending_path, key, answer_id)
+
+    def requeue_pending(
+        self,
+        retry_after_minutes: int = AUDIO_ARCHIVE_RETRY_MINUTES,
+        limit: int = AUDIO_SWEEP_BATCH_SIZE,
+    ) -> int:
+        """
+        Queues again answers whose archiving did not finish (lost in a restart,
+        or failed) and whose pending WAV is on this host. Returns the count.
+        """
+        storage = get_audio_storage()
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            rows = crud.interview.get_pending_audio_archives(
+                db,
+                # 최대 보관 시간이 지난 음성은 만료 정리 대상이므로 제외
+                created_after=now - timedelta(minutes=AUDIO_MAX_RETENTION_MINUTES),
+                created_before=now - timedelta(minutes=retry_after_minutes),
+                limit=limit,
+            )
+        finally:
+            db.close()
+
+        requeued = 0
+        for answer_id, key in rows:
+            with self._lock:
+                if answer_id in self._queued:
+                    continue
+            wav_path = pending_wav_path(storage, answer_id)
+            # 다른 호스트에서 받은 답변은 그 호스트가 처리
+            if os.path.exists(wav_path):
+                self.submit(wav_path, key, answer_id)
+                requeued += 1
+        return requeued
+
+    def _transcode(self, storage: AudioStorage, wav_path: str) -> Tuple[str, str, float]:
+        """Returns (staged output path, format actually used, audio seconds)."""
+        archive_format = self.archive_format
+        if archive_format == "opus":
+            import soundfile as sf
+
+            if sf.info(wav_path).samplerate not in OPUS_SAMPLE_RATES:
+                archive_format = "flac"
+        output_path = storage.staging_path(archive_suffix(archive_format))
+        try:
+            duration = transcode_wav(wav_path, output_path, archive_format)
+        except Exception:
+            storage.discard_staging(output_path)
+            raise
+        return output_path, archive_format, duration
+
+    def _archive(self, wav_path: str, key: str, answer_id: int) -> None:
+        storage = get_audio_storage()
+        try:
+            if not os.path.exists(wav_path):
+                # 다른 프로세스가 이미 보관을 끝냄
+                return
+            if self.archive_format == "wav":
+                storage.commit(wav_path, key)
+                self._mark_archived(answer_id)
+                return
+
+            input_bytes = os.path.getsize(wav_path)
+            started = time.perf_counter()
+            try:
+                output_path, used_format, duration = self._transcode(storage, wav_path)
+            except Exception as e:
+                print(f"Audio transcoding failed for answer {answer_id}, keeping WAV: {e}")
+                self._store_fallback(storage, wav_path, answer_id)
+                with self._lock:
+                    self._stats["failed"] += 1
+                return
+            elapsed = time.perf_counter() - started
+
+            if used_format != self.archive_format:
+                # 키의 확장자와 실제 코덱을 맞추기 위해 새 키로 저장하고 답변을 갱신
+                key = new_audio_key(archive_suffix(used_format))
+                self._update_answer_key(answer_id, key)
+            output_bytes = os.path.getsize(output_path)
+            storage.commit(output_path, key)
+            self._mark_archived(answer_id)
+            storage.discard_staging(wav_path)
+
+            with self._lock:
+                self._stats["files"] += 1
+                self._stats["fallback_flac"] += used_format != self.archive_format
+                self._stats["input_bytes"] += input_bytes
+                self._stats["output_bytes"] += output_bytes
+                self._stats["audio_seconds"] += duration
+                self._stats["transcode_seconds"] += elapsed
+            print(
+                f"Archived answer {answer_id} audio as {used_format}: "
+                f"{input_bytes / 1024:.0f}KB -> {output_bytes / 1024:.0f}KB "
+                f"({input_bytes / max(output_bytes, 1):.1f}x), "
+                f"{duration:.1f}s audio in {elapsed:.2f}s ({duration / max(elapsed, 1e-6):.0f}x realtime)"
+            )
+        except Exception as e:
+            # 보관 대기 WAV는 남겨 두어 requeue_pending()이 다시 시도
+            print(f"Failed to archive audio for answer {answer_id}, will retry: {e}")
+        finally:
+            with self._lock:
+                self._queued.discard(answer_id)
+
+    def _store_fallback(self, storage: AudioStorage, wav_path: str, answer_id: int) -> None:
+        wav_key = new_audio_key(".wav")
+        # 답변이 먼저 새 키를 가리키게 해야 저장소에 참조 없는 객체가 남지 않음
+        self._update_answer_key(answer_id, wav_key)
+        storage.commit(wav_path, wav_key)
+        self._mark_archived(answer_id)
+
+    @staticmethod
+    def _update_answer_key(answer_id: int, key: str) -> None:
+        db = SessionLocal()
+        try:
+            crud.interview.set_audio_path(db, answer_id=answer_id, audio_path=key)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _mark_archived(answer_id: int) -> None:
+        db = SessionLocal()
+        try:
+            crud.interview.mark_audio_archived(db, answer_id=answer_id)
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        saved = stats["input_bytes"] - stats["output_bytes"]
+        stats.update({
+            "archive_format": self.archive_format,
+            "saved_bytes": saved,
+            "compression_ratio": round(stats["input_bytes"] / stats["output_bytes"], 2) if stats["output_bytes"] else None,
+            # 변환 처리량: 초당 처리한 오디오 길이(배속)와 입력 MB/s
+            "realtime_factor": round(stats["audio_seconds"] / stats["transcode_seconds"], 1) if stats["transcode_seconds"] else None,
+            "input_mb_per_second": round(stats["input_bytes"] / 1e6 / stats["transcode_seconds"], 2) if stats["transcode_seconds"] else None,
+        })
+        stats["audio_seconds"] = round(stats["audio_seconds"], 2)
+        stats["transcode_seconds"] = round(stats["transcode_seconds"], 3)
+        return stats
+
+
+audio_archiver = AudioArchiver()
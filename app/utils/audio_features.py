@@ -0,0 +1,232 @@
+import os
+import struct
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+# Frame geometry (seconds). 40ms windows with a 10ms hop are long enough for
+# YIN to resolve the lowest speaking pitch while keeping a fine time grid.
+FRAME_SECONDS = 0.04
+HOP_SECONDS = 0.01
+
+# Speaking pitch range (Hz)
+PITCH_FMIN = 70.0
+PITCH_FMAX = 400.0
+
+# A frame is treated as silent when it is this many dB below the loudest frame
+SILENCE_DB_BELOW_PEAK = 35.0
+# Minimum gap between speech frames to be counted as a pause
+PAUSE_MIN_SECONDS = 0.3
+# Sustained, flat-pitch voicing ("음...", "어...") long enough to be a filled pause
+FILLER_MIN_SECONDS = 0.35
+FILLER_MAX_SEMITONE_STEP = 0.35
+# Window size used for the speech-rate curve
+RATE_WINDOW_SECONDS = 5.0
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_IEEE_FLOAT = 3
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def _memmap_wav(path: str) -> Tuple[Optional[np.ndarray], int]:
+    """
+    Memory-maps the PCM payload of a RIFF/WAVE file without reading it into memory.
+
+    Returns (samples, sample_rate) where samples has shape (frames, channels),
+    or (None, 0) when the encoding cannot be mapped directly (e.g. 24-bit PCM).
+    """
+    with open(path, "rb") as f:
+        riff, _, wave = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            return None, 0
+
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None, 0
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                fmt_bytes = f.read(chunk_size)
+                audio_format, channels, sample_rate = struct.unpack("<HHI", fmt_bytes[:8])
+                bits_per_sample = struct.unpack("<H", fmt_bytes[14:16])[0]
+                if audio_format == _WAVE_FORMAT_EXTENSIBLE and len(fmt_bytes) >= 26:
+                    audio_format = struct.unpack("<H", fmt_bytes[24:26])[0]
+                fmt = (audio_format, channels, sample_rate, bits_per_sample)
+            elif chunk_id == b"data":
+                data_offset = f.tell()
+                data_size = chunk_size
+                break
+            else:
+                f.seek(chunk_size, 1)
+            # Chunks are word aligned
+            if chunk_size % 2:
+                f.seek(1, 1)
+
+    if fmt is None:
+        return None, 0
+
+    audio_format, channels, sample_rate, bits_per_sample = fmt
+    dtype_map = {
+        (_WAVE_FORMAT_PCM, 16): np.int16,
+        (_WAVE_FORMAT_PCM, 32): np.int32,
+        (_WAVE_FORMAT_IEEE_FLOAT, 32): np.float32,
+    }
+    dtype = dtype_map.get((audio_format, bits_per_sample))
+    if dtype is None or channels == 0:
+        return None, 0
+
+    # Streamed writers may leave a placeholder size; never map past the end of file
+    data_size = min(data_size, os.path.getsize(path) - data_offset)
+    itemsize = np.dtype(dtype).itemsize
+    num_frames = data_size // (itemsize * channels)
+    if num_frames == 0:
+        return np.zeros((0, channels), dtype=dtype), sample_rate
+
+    samples = np.memmap(path, dtype=dtype, mode="r", offset=data_offset, shape=(num_frames, channels))
+    return samples, sample_rate
+
+
+def _load_mono(path: str) -> Tuple[np.ndarray, int]:
+    """Loads a WAV file as a float32 mono signal in [-1, 1]."""
+    samples, sample_rate = _memmap_wav(path)
+    if samples is None:
+        # Encodings that cannot be memory-mapped fall back to soundfile
+        import soundfile as sf
+        data, sample_rate = sf.read(path, dtype="float32", always_2d=True)
+        return data.mean(axis=1), sample_rate
+
+    if np.issubdtype(samples.dtype, np.integer):
+        scale = float(np.iinfo(samples.dtype).max) + 1.0
+    else:
+        scale = 1.0
+    # Down-mix and normalise in a single vectorised pass over the mapped pages
+    mono = samples.mean(axis=1, dtype=np.float32) / np.float32(scale)
+    return mono, sample_rate
+
+
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns (starts, lengths) of consecutive True runs in a boolean array."""
+    if mask.size == 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+    padded = np.concatenate(([False], mask, [False])).astype(np.int8)
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return starts, ends - starts
+
+
+def _speech_rate_curve(rms_db: np.ndarray, speech_mask: np.ndarray, hop_seconds: float) -> List[float]:
+    """
+    Estimates syllables per second over fixed windows.
+    Syllable nuclei are approximated as local energy peaks inside speech frames.
+    """
+    if rms_db.size < 3:
+        return []
+
+    # Light smoothing so that a single syllable does not produce several peaks
+    kernel = np.ones(5, dtype=np.float32) / 5
+    smooth = np.convolve(rms_db, kernel, mode="same")
+    is_peak = np.zeros_like(speech_mask)
+    is_peak[1:-1] = (smooth[1:-1] > smooth[:-2]) & (smooth[1:-1] >= smooth[2:])
+    is_peak &= speech_mask
+
+    # Enforce a minimum distance of 100ms between nuclei (max ~10 syllables/s)
+    min_distance = max(1, int(round(0.1 / hop_seconds)))
+    peak_idx = np.flatnonzero(is_peak)
+    if peak_idx.size > 1:
+        keep = np.concatenate(([True], np.diff(peak_idx) >= min_distance))
+        peak_idx = peak_idx[keep]
+
+    window = max(1, int(round(RATE_WINDOW_SECONDS / hop_seconds)))
+    num_windows = int(np.ceil(rms_db.size / window))
+    counts = np.bincount(peak_idx // window, minlength=num_windows)
+    durations = np.full(num_windows, RATE_WINDOW_SECONDS, dtype=np.float64)
+    durations[-1] = (rms_db.size - (num_windows - 1) * window) * hop_seconds
+    return [round(float(r), 3) for r in counts / np.maximum(durations, hop_seconds)]
+
+
+def extract_audio_features(audio_path: str) -> Dict[str, Any]:
+    """
+    Computes prosodic features for one answer recording.
+
+    All measurements are derived from a single framing of the memory-mapped PCM:
+    - energy: frame RMS level (dBFS) mean / standard deviation
+    - pitch: YIN fundamental frequency over voiced frames, with variability in semitones
+    - pauses: silent gaps between speech frames
+    - filler pauses: sustained flat-pitch voicing such as "음..." / "어..."
+    - speech rate curve: estimated syllables per second in 5-second windows
+
+    Returns:
+        A JSON-serialisable dictionary of features.
+    """
+    import librosa
+
+    y, sr = _load_mono(audio_path)
+    duration = y.size / sr if sr else 0.0
+
+    frame_length = int(FRAME_SECONDS * sr)
+    hop_length = int(HOP_SECONDS * sr)
+    if sr == 0 or y.size < frame_length:
+        return {"duration": round(duration, 3), "sample_rate": sr, "analyzed": False}
+
+    # --- Energy (one strided view over the signal, no copies) ---
+    frames = librosa.util.frame(y, frame_length=frame_length, hop_length=hop_length)
+    rms = np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=0))
+    rms_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+    speech_mask = rms_db > (rms_db.max() - SILENCE_DB_BELOW_PEAK)
+
+    # --- Pitch ---
+    f0 = librosa.yin(
+        y,
+        fmin=PITCH_FMIN,
+        fmax=PITCH_FMAX,
+        sr=sr,
+        frame_length=frame_length,
+        hop_length=hop_length,
+        center=False,
+    )
+    n = min(f0.size, rms_db.size)
+    f0, rms_db, speech_mask = f0[:n], rms_db[:n], speech_mask[:n]
+
+    # YIN always returns an estimate; keep only frames with speech energy that are
+    # not pinned to the search bounds.
+    voiced_mask = speech_mask & (f0 > PITCH_FMIN * 1.05) & (f0 < PITCH_FMAX * 0.95)
+    semitones = 12.0 * np.log2(np.maximum(f0, 1e-6) / 100.0)
+    voiced_semitones = semitones[voiced_mask]
+
+    # --- Pauses ---
+    pause_starts, pause_lengths = _runs(~speech_mask)
+    # Leading/trailing silence is recording slack, not hesitation
+    interior = (pause_starts > 0) & (pause_starts + pause_lengths < n)
+    min_pause_frames = int(round(PAUSE_MIN_SECONDS / HOP_SECONDS))
+    pause_lengths = pause_lengths[interior & (pause_lengths >= min_pause_frames)]
+
+    # --- Filler pauses (flat sustained voicing) ---
+    step = np.abs(np.diff(semitones, prepend=semitones[0]))
+    flat_voiced = voiced_mask & (step < FILLER_MAX_SEMITONE_STEP)
+    _, flat_lengths = _runs(flat_voiced)
+    min_filler_frames = int(round(FILLER_MIN_SECONDS / HOP_SECONDS))
+    filler_lengths = flat_lengths[flat_lengths >= min_filler_frames]
+
+    speech_frames = int(speech_mask.sum())
+
+    return {
+        "duration": round(duration, 3),
+        "sample_rate": sr,
+        "analyzed": True,
+        "speech_seconds": round(speech_frames * HOP_SECONDS, 3),
+        "energy_mean_db": round(float(rms_db[speech_mask].mean()), 3) if speech_frames else None,
+        "energy_std_db": round(float(rms_db[speech_mask].std()), 3) if speech_frames else None,
+        "pitch_mean_hz": round(float(f0[voiced_mask].mean()), 3) if voiced_semitones.size else None,
+        "pitch_std_semitones": round(float(voiced_semitones.std()), 3) if voiced_semitones.size else None,
+        "voiced_ratio": round(float(voiced_mask.sum()) / speech_frames, 4) if speech_frames else 0.0,
+        "pause_count": int(pause_lengths.size),
+        "pause_seconds": round(float(pause_lengths.sum()) * HOP_SECONDS, 3),
+        "filler_pause_count": int(filler_lengths.size),
+        "filler_pause_seconds": round(float(filler_lengths.sum()) * HOP_SECONDS, 3),
+        "speech_rate_curve": _speech_rate_curve(rms_db, speech_mask, HOP_SECONDS),
+        "speech_rate_window_seconds": RATE_WINDOW_SECONDS,
+    }
+
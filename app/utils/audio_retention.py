@@ -0,0 +1,154 @@
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from app import crud
+from app.core.config import (
+    AUDIO_MAX_RETENTION_MINUTES,
+    AUDIO_SWEEP_INTERVAL_SECONDS,
+    AUDIO_SWEEP_BATCH_SIZE,
+    AUDIO_STAGING_SWEEP_INTERVAL_SECONDS,
+)
+from app.db.session import SessionLocal
+from app.utils.audio_archive import audio_archiver, pending_answer_id
+from app.utils.audio_storage import get_audio_storage
+from app.utils.leader_lock import LeaderLock
+
+
+def sweep_expired_audio(batch_size: int = AUDIO_SWEEP_BATCH_SIZE, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Deletes stored audio whose answer.audio_expires_at has passed, batch by batch.
+
+    Each batch is claimed with FOR UPDATE SKIP LOCKED and committed after its
+    files are removed, so sweepers in several workers share the work and a
+    crash mid-sweep only leaves rows to be picked up by the next run.
+    """
+    now = now or datetime.utcnow()
+    storage = get_audio_storage()
+    deleted = failed = 0
+    db = SessionLocal()
+    try:
+        while True:
+            rows = crud.interview.claim_expired_audio(db, now=now, limit=batch_size)
+            if not rows:
+                db.rollback()
+                break
+            cleared = []
+            for answer_id, audio_key in rows:
+                if storage.delete(audio_key):
+                    cleared.append(answer_id)
+                    deleted += 1
+                else:
+                    failed += 1
+            crud.interview.clear_audio_paths(db, answer_ids=cleared)
+            if len(rows) < batch_size or not cleared:
+                break
+    finally:
+        db.close()
+    return {"deleted": deleted, "failed": failed}
+
+
+def sweep_staging_files(min_age_minutes: int = AUDIO_MAX_RETENTION_MINUTES) -> int:
+    """
+    Deletes staging files older than `min_age_minutes`, left behind when the
+    process died between staging an answer's audio and storing it. WAVs of
+    answers still waiting to be archived are kept for requeue_pending().
+
+    Only the staging directory is listed, never the stored objects: keys are
+    written to storage after the answer row that references them, so stored
+    objects do not become orphans.
+    """
+    storage = get_audio_storage()
+    cutoff = time.time() - min_age_minutes * 60
+    paths = list(storage.iter_staging(older_than=cutoff))
+    if not paths:
+        return 0
+    answer_ids = [answer_id for answer_id in map(pending_answer_id, paths) if answer_id is not None]
+    db = SessionLocal()
+    try:
+        pending = crud.interview.get_pending_archive_ids(db, answer_ids=answer_ids)
+    finally:
+        db.close()
+    removed = 0
+    for path in paths:
+        if pending_answer_id(path) in pending:
+            continue
+        storage.discard_staging(path)
+        removed += 1
+    return removed
+
+
+class AudioRetentionSweeper:
+    """
+    Background thread that periodically deletes expired answer audio.
+
+    Deletion times live in the database (answer.audio_expires_at), so nothing
+    is held in memory per interview and pending deletions survive restarts.
+    The thread starts in every worker, but only the holder of the leader lock
+    sweeps; the others keep trying so one of them takes over if it dies.
+    Staging files are local to each node, so one process per host (under a
+    separate lock) requeues unfinished archive jobs whose WAV is on that host
+    and, much less often, deletes leftover staging files.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: int = AUDIO_SWEEP_INTERVAL_SECONDS,
+        staging_interval_seconds: int = AUDIO_STAGING_SWEEP_INTERVAL_SECONDS,
+    ):
+        self.interval_seconds = interval_seconds
+        self.staging_interval_seconds = staging_interval_seconds
+        self.leader_lock = LeaderLock("audio-retention-sweeper")
+        self.staging_lock = LeaderLock(f"audio-staging-sweeper:{socket.gethostname()}")
+        self._next_staging_sweep = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> None:
+        try:
+            if self.leader_lock.try_acquire():
+                result = sweep_expired_audio()
+                if result["deleted"] or result["failed"]:
+                    print(
+                        f"Audio retention sweep: {result['deleted']} expired objects deleted, "
+                        f"{result['failed']} failed"
+                    )
+        except Exception as e:
+            print(f"Audio retention sweep failed: {e}")
+
+        try:
+            if not self.staging_lock.try_acquire():
+                return
+            requeued = audio_archiver.requeue_pending()
+            if requeued:
+                print(f"Audio archive: requeued {requeued} unfinished jobs")
+            if time.monotonic() < self._next_staging_sweep:
+                return
+            self._next_staging_sweep = time.monotonic() + self.staging_interval_seconds
+            removed = sweep_staging_files()
+            if removed:
+                print(f"Audio staging sweep: {removed} leftover staging files deleted")
+        except Exception as e:
+            print(f"Audio staging sweep failed: {e}")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audio-retention-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self.leader_lock.release()
+        self.staging_lock.release()
+
+
+audio_retention_sweeper = AudioRetentionSweeper()
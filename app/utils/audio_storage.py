@@ -0,0 +1,195 @@
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+from app.core.config import (
+    AUDIO_FILES_DIR,
+    AUDIO_STORAGE_BACKEND,
+    AUDIO_S3_BUCKET,
+    AUDIO_S3_ENDPOINT_URL,
+    AUDIO_S3_PREFIX,
+    AUDIO_S3_REGION,
+)
+
+STAGING_DIR_NAME = ".staging"
+
+
+def new_audio_key(suffix: str = ".wav") -> str:
+    """
+    Returns a fresh storage key such as "3f/a9/3fa9...e1.wav".
+
+    The two hash-prefix levels (256 x 256 directories) keep every directory small
+    on the local backend and spread keys across prefixes on S3.
+    """
+    name = uuid.uuid4().hex
+    return f"{name[:2]}/{name[2:4]}/{name}{suffix}"
+
+
+class AudioStorage(ABC):
+    """
+    Where answer audio lives. Answer.audio_path stores a key from new_audio_key(),
+    never a filesystem path, so the backend can change without a data migration.
+
+    Audio is first written to a local staging file in `staging_dir` (Whisper and
+    feature extraction need a real path), then handed over with commit().
+    Staging files left behind by a crash are found with iter_staging().
+    """
+
+    def __init__(self, staging_dir: str):
+        self.staging_dir = os.path.abspath(staging_dir)
+
+    def staging_path(self, suffix: str = ".wav") -> str:
+        """Returns a new local file path to write audio to before commit()."""
+        os.makedirs(self.staging_dir, exist_ok=True)
+        return os.path.join(self.staging_dir, f"{uuid.uuid4().hex}{suffix}")
+
+    def iter_staging(self, older_than: float) -> Iterator[str]:
+        """Yields staging file paths last modified before `older_than` (epoch seconds)."""
+        try:
+            entries = list(os.scandir(self.staging_dir))
+        except FileNotFoundError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < older_than:
+                    yield entry.path
+            except OSError:
+                continue
+
+    @abstractmethod
+    def commit(self, staging_path: str, key: str) -> None:
+        """Stores the staged file under `key` and removes the staging file."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Deletes the object; a missing object counts as deleted. Returns False on error."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """True if an object is stored under `key`."""
+
+    @staticmethod
+    def discard_staging(staging_path: str) -> None:
+        try:
+            os.remove(staging_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Failed to remove staging audio file {staging_path}: {e}")
+
+
+class LocalAudioStorage(AudioStorage):
+    """Sharded directory tree under `root`; commits are atomic renames."""
+
+    def __init__(self, root: str = AUDIO_FILES_DIR):
+        self.root = os.path.abspath(root)
+        # 스테이징 디렉터리를 같은 파일시스템에 두어 commit을 rename 한 번으로 처리
+        super().__init__(os.path.join(self.root, STAGING_DIR_NAME))
+
+    def path_for(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f"Invalid audio storage key: {key}")
+        return path
+
+    def commit(self, staging_path: str, key: str) -> None:
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(staging_path, path)
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.remove(self.path_for(key))
+            return True
+        except FileNotFoundError:
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Error deleting audio {key}: {e}")
+            return False
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path_for(key))
+
+
+class S3AudioStorage(AudioStorage):
+    """
+    S3-compatible object storage (AWS S3, or MinIO locally via AUDIO_S3_ENDPOINT_URL).
+    Credentials come from the standard AWS environment variables. Staging
+    files are kept locally under AUDIO_FILES_DIR/.staging until uploaded.
+    """
+
+    def __init__(
+        self,
+        bucket: str = AUDIO_S3_BUCKET,
+        endpoint_url: Optional[str] = AUDIO_S3_ENDPOINT_URL,
+        prefix: str = AUDIO_S3_PREFIX,
+        region: Optional[str] = AUDIO_S3_REGION,
+        staging_dir: str = os.path.join(AUDIO_FILES_DIR, STAGING_DIR_NAME),
+    ):
+        super().__init__(staging_dir)
+        if not bucket:
+            raise ValueError("AUDIO_S3_BUCKET must be set for the s3 audio storage backend")
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url
+        self.prefix = prefix.strip("/") + "/" if prefix.strip("/") else ""
+        self.region = region
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self):
+        # boto3는 s3 백엔드를 쓸 때만 import
+        with self._client_lock:
+            if self._client is None:
+                import boto3
+
+                self._client = boto3.client("s3", endpoint_url=self.endpoint_url, region_name=self.region)
+        return self._client
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def commit(self, staging_path: str, key: str) -> None:
+        try:
+            self._get_client().upload_file(staging_path, self.bucket, self._object_key(key))
+        finally:
+            self.discard_staging(staging_path)
+
+    def delete(self, key: str) -> bool:
+        try:
+            # S3 DeleteObject는 객체가 없어도 성공
+            self._get_client().delete_object(Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except Exception as e:
+            print(f"Error deleting audio {key} from s3://{self.bucket}: {e}")
+            return False
+
+    def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self._get_client().head_object(Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+
+_storage: Optional[AudioStorage] = None
+_storage_lock = threading.Lock()
+
+
+def get_audio_storage() -> AudioStorage:
+    """The process-wide audio storage selected by AUDIO_STORAGE_BACKEND (local | s3)."""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            if AUDIO_STORAGE_BACKEND == "s3":
+                _storage = S3AudioStorage()
+            elif AUDIO_STORAGE_BACKEND == "local":
+                _storage = LocalAudioStorage()
+            else:
+                raise ValueError(f"Unknown AUDIO_STORAGE_BACKEND: {AUDIO_STORAGE_BACKEND}")
+    return _storage
@@ -0,0 +1,20 @@
+import hashlib
+import unicodedata
+from typing import Optional
+
+
+def normalize_resume_text(text: str) -> str:
+    """
+    Normalizes extracted resume text so that re-exports of the same document
+    hash identically: NFC, collapsed whitespace within lines, no blank lines.
+    """
+    text = unicodedata.normalize("NFC", text)
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def content_sha256(text: Optional[str]) -> Optional[str]:
+    """SHA-256 of the normalized text, or None for empty content."""
+    if not text:
+        return None
+    return hashlib.sha256(normalize_resume_text(text).encode("utf-8")).hexdigest()
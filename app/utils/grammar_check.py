@@ -0,0 +1,236 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import GRAMMAR_CHECK_MAX_CHARS, GRAMMAR_CHECK_CONCURRENCY
+from app.utils.spell_check_cache import SpellCheckResultCache, spell_check_cache, normalize_line, line_hash
+
+# A checker takes a block of text (pieces joined by CHUNK_SEPARATOR) and
+# returns the corrected block, or None when the check failed.
+Checker = Callable[[str], Optional[str]]
+
+# Pieces of a chunk are joined with a marker instead of "\n": hanspell turns
+# line breaks into <br> and strips them from the checked text, so newlines do
+# not survive the round trip. The marker is left alone by the speller; spacing
+# the speller adds or removes around it is ignored when splitting.
+CHUNK_MARKER = "¶¶"
+CHUNK_SEPARATOR = f"\n{CHUNK_MARKER}\n"
+_CHUNK_SPLIT = re.compile(rf"\s*{re.escape(CHUNK_MARKER)}\s*")
+
+
+def hanspell_checker(text: str) -> Optional[str]:
+    """Default checker backed by hanspell (Naver spell checker)."""
+    from hanspell import spell_checker
+
+    result = spell_checker.check(text)
+    if not result.result:
+        return None
+    return result.checked
+
+
+def _split_long_line(line: str, max_chars: int) -> List[str]:
+    """
+    Splits a line longer than max_chars into pieces, preferring to cut after
+    whitespace. Joining the pieces with "" restores the original line (the
+    whitespace at each cut is restored after checking, see _restore_edges).
+    """
+    pieces = []
+    while len(line) > max_chars:
+        cut = line.rfind(" ", 0, max_chars)
+        cut = cut + 1 if cut > 0 else max_chars
+        pieces.append(line[:cut])
+        line = line[cut:]
+    if line:
+        pieces.append(line)
+    return pieces
+
+
+def pack_lines(lines: List[str], max_chars: int) -> Tuple[List[Tuple[int, str]], List[List[int]]]:
+    """
+    Packs non-blank lines into chunks of at most max_chars characters.
+
+    Returns:
+        pieces: (line_index, text) for every piece that needs checking
+        chunks: lists of indexes into pieces; each chunk is sent as one request
+    """
+    pieces: List[Tuple[int, str]] = []
+    for line_index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        for piece in _split_long_line(line, max_chars):
+            pieces.append((line_index, piece))
+
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    current_len = 0
+    for piece_index, (_, text) in enumerate(pieces):
+        added = len(text) + (len(CHUNK_SEPARATOR) if current else 0)
+        if current and current_len + added > max_chars:
+            chunks.append(current)
+            current, current_len = [], 0
+            added = len(text)
+        current.append(piece_index)
+        current_len += added
+    if current:
+        chunks.append(current)
+    return pieces, chunks
+
+
+def _restore_edges(original: str, checked: Optional[str]) -> Optional[str]:
+    """Keeps the original leading/trailing whitespace, which the checker may trim."""
+    if checked is None:
+        return None
+    leading = original[:len(original) - len(original.lstrip())]
+    trailing = original[len(original.rstrip()):]
+    return leading + checked.strip() + trailing
+
+
+def split_checked_chunk(checked: str, count: int) -> Optional[List[str]]:
+    """Splits a checked chunk back into its pieces; None if the piece count changed."""
+    parts = _CHUNK_SPLIT.split(checked.strip())
+    return parts if len(parts) == count else None
+
+
+def _check_chunk(checker: Checker, texts: List[str]) -> Tuple[List[Optional[str]], bool]:
+    """
+    Checks one chunk; falls back to per-piece checks if the pieces cannot be
+    recovered from the response. Pieces that could not be checked are None.
+    Returns (results, whether the fallback was used).
+    """
+    parts = None
+    if len(texts) == 1 or not any(CHUNK_MARKER in text for text in texts):
+        try:
+            checked = checker(CHUNK_SEPARATOR.join(texts))
+        except Exception as e:
+            print(f"Spell check request failed: {e}")
+            checked = None
+        if checked is not None:
+            parts = [checked] if len(texts) == 1 else split_checked_chunk(checked, len(texts))
+
+    if parts is not None:
+        return [_restore_edges(text, part) for text, part in zip(texts, parts)], False
+    if len(texts) == 1:
+        return [None], False
+
+    print(f"Spell check chunk of {len(texts)} pieces could not be split back; checking pieces one by one")
+    corrected = []
+    for text in texts:
+        try:
+            corrected.append(_restore_edges(text, checker(text)))
+        except Exception:
+            corrected.append(None)
+    return corrected, True
+
+
+class GrammarCheckEngine:
+    """
+    Spell-checks a document by packing lines into maximal request chunks and
+    sending the chunks concurrently with bounded parallelism. Results are
+    reassembled in the original line order; lines that fail to check are
+    kept unchanged.
+
+    With a cache, lines are looked up by normalized-line hash first and only
+    unseen lines (deduplicated) are sent to the checker.
+
+    `fallback_chunks` counts chunks whose pieces could not be recovered from
+    the checker's response and were re-sent one by one.
+    """
+
+    def __init__(
+        self,
+        checker: Optional[Checker] = None,
+        max_chars: int = GRAMMAR_CHECK_MAX_CHARS,
+        max_workers: int = GRAMMAR_CHECK_CONCURRENCY,
+        cache: Optional[SpellCheckResultCache] = None,
+    ):
+        self.checker = checker
+        self.max_chars = max_chars
+        self.max_workers = max_workers
+        self.cache = cache
+        self.fallback_chunks = 0
+        self._lock = threading.Lock()
+
+    def _get_checker(self) -> Checker:
+        # hanspell의 requests 세션은 기본 연결 풀(호스트당 10개)을 사용하므로
+        # GRAMMAR_CHECK_CONCURRENCY가 그 이하이면 동시 요청도 keep-alive 연결을 재사용함
+        if self.checker is None:
+            self.checker = hanspell_checker
+        return self.checker
+
+    def _check_chunk(self, checker: Checker, texts: List[str]) -> List[Optional[str]]:
+        results, fell_back = _check_chunk(checker, texts)
+        if fell_back:
+            with self._lock:
+                self.fallback_chunks += 1
+        return results
+
+    def _check_texts(self, texts: List[str]) -> Tuple[List[Optional[str]], int]:
+        """Checks non-blank texts; returns (results, number of chunk requests)."""
+        pieces, chunks = pack_lines(texts, self.max_chars)
+        if not chunks:
+            return list(texts), 0
+
+        checker = self._get_checker()
+        chunk_texts = [[pieces[i][1] for i in chunk] for chunk in chunks]
+        workers = max(1, min(self.max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(lambda texts_: self._check_chunk(checker, texts_), chunk_texts))
+
+        # Reassemble: pieces of the same text are concatenated back together,
+        # and a text fails if any of its pieces failed.
+        rebuilt: Dict[int, Optional[str]] = {}
+        for chunk, results in zip(chunks, chunk_results):
+            for piece_index, text in zip(chunk, results):
+                text_index = pieces[piece_index][0]
+                previous = rebuilt.get(text_index, "")
+                rebuilt[text_index] = None if previous is None or text is None else previous + text
+        return [rebuilt.get(i) for i in range(len(texts))], len(chunks)
+
+    def check_lines(self, lines: List[str], db: Optional[Session] = None) -> List[str]:
+        # line index -> (cache key hash, text to check) for every non-blank line.
+        # The checker gets the line as written (outer whitespace is re-applied
+        # below); the normalized form is only used for the cache key.
+        line_keys: Dict[int, Tuple[str, str]] = {}
+        for index, line in enumerate(lines):
+            if line.strip():
+                line_keys[index] = (line_hash(normalize_line(line)), line.strip())
+        if not line_keys:
+            return list(lines)
+
+        unique = {}
+        for key, text in line_keys.values():
+            unique.setdefault(key, text)
+
+        results = self.cache.lookup(db, list(unique)) if self.cache else {}
+        to_check = [key for key in unique if key not in results]
+
+        num_chunks = 0
+        if to_check:
+            checked, num_chunks = self._check_texts([unique[key] for key in to_check])
+            fresh = {key: text for key, text in zip(to_check, checked) if text is not None}
+            results.update(fresh)
+            if self.cache:
+                self.cache.store(db, fresh)
+
+        print(
+            f"Spell check: {len(line_keys)} lines, {len(unique)} unique, "
+            f"{len(unique) - len(to_check)} cached, {len(to_check)} sent in {num_chunks} request(s)"
+        )
+
+        corrected = list(lines)
+        for index, (key, _) in line_keys.items():
+            if key in results:
+                line = lines[index]
+                leading = line[:len(line) - len(line.lstrip())]
+                trailing = line[len(line.rstrip()):]
+                corrected[index] = leading + results[key] + trailing
+        return corrected
+
+    def check_text(self, content: str, db: Optional[Session] = None) -> str:
+        return "\n".join(self.check_lines(content.split("\n"), db=db))
+
+
+grammar_check_engine = GrammarCheckEngine(cache=spell_check_cache)
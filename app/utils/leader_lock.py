@@ -0,0 +1,72 @@
+import threading
+import zlib
+
+from sqlalchemy import text
+
+from app.db.session import engine
+
+
+class LeaderLock:
+    """
+    Elects one process (across all uvicorn workers and nodes) to run a
+    periodic job, using a session-level PostgreSQL advisory lock.
+
+    The lock is held on a dedicated connection for as long as the process
+    lives, so if the leader dies its connection closes and the next
+    try_acquire() in another process takes over. On other databases (sqlite
+    in development) there is no shared lock and every process is the leader.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        # pg_try_advisory_lock는 bigint 키를 받으므로 이름을 32비트 해시로 변환
+        self.key = zlib.crc32(name.encode("utf-8"))
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """True if this process is (or just became) the leader."""
+        if engine.dialect.name != "postgresql":
+            return True
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    # 연결이 끊기면 잠금도 풀렸으므로 다시 경쟁
+                    self._conn.execute(text("SELECT 1"))
+                    return True
+                except Exception as e:
+                    print(f"Leader lock '{self.name}' connection lost: {e}")
+                    self._close()
+            conn = engine.connect()
+            try:
+                acquired = bool(conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar())
+                # 세션 단위 잠금이므로 트랜잭션을 열어 둘 필요는 없음
+                conn.commit()
+            except Exception:
+                conn.close()
+                raise
+            if not acquired:
+                conn.close()
+                return False
+            self._conn = conn
+            print(f"Leader lock '{self.name}' acquired by this process")
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+                self._conn.commit()
+            except Exception as e:
+                print(f"Failed to release leader lock '{self.name}': {e}")
+            self._close()
+
+    def _close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
+
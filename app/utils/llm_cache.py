@@ -0,0 +1,147 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MEMORY_SIZE,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_EVICT_INTERVAL_SECONDS,
+)
+
+
+def llm_cache_key(provider: str, model: str, prompt: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Builds the cache key for one LLM call.
+
+    The prompt builders in app/prompts are deterministic, so the SHA-256 of the
+    rendered prompt identifies the request; provider, model and generation
+    parameters (max_tokens, response format, ...) are part of the key as well.
+    """
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    material = json.dumps(
+        {"provider": provider, "model": model, "prompt": prompt_hash, "params": params or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache of LLM response texts with a TTL.
+
+    - memory tier: per-process LRU (LLM_CACHE_MEMORY_SIZE entries)
+    - persistent tier: the llm_response_cache table, shared across workers and
+      restarts; expired rows are dropped and the rest trimmed to
+      LLM_CACHE_MAX_ENTRIES by least-recent use, at most once per
+      LLM_CACHE_EVICT_INTERVAL_SECONDS (lookups already ignore expired rows)
+    """
+
+    def __init__(
+        self,
+        enabled: bool = LLM_CACHE_ENABLED,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        memory_size: int = LLM_CACHE_MEMORY_SIZE,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        evict_interval: float = LLM_CACHE_EVICT_INTERVAL_SECONDS,
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.evict_interval = evict_interval
+        self._next_eviction = 0.0
+        # key -> (response_text, expires_at as time.monotonic())
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, provider: str, field: str, amount: int = 1) -> None:
+        provider_stats = self._stats.setdefault(
+            provider, {"memory_hits": 0, "db_hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+        )
+        provider_stats[field] += amount
+
+    def _remember(self, key: str, text: str, ttl_seconds: float) -> None:
+        self._memory[key] = (text, time.monotonic() + ttl_seconds)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def lookup(self, db: Optional[Session], key: str, provider: str) -> Optional[str]:
+        """Returns the cached response text for key, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                text, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._memory.move_to_end(key)
+                    self._count(provider, "memory_hits")
+                    return text
+                del self._memory[key]
+
+        found = None
+        if db is not None:
+            try:
+                found = crud.llm_response_cache.get(db, cache_key=key)
+            except Exception as e:
+                print(f"LLM cache lookup failed: {e}")
+                db.rollback()
+
+        with self._lock:
+            if found is None:
+                self._count(provider, "misses")
+                return None
+            text, ttl_remaining = found
+            self._remember(key, text, ttl_remaining)
+            self._count(provider, "db_hits")
+        return text
+
+    def store(self, db: Optional[Session], key: str, provider: str, model: str, text: str) -> None:
+        """Saves a successful response to both tiers; TTL/LRU eviction runs when due."""
+        if not self.enabled or not text:
+            return
+        with self._lock:
+            self._remember(key, text, self.ttl_seconds)
+            self._count(provider, "stored")
+            # 만료 삭제와 항목 수 집계(COUNT)는 저장할 때마다가 아니라 주기적으로만 실행
+            evict_due = db is not None and time.monotonic() >= self._next_eviction
+            if evict_due:
+                self._next_eviction = time.monotonic() + self.evict_interval
+
+        if db is None:
+            return
+        try:
+            crud.llm_response_cache.upsert(
+                db, cache_key=key, provider=provider, model=model, response_text=text, ttl_seconds=self.ttl_seconds
+            )
+            evicted = crud.llm_response_cache.evict(db, max_entries=self.max_entries) if evict_due else 0
+        except Exception as e:
+            print(f"LLM cache store failed: {e}")
+            db.rollback()
+            return
+        with self._lock:
+            self._count(provider, "evicted", evicted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            providers = {provider: dict(stats) for provider, stats in self._stats.items()}
+            memory_entries = len(self._memory)
+        for stats in providers.values():
+            lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+            stats["hit_rate"] = round((stats["memory_hits"] + stats["db_hits"]) / lookups, 4) if lookups else 0.0
+        return {"enabled": self.enabled, "memory_entries": memory_entries, "providers": providers}
+
+
+llm_response_cache = LLMResponseCache()
@@ -0,0 +1,30 @@
+"""
+Thin facades over the LLM provider SDKs.
+
+anthropic and google.generativeai are expensive to import, so they are only
+imported on the first call that actually needs them. Clients are cached per
+API key so their HTTP connection pools are reused across requests.
+"""
+from functools import lru_cache
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=8)
+def get_anthropic_client(api_key: str):
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=8)
+def get_async_anthropic_client(api_key: str, timeout: float = 240.0):
+    import anthropic
+    return anthropic.AsyncAnthropic(api_key=api_key, timeout=timeout)
+
+
+def get_gemini_model(api_key: str, model_name: str, generation_config: Optional[dict] = None) -> Any:
+    """Returns a configured google.generativeai GenerativeModel."""
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    if generation_config is None:
+        return genai.GenerativeModel(model_name)
+    return genai.GenerativeModel(model_name, generation_config=genai.GenerationConfig(**generation_config))
@@ -0,0 +1,80 @@
+import json
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from app.utils.llm_clients import get_async_anthropic_client
+from app.utils.prompt_cache import cached_system_blocks, log_prompt_cache_usage
+
+# SSE 응답 헤더: 프록시(nginx 등)가 버퍼링하지 않도록 지정
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_event(event: str, data) -> str:
+    """Formats one Server-Sent Event. `data` is JSON-encoded on a single line."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def stream_claude_text(
+    prompt: str,
+    *,
+    api_key: str,
+    model: str,
+    max_tokens: int = 4096,
+    timeout: float = 240.0,
+    system: Optional[str] = None,
+    label: str = "claude-stream",
+) -> AsyncIterator[str]:
+    """
+    Streams a Claude completion for a single user prompt, yielding text deltas
+    as soon as the API produces them.
+
+    `system` is sent as a prompt-cached system block; the token usage, including
+    cache reads/writes, is logged under `label` once the stream ends.
+    """
+    client = get_async_anthropic_client(api_key, timeout)
+    request = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": prompt}],
+    }
+    if system:
+        request["system"] = cached_system_blocks(system)
+    async with client.messages.stream(**request) as stream:
+        async for text in stream.text_stream:
+            yield text
+        final_message = await stream.get_final_message()
+    log_prompt_cache_usage(label, final_message.usage)
+
+
+async def stream_and_persist(
+    chunks: AsyncIterator[str],
+    on_complete: Callable[[str], Awaitable[Optional[dict]]],
+) -> AsyncIterator[str]:
+    """
+    Relays text chunks to the client as SSE `delta` events while accumulating them.
+
+    When the upstream stream finishes, the full text is handed to `on_complete`
+    (which persists it) and a final `done` event carries whatever it returns.
+    Errors are reported as an `error` event; nothing is persisted in that case,
+    including when the client disconnects mid-stream.
+    """
+    parts = []
+    try:
+        async for text in chunks:
+            parts.append(text)
+            yield sse_event("delta", {"text": text})
+    except Exception as e:
+        print(f"LLM stream failed after {sum(len(p) for p in parts)} characters: {e}")
+        yield sse_event("error", {"detail": f"Error while streaming AI response: {e}"})
+        return
+
+    full_text = "".join(parts)
+    try:
+        result = await on_complete(full_text)
+    except Exception as e:
+        print(f"Failed to persist streamed AI response: {e}")
+        yield sse_event("error", {"detail": f"Failed to save AI response: {e}"})
+        return
+    yield sse_event("done", result)
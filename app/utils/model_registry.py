@@ -0,0 +1,119 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from app.core.config import EMBEDDING_MODEL_NAME
+from app.utils.transcription_backends import create_transcription_backend, describe_transcription_backend
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class _ModelEntry:
+    def __init__(self, name: str, loader: Callable[[], Any], description: str):
+        self.name = name
+        self.loader = loader
+        self.description = description
+        self.state = PENDING
+        self.model: Any = None
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.preloaded = False
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of heavy ML models.
+
+    Models are loaded at most once per process, either on first use (get) or
+    ahead of time in background threads (preload). The per-model state and load
+    time are exposed through status() for the readiness probe.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _ModelEntry] = {}
+
+    def register(self, name: str, loader: Callable[[], Any], description: str = "") -> None:
+        self._entries[name] = _ModelEntry(name, loader, description)
+
+    def _load(self, entry: _ModelEntry) -> Any:
+        # 다른 스레드가 로드 중이면 lock에서 대기 후 결과를 공유
+        with entry.lock:
+            if entry.state == READY:
+                return entry.model
+            entry.state = LOADING
+            entry.error = None
+            print(f"Loading model '{entry.name}' ({entry.description})...")
+            started = time.perf_counter()
+            try:
+                entry.model = entry.loader()
+            except Exception as e:
+                entry.state = FAILED
+                entry.error = f"{type(e).__name__}: {e}"
+                print(f"Failed to load model '{entry.name}': {entry.error}")
+                raise
+            entry.load_seconds = round(time.perf_counter() - started, 3)
+            entry.loaded_at = time.time()
+            entry.state = READY
+            print(f"Model '{entry.name}' loaded in {entry.load_seconds:.2f}s.")
+            return entry.model
+
+    def get(self, name: str) -> Any:
+        """Returns the model, loading it now if it is not loaded yet."""
+        entry = self._entries[name]
+        if entry.state == READY:
+            return entry.model
+        return self._load(entry)
+
+    def preload(self, names: Iterable[str]) -> None:
+        """Starts loading the given models in background threads and returns immediately."""
+        for name in names:
+            entry = self._entries.get(name)
+            if entry is None:
+                print(f"Unknown model '{name}' in PRELOAD_MODELS; skipping.")
+                continue
+            entry.preloaded = True
+            threading.Thread(
+                target=self._preload_one, args=(entry,), name=f"preload-{name}", daemon=True
+            ).start()
+
+    def _preload_one(self, entry: _ModelEntry) -> None:
+        try:
+            self._load(entry)
+        except Exception:
+            # 실패 상태는 status()로 노출되며, 첫 요청 시 다시 로드를 시도함
+            pass
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "state": entry.state,
+                "description": entry.description,
+                "preloaded": entry.preloaded,
+                "load_seconds": entry.load_seconds,
+                "error": entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
+
+    def is_ready(self) -> bool:
+        """True when every preloaded model has finished loading successfully."""
+        return all(entry.state == READY for entry in self._entries.values() if entry.preloaded)
+
+
+def _load_whisper():
+    return create_transcription_backend()
+
+
+def _load_embedding():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+
+model_registry = ModelRegistry()
+model_registry.register("whisper", _load_whisper, describe_transcription_backend())
+model_registry.register("embedding", _load_embedding, f"SentenceTransformer {EMBEDDING_MODEL_NAME}")
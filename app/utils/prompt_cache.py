@@ -0,0 +1,40 @@
+from typing import Any, Dict, List
+
+
+def cached_system_blocks(system_prompt: str) -> List[Dict[str, Any]]:
+    """
+    Wraps a static instruction text as a Claude system block marked for prompt caching.
+
+    The block is the stable prefix of every request that uses it, so after the
+    first call within the cache lifetime (5 minutes, refreshed on each hit) the
+    API reads it from cache instead of re-processing it. Prefixes shorter than
+    the model's minimum cacheable length are simply processed uncached.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def _usage_value(usage: Any, name: str) -> int:
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return int(value or 0)
+
+
+def log_prompt_cache_usage(label: str, usage: Any) -> Dict[str, int]:
+    """
+    Logs the prompt-cache token counts of one Claude response.
+
+    Accepts either the SDK `Usage` object or the raw `usage` dict of the HTTP API.
+    """
+    counts = {
+        "input_tokens": _usage_value(usage, "input_tokens"),
+        "cache_creation_input_tokens": _usage_value(usage, "cache_creation_input_tokens"),
+        "cache_read_input_tokens": _usage_value(usage, "cache_read_input_tokens"),
+        "output_tokens": _usage_value(usage, "output_tokens"),
+    }
+    prompt_tokens = counts["input_tokens"] + counts["cache_creation_input_tokens"] + counts["cache_read_input_tokens"]
+    cached_ratio = counts["cache_read_input_tokens"] / prompt_tokens if prompt_tokens else 0.0
+    print(
+        f"[{label}] prompt tokens: {prompt_tokens} "
+        f"(cache read {counts['cache_read_input_tokens']}, cache write {counts['cache_creation_input_tokens']}, "
+        f"uncached {counts['input_tokens']}, {cached_ratio:.0%} from cache), output tokens: {counts['output_tokens']}"
+    )
+    return counts
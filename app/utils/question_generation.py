@@ -0,0 +1,84 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import QUESTION_GENERATION_MAX_ATTEMPTS
+from app.prompts import get_question_generation_prompt
+from app.schemas.generated_question import GeneratedQuestionSet
+from app.utils.llm_clients import get_gemini_model
+from app.utils.llm_cache import llm_cache_key, llm_response_cache
+from app.utils.structured_output import StructuredOutputError, generate_structured, parse_structured
+
+# Gemini에 강제할 응답 스키마 (OpenAPI 부분집합). 세부 검증은 GeneratedQuestionSet이 담당
+QUESTION_SET_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "questions": {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "text": {"type": "STRING"},
+                    "type": {"type": "STRING", "format": "enum", "enum": ["resume", "common"]},
+                    "is_pressure": {"type": "BOOLEAN"},
+                },
+                "required": ["text", "type", "is_pressure"],
+            },
+        },
+    },
+    "required": ["questions"],
+}
+
+
+def _cached_question_set(db: Optional[Session], cache_key: str) -> Optional[GeneratedQuestionSet]:
+    cached_text = llm_response_cache.lookup(db, cache_key, "gemini")
+    if cached_text is None:
+        return None
+    try:
+        return parse_structured(cached_text, GeneratedQuestionSet)
+    except StructuredOutputError:
+        # 스키마 도입 이전에 저장된 응답 등은 캐시 미스로 취급
+        return None
+
+
+def generate_question_texts(
+    db: Optional[Session],
+    resume_content: str,
+    *,
+    api_key: str,
+    model_name: str,
+    max_attempts: int = QUESTION_GENERATION_MAX_ATTEMPTS,
+) -> List[str]:
+    """
+    Generates interview questions for a resume as validated structured output.
+
+    Gemini is asked for schema-constrained JSON; the response is validated with
+    GeneratedQuestionSet and retried (bounded by max_attempts) on failure. Only
+    validated, canonical JSON is stored in the LLM response cache.
+
+    Raises:
+        StructuredOutputError: no valid question set could be produced. Callers
+        must not persist anything in that case.
+    """
+    prompt = get_question_generation_prompt(resume_content)
+    cache_key = llm_cache_key("gemini", model_name, prompt, {"response_schema": "GeneratedQuestionSet"})
+
+    question_set = _cached_question_set(db, cache_key)
+    if question_set is None:
+        model = get_gemini_model(
+            api_key,
+            model_name,
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": QUESTION_SET_RESPONSE_SCHEMA,
+            },
+        )
+        question_set = generate_structured(
+            lambda text: model.generate_content(text).text,
+            prompt,
+            GeneratedQuestionSet,
+            max_attempts=max_attempts,
+        )
+        llm_response_cache.store(db, cache_key, "gemini", model_name, question_set.model_dump_json())
+
+    return [question.text for question in question_set.questions]
@@ -0,0 +1,119 @@
+import os
+import threading
+from typing import Dict, Set
+
+from app import crud
+from app.core.config import QUESTION_PREGENERATION_ENABLED, QUESTION_PREGENERATION_WAIT_SECONDS
+from app.db.session import SessionLocal
+from app.utils.question_generation import generate_question_texts
+from app.utils.tts import prewarm_question_audio
+
+# resume_id -> 진행 중인 사전 생성 작업의 "질문 저장 완료" 이벤트 (프로세스 내)
+_inflight: Dict[int, threading.Event] = {}
+# 작업이 진행 중일 때 내용이 다시 수정된 이력서 (작업 종료 후 한 번 더 재생성)
+_rerun: Set[int] = set()
+_inflight_lock = threading.Lock()
+
+
+def _begin(resume_id: int, regenerate: bool) -> bool:
+    with _inflight_lock:
+        if resume_id in _inflight:
+            if regenerate:
+                _rerun.add(resume_id)
+            return False
+        _inflight[resume_id] = threading.Event()
+        return True
+
+
+def _questions_ready(resume_id: int) -> None:
+    with _inflight_lock:
+        event = _inflight.get(resume_id)
+    if event is not None:
+        event.set()
+
+
+def _finish(resume_id: int) -> bool:
+    """Releases the job slot; returns True if a re-run was requested meanwhile."""
+    with _inflight_lock:
+        event = _inflight.pop(resume_id, None)
+        rerun = resume_id in _rerun
+        _rerun.discard(resume_id)
+    if event is not None:
+        event.set()
+    return rerun
+
+
+def wait_for_pregeneration(resume_id: int, timeout: float = QUESTION_PREGENERATION_WAIT_SECONDS) -> bool:
+    """
+    Blocks until an in-flight pre-generation job for resume_id has saved its questions
+    (TTS pre-warming may still be running).
+
+    Only jobs running in this process are visible: with several workers, a job
+    started by another worker is not waited for and the caller generates the
+    questions itself.
+
+    Returns True if a job was running here and its questions were saved within timeout.
+    """
+    with _inflight_lock:
+        event = _inflight.get(resume_id)
+    if event is None:
+        return False
+    return event.wait(timeout)
+
+
+def pregenerate_interview_assets(resume_id: int, regenerate: bool = False) -> None:
+    """
+    Background job run after a resume is uploaded or its content is edited.
+
+    Generates (or, with regenerate=True, replaces) the resume's interview
+    questions and pre-warms the TTS cache for them, so that starting an
+    interview is a pure DB operation. Failures are logged only; session
+    creation still falls back to generating questions on demand.
+    """
+    if not QUESTION_PREGENERATION_ENABLED:
+        return
+    if not _begin(resume_id, regenerate):
+        print(f"Question pre-generation already running for resume {resume_id}; skipping.")
+        return
+
+    db = SessionLocal()
+    try:
+        questions = crud.generated_question.get_questions_by_resume(db, resume_id=resume_id)
+        if questions and not regenerate:
+            question_texts = [q.question_text for q in questions]
+        else:
+            content = crud.resume.get_content(db, resume_id=resume_id)
+            google_api_key = os.getenv("GOOGLE_API_KEY")
+            gemini_model_name = os.getenv("GEMINI_MODEL")
+            if not content or not google_api_key or not gemini_model_name:
+                print(f"Skipping question pre-generation for resume {resume_id}: missing content or AI model configuration.")
+                return
+
+            question_texts = generate_question_texts(
+                db, content, api_key=google_api_key, model_name=gemini_model_name
+            )
+            if regenerate:
+                # 수정 전 내용으로 만든 질문은 더 이상 유효하지 않으므로 한 트랜잭션에서 교체
+                crud.generated_question.replace_for_resume(db, resume_id=resume_id, question_texts=question_texts)
+            else:
+                existing = crud.generated_question.get_questions_by_resume(db, resume_id=resume_id)
+                if existing:
+                    # 생성하는 동안 다른 요청(세션 생성 등)이 먼저 질문을 저장함
+                    question_texts = [q.question_text for q in existing]
+                else:
+                    crud.generated_question.create_many(db, resume_id=resume_id, question_texts=question_texts)
+            print(f"Pre-generated {len(question_texts)} questions for resume {resume_id}.")
+
+        _questions_ready(resume_id)
+        warmed = prewarm_question_audio(question_texts)
+        print(f"Pre-warmed TTS audio for {warmed}/{len(question_texts)} questions of resume {resume_id}.")
+    except Exception as e:
+        db.rollback()
+        print(f"Question pre-generation failed for resume {resume_id}: {e}")
+    finally:
+        db.close()
+        rerun = _finish(resume_id)
+
+    if rerun:
+        print(f"Resume {resume_id} content changed during pre-generation; regenerating.")
+        pregenerate_interview_assets(resume_id, regenerate=True)
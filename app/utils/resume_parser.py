@@ -0,0 +1,157 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import RESUME_MAX_UPLOAD_BYTES, RESUME_MAX_PAGES, RESUME_PARSE_WORKERS
+
+PDF_CONTENT_TYPE = "application/pdf"
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+SUPPORTED_CONTENT_TYPES = {PDF_CONTENT_TYPE: ".pdf", DOCX_CONTENT_TYPE: ".docx"}
+
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+class ResumeParseError(Exception):
+    """Raised inside the parser worker; converted to an HTTP error by the caller."""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+@dataclass
+class SpooledUpload:
+    path: str
+    content_type: str
+    filename: Optional[str]
+    size: int
+    sha256: str
+
+    def cleanup(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+@dataclass
+class ParsedResume:
+    text: str
+    num_pages: int
+    page_timings: List[float] = field(default_factory=list)  # seconds per page (PDF only)
+    total_time: float = 0.0
+
+
+def _parse_pdf(path: str, max_pages: int) -> ParsedResume:
+    from PyPDF2 import PdfReader
+
+    start = time.perf_counter()
+    # PdfReader reads the cross-reference table up front and decodes page
+    # content lazily, so pages are extracted one at a time from the file.
+    reader = PdfReader(path)
+    num_pages = len(reader.pages)
+    if num_pages > max_pages:
+        raise ResumeParseError(f"PDF has {num_pages} pages; the limit is {max_pages}.", status_code=413)
+
+    texts = []
+    page_timings = []
+    for page in reader.pages:
+        page_start = time.perf_counter()
+        texts.append(page.extract_text() or "")
+        page_timings.append(round(time.perf_counter() - page_start, 4))
+
+    return ParsedResume(
+        text="\n".join(texts),
+        num_pages=num_pages,
+        page_timings=page_timings,
+        total_time=round(time.perf_counter() - start, 4),
+    )
+
+
+def _parse_docx(path: str) -> ParsedResume:
+    import docx
+
+    start = time.perf_counter()
+    document = docx.Document(path)
+    text = "\n".join([para.text for para in document.paragraphs])
+    return ParsedResume(text=text, num_pages=1, total_time=round(time.perf_counter() - start, 4))
+
+
+def parse_resume_file(path: str, content_type: str, max_pages: int = RESUME_MAX_PAGES) -> ParsedResume:
+    """Parses a spooled resume file. Runs inside the parser worker process."""
+    try:
+        if content_type == PDF_CONTENT_TYPE:
+            return _parse_pdf(path, max_pages)
+        if content_type == DOCX_CONTENT_TYPE:
+            return _parse_docx(path)
+    except ResumeParseError:
+        raise
+    except Exception as e:
+        kind = "PDF" if content_type == PDF_CONTENT_TYPE else "DOCX"
+        raise ResumeParseError(f"Error parsing {kind} file: {e}", status_code=500)
+    raise ResumeParseError("Unsupported file type.")
+
+
+async def spool_upload(file: UploadFile, max_bytes: int = RESUME_MAX_UPLOAD_BYTES) -> SpooledUpload:
+    """
+    Streams an upload to a temporary file in fixed-size chunks, rejecting it
+    as soon as it exceeds max_bytes. The SHA-256 of the bytes is computed on
+    the way through. The caller must call cleanup() on the result.
+    """
+    if file.content_type not in SUPPORTED_CONTENT_TYPES:
+        raise HTTPException(status_code=400, detail="Unsupported file type.")
+
+    fd, path = tempfile.mkstemp(prefix="resume_", suffix=SUPPORTED_CONTENT_TYPES[file.content_type])
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(SPOOL_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File is too large. The limit is {max_bytes // (1024 * 1024)}MB.",
+                    )
+                digest.update(chunk)
+                out.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return SpooledUpload(
+        path=path, content_type=file.content_type, filename=file.filename, size=size, sha256=digest.hexdigest()
+    )
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=RESUME_PARSE_WORKERS)
+    return _executor
+
+
+async def parse_spooled_upload(upload: SpooledUpload) -> ParsedResume:
+    """Parses a spooled resume in the worker pool without blocking the event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+        parsed = await loop.run_in_executor(_get_executor(), parse_resume_file, upload.path, upload.content_type)
+    except ResumeParseError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    slowest = max(parsed.page_timings) if parsed.page_timings else 0.0
+    print(
+        f"Parsed resume '{upload.filename}': {parsed.num_pages} page(s) in {parsed.total_time:.3f}s "
+        f"(slowest page {slowest:.3f}s, per-page: {parsed.page_timings})"
+    )
+    return parsed
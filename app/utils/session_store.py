@@ -0,0 +1,157 @@
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from app.core.config import REDIS_URL, SESSION_STORE_BACKEND, SESSION_STATE_TTL_SECONDS
+
+
+class SessionStore(ABC):
+    """
+    Shared state of live interview WebSocket sessions, keyed by interview_id.
+
+    Each state carries an `owner` (the connection currently driving the
+    interview). The newest connection always takes over, so a client that
+    reconnects through a different worker or node continues immediately;
+    the superseded handler notices on its next update() and stops.
+    Answer progress itself lives in the database; a resumed session continues
+    from the first unanswered question.
+
+    Methods are coroutines: they are called from the WebSocket handler and
+    must not block the event loop on network round trips.
+    """
+
+    @abstractmethod
+    async def claim(self, interview_id: int, owner: str, state: Dict[str, Any], ttl: int = SESSION_STATE_TTL_SECONDS) -> Optional[str]:
+        """Makes `owner` the driver of the session; returns the previous owner, if any."""
+
+    @abstractmethod
+    async def update(self, interview_id: int, owner: str, state: Dict[str, Any], ttl: int = SESSION_STATE_TTL_SECONDS) -> bool:
+        """Replaces the state and refreshes its TTL if `owner` still owns it; False otherwise."""
+
+    @abstractmethod
+    async def get(self, interview_id: int) -> Optional[Dict[str, Any]]:
+        """The current state (including `owner`), or None."""
+
+    @abstractmethod
+    async def release(self, interview_id: int, owner: str) -> None:
+        """Deletes the state if `owner` still owns it."""
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Single-process store (default); sessions are not shared between workers.
+    Operations only touch a dict, so the lock is never held across an await.
+    """
+
+    def __init__(self):
+        # interview_id -> (state, expires_at as time.monotonic())
+        self._states: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _current(self, interview_id: int) -> Optional[Dict[str, Any]]:
+        entry = self._states.get(interview_id)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._states[interview_id]
+            return None
+        return entry[0]
+
+    async def claim(self, interview_id, owner, state, ttl=SESSION_STATE_TTL_SECONDS):
+        with self._lock:
+            previous = self._current(interview_id)
+            self._states[interview_id] = ({**state, "owner": owner}, time.monotonic() + ttl)
+        return previous["owner"] if previous else None
+
+    async def update(self, interview_id, owner, state, ttl=SESSION_STATE_TTL_SECONDS):
+        with self._lock:
+            current = self._current(interview_id)
+            if current is None or current["owner"] != owner:
+                return False
+            self._states[interview_id] = ({**state, "owner": owner}, time.monotonic() + ttl)
+            return True
+
+    async def get(self, interview_id):
+        with self._lock:
+            current = self._current(interview_id)
+            return dict(current) if current else None
+
+    async def release(self, interview_id, owner):
+        with self._lock:
+            current = self._current(interview_id)
+            if current is not None and current["owner"] == owner:
+                del self._states[interview_id]
+
+
+# 소유자 확인과 쓰기를 원자적으로 처리하는 Lua 스크립트
+_CLAIM_SCRIPT = """
+local previous = redis.call('GET', KEYS[1])
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+return previous
+"""
+_UPDATE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if not current or cjson.decode(current)['owner'] ~= ARGV[2] then return 0 end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[3])
+return 1
+"""
+_RELEASE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current and cjson.decode(current)['owner'] == ARGV[1] then redis.call('DEL', KEYS[1]) end
+return 0
+"""
+
+
+class RedisSessionStore(SessionStore):
+    """Redis-backed store shared by every worker and node (any Redis-protocol server)."""
+
+    key_prefix = "interview_session:"
+
+    def __init__(self, url: str = REDIS_URL):
+        import redis.asyncio as aioredis
+
+        self._redis = aioredis.Redis.from_url(url, decode_responses=True)
+        self._claim = self._redis.register_script(_CLAIM_SCRIPT)
+        self._update = self._redis.register_script(_UPDATE_SCRIPT)
+        self._release = self._redis.register_script(_RELEASE_SCRIPT)
+
+    def _key(self, interview_id: int) -> str:
+        return f"{self.key_prefix}{interview_id}"
+
+    @staticmethod
+    def _encode(owner: str, state: Dict[str, Any]) -> str:
+        return json.dumps({**state, "owner": owner}, ensure_ascii=False, default=str)
+
+    async def claim(self, interview_id, owner, state, ttl=SESSION_STATE_TTL_SECONDS):
+        previous = await self._claim(keys=[self._key(interview_id)], args=[self._encode(owner, state), ttl * 1000])
+        return json.loads(previous)["owner"] if previous else None
+
+    async def update(self, interview_id, owner, state, ttl=SESSION_STATE_TTL_SECONDS):
+        return bool(await self._update(keys=[self._key(interview_id)], args=[self._encode(owner, state), owner, ttl * 1000]))
+
+    async def get(self, interview_id):
+        raw = await self._redis.get(self._key(interview_id))
+        return json.loads(raw) if raw else None
+
+    async def release(self, interview_id, owner):
+        await self._release(keys=[self._key(interview_id)], args=[owner])
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """The process-wide session store selected by SESSION_STORE_BACKEND (memory | redis)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            if SESSION_STORE_BACKEND == "redis":
+                _store = RedisSessionStore()
+            elif SESSION_STORE_BACKEND == "memory":
+                _store = MemorySessionStore()
+            else:
+                raise ValueError(f"Unknown SESSION_STORE_BACKEND: {SESSION_STORE_BACKEND}")
+    return _store
@@ -0,0 +1,121 @@
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import GRAMMAR_CACHE_MEMORY_SIZE, GRAMMAR_CACHE_MAX_ENTRIES, GRAMMAR_CACHE_EVICT_INTERVAL_SECONDS
+
+
+def normalize_line(line: str) -> str:
+    """
+    Cache-key form of a line: NFC-normalized, outer whitespace stripped.
+
+    Internal spacing is kept in the key because the checked text replaces the
+    line; collapsing it would let one spacing variant's result overwrite another's.
+    """
+    return unicodedata.normalize("NFC", line).strip()
+
+
+def line_hash(normalized_line: str) -> str:
+    return hashlib.sha256(normalized_line.encode("utf-8")).hexdigest()
+
+
+class SpellCheckResultCache:
+    """
+    Two-tier cache of spell-check results keyed by normalized-line hash.
+
+    - memory tier: per-process LRU (GRAMMAR_CACHE_MEMORY_SIZE entries)
+    - persistent tier: the spell_check_cache table, shared across workers and
+      restarts, trimmed to GRAMMAR_CACHE_MAX_ENTRIES by least-recent use at
+      most once per GRAMMAR_CACHE_EVICT_INTERVAL_SECONDS (per process)
+    """
+
+    def __init__(
+        self,
+        memory_size: int = GRAMMAR_CACHE_MEMORY_SIZE,
+        max_entries: int = GRAMMAR_CACHE_MAX_ENTRIES,
+        evict_interval: float = GRAMMAR_CACHE_EVICT_INTERVAL_SECONDS,
+    ):
+        self.memory_size = memory_size
+        self.max_entries = max_entries
+        self.evict_interval = evict_interval
+        self._next_eviction = 0.0
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+    def _remember(self, key: str, value: str) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def lookup(self, db: Optional[Session], keys: List[str]) -> Dict[str, str]:
+        """Returns {hash: checked_text} for every key found in either tier."""
+        found: Dict[str, str] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+            self._stats["memory_hits"] += len(found)
+
+        missing = [key for key in keys if key not in found]
+        if missing and db is not None:
+            try:
+                db_found = crud.spell_check_cache.get_many(db, line_hashes=missing)
+            except Exception as e:
+                print(f"Spell check cache lookup failed: {e}")
+                db.rollback()
+                db_found = {}
+            found.update(db_found)
+            with self._lock:
+                self._stats["db_hits"] += len(db_found)
+                for key, value in db_found.items():
+                    self._remember(key, value)
+
+        with self._lock:
+            self._stats["misses"] += len(keys) - len(found)
+        return found
+
+    def store(self, db: Optional[Session], entries: Dict[str, str]) -> None:
+        """Saves freshly checked results to both tiers; trims the table when eviction is due."""
+        if not entries:
+            return
+        with self._lock:
+            for key, value in entries.items():
+                self._remember(key, value)
+            self._stats["stored"] += len(entries)
+
+        if db is None:
+            return
+        with self._lock:
+            # 항목 수 집계(COUNT)는 저장할 때마다가 아니라 주기적으로만 실행
+            evict_due = time.monotonic() >= self._next_eviction
+            if evict_due:
+                self._next_eviction = time.monotonic() + self.evict_interval
+        try:
+            crud.spell_check_cache.upsert_many(db, entries=entries)
+            evicted = crud.spell_check_cache.evict_lru(db, max_entries=self.max_entries) if evict_due else 0
+        except Exception as e:
+            print(f"Spell check cache store failed: {e}")
+            db.rollback()
+            return
+        with self._lock:
+            self._stats["evicted"] += evicted
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["db_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+
+spell_check_cache = SpellCheckResultCache()
@@ -0,0 +1,99 @@
+import json
+import re
+from typing import Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([\]}])")
+
+
+class StructuredOutputError(Exception):
+    """Raised when an LLM response cannot be turned into the expected schema."""
+
+    def __init__(self, message: str, raw_text: Optional[str] = None):
+        super().__init__(message)
+        self.raw_text = raw_text
+
+
+def _json_candidates(text: str):
+    """Yields progressively more aggressive repairs of a JSON-ish response."""
+    stripped = text.strip()
+    yield stripped
+
+    # ```json ... ``` 코드 블록
+    fence = _FENCE_RE.search(stripped)
+    if fence:
+        yield fence.group(1).strip()
+
+    # 앞뒤 설명 문장이 붙은 경우: 가장 바깥쪽 객체만 추출
+    start, end = stripped.find("{"), stripped.rfind("}")
+    if 0 <= start < end:
+        body = stripped[start:end + 1]
+        yield body
+        # 마지막 요소 뒤의 쉼표
+        yield _TRAILING_COMMA_RE.sub(r"\1", body)
+
+
+def parse_structured(text: str, schema: Type[T]) -> T:
+    """
+    Parses an LLM response into `schema`, repairing common formatting slips
+    (code fences, surrounding prose, trailing commas) but never guessing content.
+
+    Raises:
+        StructuredOutputError: no candidate decodes to JSON that validates.
+    """
+    if not text or not text.strip():
+        raise StructuredOutputError("Empty response", raw_text=text)
+
+    last_error: Exception = StructuredOutputError("No JSON object found in response")
+    for candidate in _json_candidates(text):
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError as e:
+            last_error = e
+            continue
+        try:
+            return schema.model_validate(data)
+        except ValidationError as e:
+            # JSON은 맞지만 스키마가 다르면 다른 복구 후보도 같은 결과이므로 중단
+            raise StructuredOutputError(f"Response does not match schema: {e}", raw_text=text) from e
+    raise StructuredOutputError(f"Response is not valid JSON: {last_error}", raw_text=text)
+
+
+def generate_structured(
+    generate: Callable[[str], str],
+    prompt: str,
+    schema: Type[T],
+    *,
+    max_attempts: int = 2,
+) -> T:
+    """
+    Calls `generate(prompt)` until its text parses into `schema`, at most `max_attempts` times.
+
+    Retries append the validation error to the prompt so the model can correct
+    the specific problem instead of re-rolling blindly.
+
+    Raises:
+        StructuredOutputError: every attempt failed; carries the last raw response.
+    """
+    attempt_prompt = prompt
+    last_error: Optional[StructuredOutputError] = None
+    for attempt in range(1, max_attempts + 1):
+        text = generate(attempt_prompt)
+        try:
+            return parse_structured(text, schema)
+        except StructuredOutputError as e:
+            last_error = e
+            print(f"Structured output attempt {attempt}/{max_attempts} failed: {e}")
+            attempt_prompt = (
+                f"{prompt}\n\n"
+                f"[이전 응답 오류] 이전 응답을 처리할 수 없었습니다: {str(e)[:500]}\n"
+                f"지정된 JSON 스키마에 맞는 JSON 객체 하나만 출력하세요."
+            )
+    raise StructuredOutputError(
+        f"Failed to obtain valid structured output after {max_attempts} attempts: {last_error}",
+        raw_text=last_error.raw_text if last_error else None,
+    )
@@ -0,0 +1,146 @@
+import asyncio
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from app.core.config import (
+    REDIS_URL,
+    TRANSCRIPTION_DISPATCH,
+    TRANSCRIPTION_QUEUE,
+    TRANSCRIPTION_JOB_TIMEOUT_SECONDS,
+    TRANSCRIPTION_VAD,
+)
+from app.utils.model_registry import model_registry
+
+
+def transcribe_file(audio_path: str, language: str = "ko", vad: str = TRANSCRIPTION_VAD) -> Dict[str, Any]:
+    """
+    Transcribes a local audio file (any format the backend can decode) with the
+    configured Whisper backend (WHISPER_BACKEND, see app.utils.transcription_backends).
+
+    With vad="energy", silence is cut out before transcription and the segment
+    timestamps are mapped back to the original recording (see app.utils.vad).
+    """
+    backend = model_registry.get("whisper")
+    if vad == "off":
+        return backend.transcribe(audio_path, language=language)
+    if vad != "energy":
+        raise ValueError(f"Unknown TRANSCRIPTION_VAD: {vad}")
+
+    from app.utils.vad import empty_whisper_result, remap_whisper_result, trim_silence
+
+    speech, timing = trim_silence(backend.load_audio(audio_path))
+    if not timing.chunks:
+        # 무음 녹음은 Whisper에 넣지 않음 (무음 구간은 환각 결과의 주된 원인)
+        return empty_whisper_result(timing, language)
+    return remap_whisper_result(backend.transcribe(speech, language=language), timing)
+
+
+class TranscriptionError(Exception):
+    """Raised when a dispatched transcription job fails or times out."""
+
+
+class TranscriptionDispatcher(ABC):
+    """
+    Hands answer audio to Whisper and awaits the result.
+
+    The WebSocket front-end only talks to this interface, so transcription can
+    run in-process or on separate worker processes/nodes that scale
+    independently of the number of open interview connections.
+    """
+
+    @abstractmethod
+    async def transcribe(self, *, audio_path: str, source_bytes: bytes, language: str = "ko") -> Dict[str, Any]:
+        """
+        audio_path: the staged WAV on this node.
+        source_bytes: the audio as received from the client, for remote workers.
+        """
+
+
+class LocalTranscriptionDispatcher(TranscriptionDispatcher):
+    """Transcribes in this process on a single thread (the Whisper model is not thread-safe)."""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="transcription")
+
+    async def transcribe(self, *, audio_path, source_bytes, language="ko"):
+        loop = asyncio.get_running_loop()
+        # 이벤트 루프를 막지 않도록 전용 스레드에서 실행
+        return await loop.run_in_executor(self._executor, transcribe_file, audio_path, language)
+
+
+class RedisTranscriptionDispatcher(TranscriptionDispatcher):
+    """
+    Queues jobs on a Redis list consumed by `python -m app.workers.transcription_worker`.
+
+    The job carries the client's original (compressed) audio, so workers need no
+    shared filesystem; the worker pushes the result to a per-job reply list.
+    """
+
+    def __init__(self, url: str = REDIS_URL, queue: str = TRANSCRIPTION_QUEUE, timeout: int = TRANSCRIPTION_JOB_TIMEOUT_SECONDS):
+        import redis.asyncio as aioredis
+
+        self._redis = aioredis.Redis.from_url(url, decode_responses=True)
+        self.queue = queue
+        self.timeout = timeout
+
+    async def transcribe(self, *, audio_path, source_bytes, language="ko"):
+        job_id = uuid.uuid4().hex
+        reply_key = f"{self.queue}:reply:{job_id}"
+        job = {
+            "job_id": job_id,
+            "reply_to": reply_key,
+            "language": language,
+            "audio": base64.b64encode(source_bytes).decode("ascii"),
+            # 프런트엔드가 이미 포기한 작업은 워커가 건너뜀
+            "expires_at": time.time() + self.timeout,
+        }
+        await self._redis.lpush(self.queue, json.dumps(job))
+        reply = await self._redis.blpop(reply_key, timeout=self.timeout)
+        if reply is None:
+            raise TranscriptionError(f"Transcription job {job_id} timed out after {self.timeout}s")
+        payload = json.loads(reply[1])
+        if payload.get("error"):
+            raise TranscriptionError(f"Transcription job {job_id} failed: {payload['error']}")
+        return payload["result"]
+
+
+def run_transcription_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Executes one queued job on a transcription worker; returns the reply payload."""
+    fd, path = tempfile.mkstemp(prefix="transcribe-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(base64.b64decode(job["audio"]))
+        return {"job_id": job["job_id"], "result": transcribe_file(path, job.get("language", "ko"))}
+    except Exception as e:
+        return {"job_id": job["job_id"], "error": f"{type(e).__name__}: {e}"}
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_dispatcher: Optional[TranscriptionDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_transcription_dispatcher() -> TranscriptionDispatcher:
+    """The process-wide dispatcher selected by TRANSCRIPTION_DISPATCH (local | redis)."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            if TRANSCRIPTION_DISPATCH == "redis":
+                _dispatcher = RedisTranscriptionDispatcher()
+            elif TRANSCRIPTION_DISPATCH == "local":
+                _dispatcher = LocalTranscriptionDispatcher()
+            else:
+                raise ValueError(f"Unknown TRANSCRIPTION_DISPATCH: {TRANSCRIPTION_DISPATCH}")
+    return _dispatcher
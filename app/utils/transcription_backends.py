@@ -0,0 +1,120 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
+
+from app.core.config import (
+    WHISPER_BACKEND,
+    WHISPER_MODEL_NAME,
+    WHISPER_DEVICE,
+    WHISPER_COMPUTE_TYPE,
+    WHISPER_CPU_THREADS,
+    WHISPER_BEAM_SIZE,
+)
+
+# Segment fields copied from the engine's output (openai-whisper result format)
+SEGMENT_FIELDS = (
+    "id", "seek", "start", "end", "text", "tokens",
+    "temperature", "avg_logprob", "compression_ratio", "no_speech_prob",
+)
+
+
+class TranscriptionBackend(ABC):
+    """
+    A speech recognition engine behind transcribe_file.
+
+    Every backend returns results in openai-whisper's format ({"text",
+    "segments": [{"start", "end", "text", "no_speech_prob", ...}], "language"}),
+    so analysis, storage and reports do not depend on the engine in use.
+    `audio` is a file path or 16 kHz mono float32 samples.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def load_audio(self, audio_path: str):
+        """Decodes a file to 16 kHz mono float32 samples."""
+
+    @abstractmethod
+    def transcribe(self, audio: Union[str, Any], language: str = "ko") -> Dict[str, Any]:
+        """Transcribes a path or samples into an openai-whisper style result."""
+
+
+class OpenAIWhisperBackend(TranscriptionBackend):
+    """Reference implementation: openai-whisper on PyTorch."""
+
+    name = "openai"
+
+    def __init__(self, model_name: str = WHISPER_MODEL_NAME, device: str = WHISPER_DEVICE,
+                 cpu_threads: int = WHISPER_CPU_THREADS, beam_size: int = WHISPER_BEAM_SIZE):
+        import whisper
+
+        if cpu_threads > 0:
+            import torch
+            torch.set_num_threads(cpu_threads)
+        self.model = whisper.load_model(model_name, device=None if device == "auto" else device)
+        self.beam_size = beam_size
+
+    def load_audio(self, audio_path):
+        from whisper.audio import load_audio
+        return load_audio(audio_path)
+
+    def transcribe(self, audio, language="ko"):
+        options: Dict[str, Any] = {"fp16": self.model.device.type == "cuda"}
+        if self.beam_size > 1:
+            options["beam_size"] = self.beam_size
+        return self.model.transcribe(audio, language=language, **options)
+
+
+class FasterWhisperBackend(TranscriptionBackend):
+    """
+    faster-whisper: the same Whisper checkpoints on CTranslate2, with int8
+    quantization on CPU. Typically several times faster than the reference
+    implementation on CPU-only nodes at comparable accuracy.
+    """
+
+    name = "faster"
+
+    def __init__(self, model_name: str = WHISPER_MODEL_NAME, device: str = WHISPER_DEVICE,
+                 compute_type: str = WHISPER_COMPUTE_TYPE, cpu_threads: int = WHISPER_CPU_THREADS,
+                 beam_size: int = WHISPER_BEAM_SIZE):
+        from faster_whisper import WhisperModel
+
+        self.model = WhisperModel(model_name, device=device, compute_type=compute_type, cpu_threads=cpu_threads)
+        self.beam_size = beam_size
+
+    def load_audio(self, audio_path):
+        from faster_whisper import decode_audio
+        return decode_audio(audio_path, sampling_rate=16000)
+
+    def transcribe(self, audio, language="ko"):
+        # 무음 제거는 transcribe_file에서 처리하므로 엔진 내장 VAD는 사용하지 않음
+        segments, info = self.model.transcribe(audio, language=language, beam_size=self.beam_size, vad_filter=False)
+        # segments는 지연 생성기: 순회하는 동안 실제 디코딩이 진행됨
+        converted = [
+            {field: getattr(segment, field) for field in SEGMENT_FIELDS if hasattr(segment, field)}
+            for segment in segments
+        ]
+        return {
+            "text": "".join(segment["text"] for segment in converted),
+            "segments": converted,
+            "language": info.language,
+        }
+
+
+BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def create_transcription_backend(name: str = WHISPER_BACKEND, model_name: Optional[str] = None, **options) -> TranscriptionBackend:
+    """Instantiates (and loads) a backend; options override the WHISPER_* settings."""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown WHISPER_BACKEND: {name} (expected one of {', '.join(BACKENDS)})")
+    return BACKENDS[name](model_name or WHISPER_MODEL_NAME, **options)
+
+
+def describe_transcription_backend() -> str:
+    """Human-readable backend settings, shown in the model registry status."""
+    if WHISPER_BACKEND == FasterWhisperBackend.name:
+        return f"faster-whisper {WHISPER_MODEL_NAME} ({WHISPER_DEVICE}, {WHISPER_COMPUTE_TYPE})"
+    return f"openai-whisper {WHISPER_MODEL_NAME}"
@@ -0,0 +1,189 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+from app.core.config import TTS_CACHE_DIR, TTS_CACHE_MAX_FILES, TTS_CACHE_TRIM_INTERVAL_SECONDS
+
+DEFAULT_TTS_STYLE_PROMPT = (
+    "당신은 경험이 풍부한 전문 면접관입니다. 친절하면서도 전문적인 톤으로, "
+    "명확하고 또렷하게 질문을 전달합니다. 아주 살짝 빠른 속도로 말하며, "
+    "지원자가 편안하게 답변할 수 있도록 격려적인 분위기를 조성합니다."
+)
+
+_client: Optional[Any] = None
+_client_lock = threading.Lock()
+_next_trim = 0.0
+_trim_lock = threading.Lock()
+
+
+def clean_text_for_tts(text: str) -> str:
+    """
+    TTS 음성 생성을 위해 텍스트를 정제합니다.
+    이모티콘, 태그, 특수 기호 등을 제거합니다.
+
+    Args:
+        text: 원본 질문 텍스트
+
+    Returns:
+        정제된 텍스트
+    """
+    if not text:
+        return text
+
+    # 1. [공통], [압박] 같은 대괄호 태그와 뒤의 공백 제거
+    text = re.sub(r'\[.*?\]\s*', '', text)
+
+    # 2. 🌶️ 같은 특정 이모티콘 제거 (더 안전한 방법)
+    # 일반적인 이모티콘만 제거
+    emoji_pattern = re.compile(
+        "["
+        "\U0001F300-\U0001F9FF"  # 대부분의 이모티콘
+        "\U00002600-\U000027BF"  # 기타 기호
+        "]+",
+        flags=re.UNICODE
+    )
+    text = emoji_pattern.sub('', text)
+
+    # 3. 연속된 공백을 하나로 축소
+    text = re.sub(r'\s+', ' ', text)
+
+    # 4. 앞뒤 공백 제거
+    text = text.strip()
+
+    # 5. 안전장치: 텍스트가 비어있으면 경고
+    if not text:
+        print(f"WARNING: clean_text_for_tts resulted in empty string!")
+        return "질문을 준비 중입니다"  # 폴백 텍스트
+
+    return text
+
+
+def _voice_settings():
+    model_name = os.getenv("TTS_MODEL_NAME", "gemini-2.5-flash-tts")
+    voice_name = os.getenv("TTS_VOICE_NAME", "Charon")  # Gemini TTS voice
+    style_prompt = os.getenv("TTS_STYLE_PROMPT", DEFAULT_TTS_STYLE_PROMPT)
+    return model_name, voice_name, style_prompt
+
+
+def _get_client():
+    """The TTS client is thread-safe; create it once instead of per question."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            import google.cloud.texttospeech as tts
+            _client = tts.TextToSpeechClient()
+    return _client
+
+
+def synthesize_question_audio(cleaned_text: str) -> bytes:
+    """Synthesizes MP3 audio for already-cleaned question text."""
+    import google.cloud.texttospeech as tts
+
+    model_name, voice_name, style_prompt = _voice_settings()
+
+    # Gemini TTS 모델 체크
+    is_gemini_tts = "gemini" in model_name.lower()
+
+    if is_gemini_tts:
+        # Gemini TTS: 스타일 prompt 사용 시도, 음성은 model_name 필수
+        try:
+            synthesis_input = tts.SynthesisInput(text=cleaned_text, prompt=style_prompt)
+        except Exception:
+            # Fallback: prompt 필드를 지원하지 않는 클라이언트 버전
+            synthesis_input = tts.SynthesisInput(text=cleaned_text)
+            print(f"Gemini TTS fallback: using text only")
+        voice = tts.VoiceSelectionParams(language_code="ko-KR", name=voice_name, model_name=model_name)
+    else:
+        # Standard TTS: text만 사용, model_name 불필요
+        synthesis_input = tts.SynthesisInput(text=cleaned_text)
+        voice = tts.VoiceSelectionParams(language_code="ko-KR", name=voice_name)
+
+    audio_config = tts.AudioConfig(audio_encoding=tts.AudioEncoding.MP3)
+    response = _get_client().synthesize_speech(input=synthesis_input, voice=voice, audio_config=audio_config)
+    print(f"TTS audio synthesized using {model_name} with voice {voice_name}")
+    return response.audio_content
+
+
+def _cache_path(cleaned_text: str) -> str:
+    # 같은 문장이라도 모델/음성/스타일이 바뀌면 다른 음성이므로 키에 포함
+    model_name, voice_name, style_prompt = _voice_settings()
+    key = hashlib.sha256("\x00".join([model_name, voice_name, style_prompt, cleaned_text]).encode("utf-8")).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, key[:2], f"{key}.mp3")
+
+
+def _trim_cache() -> None:
+    """Deletes the least recently written files beyond TTS_CACHE_MAX_FILES (walks the whole cache)."""
+    files = []
+    for root, _, names in os.walk(TTS_CACHE_DIR):
+        for name in names:
+            if name.endswith(".mp3"):
+                path = os.path.join(root, name)
+                try:
+                    files.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+    overflow = len(files) - TTS_CACHE_MAX_FILES
+    if overflow <= 0:
+        return
+    for _, path in sorted(files)[:overflow]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _schedule_trim() -> None:
+    """
+    Runs _trim_cache in a background thread at most once per
+    TTS_CACHE_TRIM_INTERVAL_SECONDS, so a synthesis never pays for a walk over
+    the cache. Between trims the cache may briefly exceed TTS_CACHE_MAX_FILES.
+    """
+    global _next_trim
+    with _trim_lock:
+        now = time.monotonic()
+        if now < _next_trim:
+            return
+        _next_trim = now + TTS_CACHE_TRIM_INTERVAL_SECONDS
+    threading.Thread(target=_trim_cache, name="tts-cache-trim", daemon=True).start()
+
+
+def get_question_audio(question_text: str) -> bytes:
+    """
+    Returns MP3 audio for a question, synthesizing it only on a cache miss.
+
+    Audio is cached on disk by (model, voice, style prompt, cleaned text), so it
+    is shared by every worker process and by identical questions across resumes.
+    """
+    cleaned_text = clean_text_for_tts(question_text)
+    path = _cache_path(cleaned_text)
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    audio = synthesize_question_audio(cleaned_text)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 다른 워커가 같은 파일을 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(audio)
+    os.replace(tmp_path, path)
+    _schedule_trim()
+    return audio
+
+
+def prewarm_question_audio(question_texts: Iterable[str]) -> int:
+    """Synthesizes and caches audio for questions; returns how many succeeded."""
+    warmed = 0
+    for text in question_texts:
+        try:
+            get_question_audio(text)
+            warmed += 1
+        except Exception as e:
+            print(f"TTS pre-warm failed for question '{text[:30]}': {e}")
+    return warmed
@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.core.config import ACCESS_TOKEN_EXPIRE_MINUTES, USER_CACHE_TTL_SECONDS, USER_CACHE_MAX_ENTRIES
+from app.schemas.user import User as UserSnapshot
+
+
+class UserCache:
+    """
+    Short-TTL, per-process cache of user profiles keyed by user_id.
+
+    Entries are read-only `schemas.User` snapshots (never ORM rows, which are
+    bound to a request's session). crud_user invalidates an entry whenever the
+    user is updated or deleted; other workers see the change after the TTL.
+
+    Deleted user ids are also remembered for the lifetime of an access token so
+    that the claims-only auth path rejects tokens of users deleted in this process.
+    Deletions on other workers are not seen here; writes by such users are
+    turned into 401s by deps.raise_if_user_deleted.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = USER_CACHE_TTL_SECONDS,
+        max_entries: int = USER_CACHE_MAX_ENTRIES,
+        deleted_ttl_seconds: int = ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.deleted_ttl_seconds = deleted_ttl_seconds
+        # user_id -> (snapshot, expires_at as time.monotonic())
+        self._entries: "OrderedDict[int, Tuple[UserSnapshot, float]]" = OrderedDict()
+        # user_id -> 삭제 기록 만료 시각 (time.monotonic())
+        self._deleted: Dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[UserSnapshot]:
+        if self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            snapshot, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return snapshot
+
+    def set(self, snapshot: UserSnapshot) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[snapshot.user_id] = (snapshot, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(snapshot.user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int, deleted: bool = False) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+            if deleted:
+                now = time.monotonic()
+                # 만료된 삭제 기록 정리 (토큰 만료 이후에는 기록이 필요 없음)
+                for expired_id in [uid for uid, until in self._deleted.items() if until <= now]:
+                    del self._deleted[expired_id]
+                self._deleted[user_id] = now + self.deleted_ttl_seconds
+
+    def is_deleted(self, user_id: int) -> bool:
+        with self._lock:
+            until = self._deleted.get(user_id)
+            return until is not None and until > time.monotonic()
+
+
+user_cache = UserCache()
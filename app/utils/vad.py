@@ -0,0 +1,195 @@
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Whisper consumes 16 kHz mono float32
+SAMPLE_RATE = 16000
+
+# Energy is measured on non-overlapping 30ms frames
+FRAME_SECONDS = 0.03
+# A frame is speech when it is this many dB above the noise floor (the quiet
+# end of the recording's frame energies), but never below the absolute floor
+NOISE_MARGIN_DB = 12.0
+NOISE_PERCENTILE = 10
+ABSOLUTE_FLOOR_DB = -55.0
+# Pauses shorter than this stay inside a speech region (they are part of the
+# answer's rhythm); longer ones are cut out
+MIN_SILENCE_SECONDS = 0.6
+# Isolated energy bursts shorter than this (clicks, bumps) are not speech
+MIN_SPEECH_SECONDS = 0.1
+# Context kept around every region so word onsets and tails are not clipped
+PAD_SECONDS = 0.2
+# Short silence placed between spliced regions so Whisper still sees a pause
+SPLICE_GAP_SECONDS = 0.3
+
+
+class TimingMap:
+    """
+    Maps timestamps on the trimmed (speech-only) timeline back to the original
+    recording.
+
+    Each chunk is (trimmed_start, original_start, duration) in seconds. The
+    trimmed timeline may contain short splice gaps between chunks; a timestamp
+    inside a gap maps to the end of the previous chunk or the start of the next
+    one, depending on whether it ends or starts a segment.
+    """
+
+    def __init__(self, chunks: List[Tuple[float, float, float]], original_seconds: float):
+        self.chunks = chunks
+        self.original_seconds = original_seconds
+        self._starts = [chunk[0] for chunk in chunks]
+
+    @property
+    def speech_seconds(self) -> float:
+        return sum(chunk[2] for chunk in self.chunks)
+
+    def to_original(self, t: float, side: str = "start") -> float:
+        if not self.chunks:
+            return 0.0
+        index = max(bisect_right(self._starts, t) - 1, 0)
+        trimmed_start, original_start, duration = self.chunks[index]
+        offset = t - trimmed_start
+        if offset <= duration:
+            return original_start + max(offset, 0.0)
+        # 구간 사이의 이음 간격: 세그먼트 끝은 앞 구간의 끝, 시작은 다음 구간의 시작으로
+        if side == "start" and index + 1 < len(self.chunks):
+            return self.chunks[index + 1][1]
+        return original_start + duration
+
+    def removed_within(self, start: float, end: float) -> float:
+        """
+        Original-timeline seconds cut out between chunks that both overlap the
+        trimmed span [start, end], i.e. the pauses a segment spans on the
+        original recording but that Whisper never heard.
+        """
+        removed = 0.0
+        for (trimmed_start, original_start, duration), following in zip(self.chunks, self.chunks[1:]):
+            if start < trimmed_start + duration and end > following[0]:
+                removed += following[1] - (original_start + duration)
+        return removed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "original_seconds": round(self.original_seconds, 3),
+            "speech_seconds": round(self.speech_seconds, 3),
+            "regions": [[round(start, 3), round(start + duration, 3)] for _, start, duration in self.chunks],
+        }
+
+
+def frame_energies_db(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """RMS level of each FRAME_SECONDS frame in dBFS."""
+    frame = max(int(sample_rate * FRAME_SECONDS), 1)
+    count = len(samples) // frame
+    if count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[: count * frame].reshape(count, frame).astype(np.float32, copy=False)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+def detect_speech(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> List[Tuple[int, int]]:
+    """
+    Energy-based voice activity detection.
+
+    Returns speech regions as (start_sample, end_sample), padded and merged,
+    in ascending order. An empty list means the recording has no speech.
+    """
+    levels = frame_energies_db(samples, sample_rate)
+    if levels.size == 0:
+        return []
+
+    peak = float(levels.max())
+    if peak <= ABSOLUTE_FLOOR_DB:
+        return []
+    noise_floor = float(np.percentile(levels, NOISE_PERCENTILE))
+    if peak - noise_floor < NOISE_MARGIN_DB:
+        # 에너지 변화가 거의 없음 (쉬지 않은 발화 또는 잡음뿐): 판단하지 않고 전체를 유지
+        return [(0, len(samples))]
+    voiced = levels > max(ABSOLUTE_FLOOR_DB, noise_floor + NOISE_MARGIN_DB)
+    if not voiced.any():
+        return []
+
+    # 연속된 발화 프레임을 구간으로 묶음
+    edges = np.diff(np.concatenate(([0], voiced.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    min_silence = MIN_SILENCE_SECONDS / FRAME_SECONDS
+    regions: List[List[int]] = []
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        if regions and start - regions[-1][1] < min_silence:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+
+    frame = int(sample_rate * FRAME_SECONDS)
+    pad = int(sample_rate * PAD_SECONDS)
+    min_speech = MIN_SPEECH_SECONDS / FRAME_SECONDS
+    padded: List[Tuple[int, int]] = []
+    for start, end in regions:
+        if end - start < min_speech:
+            continue
+        start_sample = max(start * frame - pad, 0)
+        end_sample = min(end * frame + pad, len(samples))
+        if padded and start_sample <= padded[-1][1]:
+            padded[-1] = (padded[-1][0], end_sample)
+        else:
+            padded.append((start_sample, end_sample))
+    return padded
+
+
+def trim_silence(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> Tuple[np.ndarray, TimingMap]:
+    """
+    Cuts leading/trailing silence and long pauses out of a recording.
+
+    Returns the spliced speech (with SPLICE_GAP_SECONDS of silence between
+    regions) and the TimingMap back to the original timeline.
+    """
+    original_seconds = len(samples) / sample_rate
+    regions = detect_speech(samples, sample_rate)
+    gap = np.zeros(int(sample_rate * SPLICE_GAP_SECONDS), dtype=samples.dtype)
+
+    pieces: List[np.ndarray] = []
+    chunks: List[Tuple[float, float, float]] = []
+    cursor = 0
+    for start, end in regions:
+        if pieces:
+            pieces.append(gap)
+            cursor += len(gap)
+        pieces.append(samples[start:end])
+        chunks.append((cursor / sample_rate, start / sample_rate, (end - start) / sample_rate))
+        cursor += end - start
+
+    speech = np.concatenate(pieces) if pieces else samples[:0]
+    return speech, TimingMap(chunks, original_seconds)
+
+
+def remap_whisper_result(whisper_result: Dict[str, Any], timing: TimingMap) -> Dict[str, Any]:
+    """
+    Moves segment (and word) timestamps of a result computed on trimmed audio
+    back onto the original timeline, so pauses and leading silence count
+    towards the silence ratio exactly as if the full recording was transcribed.
+    Pauses that ended up inside a segment (Whisper read across the splice) are
+    recorded as the segment's "removed_silence" seconds.
+    """
+    def remap(item: Dict[str, Any]) -> None:
+        start = timing.to_original(item["start"], side="start")
+        end = timing.to_original(item["end"], side="end")
+        item["start"], item["end"] = round(start, 3), round(max(end, start), 3)
+
+    for segment in whisper_result.get("segments") or []:
+        # 세그먼트가 잘라낸 멈춤을 가로지르면 그 시간은 세그먼트 안의 침묵 (analyze_whisper_result가 합산)
+        removed = timing.removed_within(segment["start"], segment["end"])
+        remap(segment)
+        if removed > 0:
+            segment["removed_silence"] = round(removed, 3)
+        for word in segment.get("words") or []:
+            remap(word)
+    whisper_result["vad"] = timing.to_dict()
+    return whisper_result
+
+
+def empty_whisper_result(timing: TimingMap, language: Optional[str] = None) -> Dict[str, Any]:
+    """Result for a recording without speech (Whisper is not run on pure silence)."""
+    return {"text": "", "segments": [], "language": language, "vad": timing.to_dict()}
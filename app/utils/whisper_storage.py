@@ -0,0 +1,62 @@
+import json
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import WHISPER_RESULT_STORAGE, WHISPER_RESULT_KEEP_DETAIL
+
+# Segment fields used by analyze_whisper_result; everything else (tokens,
+# avg_logprob, compression_ratio, temperature, seek, ...) goes to the detail blob.
+SLIM_SEGMENT_FIELDS = ("start", "end", "text", "no_speech_prob", "removed_silence")
+SLIM_TOP_LEVEL_FIELDS = ("text", "language")
+
+
+def slim_whisper_result(whisper_result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Keeps only the fields needed for audio analytics."""
+    if not whisper_result:
+        return whisper_result
+
+    slim = {key: whisper_result[key] for key in SLIM_TOP_LEVEL_FIELDS if key in whisper_result}
+    slim["segments"] = [
+        {key: segment[key] for key in SLIM_SEGMENT_FIELDS if key in segment}
+        for segment in whisper_result.get("segments") or []
+    ]
+    return slim
+
+
+def is_slim(whisper_result: Optional[Dict[str, Any]]) -> bool:
+    """True when the result carries no fields beyond the slim set."""
+    if not whisper_result:
+        return True
+    if set(whisper_result) - set(SLIM_TOP_LEVEL_FIELDS) - {"segments"}:
+        return False
+    return all(set(segment) <= set(SLIM_SEGMENT_FIELDS) for segment in whisper_result.get("segments") or [])
+
+
+def compress_whisper_result(whisper_result: Dict[str, Any]) -> bytes:
+    """Serializes a full Whisper result to zlib-compressed JSON."""
+    payload = json.dumps(whisper_result, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(payload.encode("utf-8"), level=6)
+
+
+def decompress_whisper_result(blob: Optional[bytes]) -> Optional[Dict[str, Any]]:
+    """Inverse of compress_whisper_result."""
+    if not blob:
+        return None
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def prepare_whisper_result_for_storage(
+    whisper_result: Optional[Dict[str, Any]],
+) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+    """
+    Splits a Whisper result according to WHISPER_RESULT_STORAGE.
+
+    Returns:
+        (row_result, detail_blob) where row_result goes into Answer.whisper_result
+        and detail_blob into the deferred Answer.whisper_result_detail column.
+    """
+    if not whisper_result or WHISPER_RESULT_STORAGE == "full":
+        return whisper_result, None
+
+    detail = compress_whisper_result(whisper_result) if WHISPER_RESULT_KEEP_DETAIL else None
+    return slim_whisper_result(whisper_result), detail
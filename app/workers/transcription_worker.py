@@ -0,0 +1,94 @@
+"""
+음성 인식(Whisper) 워커
+
+TRANSCRIPTION_DISPATCH=redis 일 때 API 서버(WebSocket 프런트엔드)가 Redis 큐에 넣은
+전사 작업을 가져와 처리하고, 결과를 작업별 응답 리스트로 돌려줍니다.
+워커 수는 WebSocket 연결 수와 무관하게 GPU/CPU 자원에 맞춰 늘리거나 줄일 수 있습니다.
+
+가져온 작업은 응답을 보낼 때까지 워커별 처리 목록(<큐>:processing:<TRANSCRIPTION_WORKER_NAME>)에
+남아 있으므로, 처리 중에 워커가 죽으면 같은 이름으로 다시 시작할 때 큐로 되돌려 처리합니다.
+
+Usage:
+    python -m app.workers.transcription_worker
+"""
+import json
+import os
+import time
+
+from app.core.config import REDIS_URL, TRANSCRIPTION_QUEUE, TRANSCRIPTION_WORKER_NAME
+from app.utils.model_registry import model_registry
+from app.utils.transcription import run_transcription_job
+
+# 응답을 가져가지 않은 작업 결과는 이 시간 후 Redis에서 삭제
+REPLY_TTL_SECONDS = 600
+# Redis 오류 등으로 반복이 실패했을 때 다시 시도하기 전 대기 시간(초)
+ERROR_BACKOFF_SECONDS = 1.0
+
+
+def processing_list(worker_name: str = TRANSCRIPTION_WORKER_NAME) -> str:
+    return f"{TRANSCRIPTION_QUEUE}:processing:{worker_name}"
+
+
+def requeue_unfinished(client, processing: str) -> int:
+    """Moves jobs a previous run of this worker took but never answered back onto the queue."""
+    requeued = 0
+    # 큐의 오른쪽 끝이 다음에 가져갈 작업이므로 남은 작업을 그쪽에 넣어 먼저 처리
+    while client.lmove(processing, TRANSCRIPTION_QUEUE, "RIGHT", "RIGHT") is not None:
+        requeued += 1
+    return requeued
+
+
+def process_job(client, raw: str, worker_name: str) -> None:
+    job = json.loads(raw)
+    if job.get("expires_at") and job["expires_at"] < time.time():
+        print(f"Skipping expired transcription job {job['job_id']}")
+        return
+
+    started = time.perf_counter()
+    reply = run_transcription_job(job)
+    reply["worker"] = worker_name
+    pipe = client.pipeline()
+    pipe.lpush(job["reply_to"], json.dumps(reply, ensure_ascii=False))
+    pipe.expire(job["reply_to"], REPLY_TTL_SECONDS)
+    pipe.execute()
+    status = "failed" if reply.get("error") else "done"
+    print(f"Transcription job {job['job_id']} {status} in {time.perf_counter() - started:.2f}s")
+
+
+def main():
+    import redis
+
+    client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    worker_name = f"{TRANSCRIPTION_WORKER_NAME}:{os.getpid()}"
+    processing = processing_list()
+
+    requeued = requeue_unfinished(client, processing)
+    if requeued:
+        print(f"Requeued {requeued} unfinished transcription jobs from '{processing}'")
+
+    # 첫 작업 전에 모델을 로드해 두어 첫 응답 지연을 줄임
+    model_registry.get("whisper")
+    print(f"Transcription worker {worker_name} waiting for jobs on '{TRANSCRIPTION_QUEUE}'")
+
+    while True:
+        raw = None
+        try:
+            # 작업을 꺼내는 동시에 처리 목록으로 옮겨, 응답 전에 죽어도 작업이 사라지지 않음
+            raw = client.blmove(TRANSCRIPTION_QUEUE, processing, 5, "RIGHT", "LEFT")
+            if raw is None:
+                continue
+            process_job(client, raw, worker_name)
+        except Exception as e:
+            # 잘못된 작업이나 Redis 연결 오류로 워커가 종료되지 않도록 하고 다음 작업을 계속 처리
+            print(f"Transcription worker error: {type(e).__name__}: {e}")
+            time.sleep(ERROR_BACKOFF_SECONDS)
+        finally:
+            if raw is not None:
+                try:
+                    client.lrem(processing, 1, raw)
+                except Exception as e:
+                    print(f"Failed to acknowledge transcription job: {e}")
+
+
+if __name__ == "__main__":
+    main()
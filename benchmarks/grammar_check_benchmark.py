@@ -0,0 +1,137 @@
+"""
+맞춤법 검사 엔진 벤치마크
+
+기존 방식(줄 단위 순차 요청)과 GrammarCheckEngine(청크 묶음 + 병렬 요청)을 비교합니다.
+기본값은 네이버 맞춤법 검사기 응답 형식(HTML, 줄바꿈은 <br>)을 흉내 내는 로컬 스텁 서버이며,
+클라이언트는 hanspell과 같은 방식으로 응답을 파싱합니다 (<br> 제거 후 태그 제거 - 줄바꿈이 사라짐).
+--checker hanspell 을 주면 실제 hanspell_checker로 외부 검사기를 호출합니다 (네트워크 필요).
+
+Usage:
+    python -m benchmarks.grammar_check_benchmark --lines 200 --latency 0.3
+    python -m benchmarks.grammar_check_benchmark --lines 50 --checker hanspell
+"""
+import argparse
+import json
+import threading
+import time
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.utils.grammar_check import GrammarCheckEngine, hanspell_checker
+
+
+class _StubSpellerHandler(BaseHTTPRequestHandler):
+    """Answers like the Naver speller: corrected HTML with <br> line breaks, after a simulated delay."""
+    latency = 0.3
+    max_chars = 500
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real checker
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        text = json.loads(body)["text"]
+        time.sleep(self.latency)
+        if len(text) > self.max_chars:
+            payload = {"message": {"error": "too long"}}
+        else:
+            # 검사기는 앞뒤 공백을 정리하고 교정 부분을 태그로 감쌈
+            html = text.strip().replace("됬", "<em class='red_text'>됐</em>").replace("\n", "<br>")
+            payload = {"message": {"result": {"html": html, "errata_count": text.count("됬")}}}
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(latency: float, max_chars: int) -> ThreadingHTTPServer:
+    _StubSpellerHandler.latency = latency
+    _StubSpellerHandler.max_chars = max_chars
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubSpellerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _remove_tags(html: str) -> str:
+    # hanspell.spell_checker._remove_tags와 같은 처리: <br>은 빈 문자열로 제거됨
+    html = "<content>{}</content>".format(html).replace("<br>", "")
+    return "".join(ET.fromstring(html).itertext())
+
+
+def make_stub_checker(url: str, pool_size: int):
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+
+    def checker(text: str):
+        response = session.post(url, json={"text": text}, timeout=30)
+        result = response.json()["message"].get("result")
+        return _remove_tags(result["html"]) if result else None
+
+    return checker
+
+
+def sample_resume(num_lines: int) -> str:
+    lines = []
+    for i in range(num_lines):
+        if i % 10 == 9:
+            lines.append("")
+        else:
+            lines.append(f"{i}번째 문장입니다. 프로젝트를 진행하면서 많은 것을 배우게 됬습니다.")
+        if i % 25 == 24:
+            # 요청 한도보다 긴 줄은 여러 조각으로 나뉘어 검사됨
+            lines.append(" ".join(f"긴 문장의 {j}번째 부분도 검사가 됬습니다." for j in range(40)))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.3, help="simulated seconds per request")
+    parser.add_argument("--max-chars", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--checker", choices=("stub", "hanspell"), default="stub")
+    args = parser.parse_args()
+
+    server = None
+    if args.checker == "hanspell":
+        checker = hanspell_checker
+    else:
+        server = start_stub_server(args.latency, args.max_chars)
+        checker = make_stub_checker(f"http://127.0.0.1:{server.server_address[1]}/", args.workers)
+    content = sample_resume(args.lines)
+
+    # Baseline: one request per non-empty line, sequentially
+    start = time.perf_counter()
+    baseline = []
+    for line in content.split("\n"):
+        baseline.append(line if not line.strip() else (checker(line) or line))
+    baseline_time = time.perf_counter() - start
+
+    engine = GrammarCheckEngine(checker=checker, max_chars=args.max_chars, max_workers=args.workers)
+    start = time.perf_counter()
+    result = engine.check_text(content)
+    engine_time = time.perf_counter() - start
+
+    if server is not None:
+        server.shutdown()
+
+    print(f"checker={args.checker} lines={args.lines} latency={args.latency}s max_chars={args.max_chars} workers={args.workers}")
+    print(f"sequential per-line : {baseline_time:8.2f}s")
+    print(f"chunked + parallel  : {engine_time:8.2f}s  (x{baseline_time / engine_time:.1f})")
+    print(f"fallback chunks     : {engine.fallback_chunks}")
+    if args.checker == "stub":
+        # 스텁은 "됬"만 고치므로 기대 결과를 정확히 알 수 있음 (긴 줄의 조각 경계 공백 포함)
+        print(f"correct output      : {result == content.replace('됬', '됐')}")
+    else:
+        # 한도를 넘는 긴 줄은 기존 방식에서 검사되지 않으므로 그 줄은 다를 수 있음
+        print(f"identical output    : {result == chr(10).join(baseline)}")
+
+
+if __name__ == "__main__":
+    main()
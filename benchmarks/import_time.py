@@ -0,0 +1,100 @@
+"""
+앱 import 시간 벤치마크 (콜드 스타트 회귀 검사)
+
+새 파이썬 프로세스에서 `python -X importtime -c "import app.main"`을 실행해
+전체 import 시간과 누적 시간이 큰 모듈을 출력합니다. 무거운 SDK/ML 모듈
+(anthropic, whisper, torch 등)이 import 시점에 로드되거나 전체 시간이
+예산(--budget-ms)을 넘으면 0이 아닌 코드로 종료하므로 CI에서 사용할 수 있습니다.
+
+Usage:
+    python -m benchmarks.import_time --budget-ms 1500 --top 15
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+# 요청 처리 시점에만 필요해야 하는 모듈 (지연 import 대상)
+FORBIDDEN_MODULES = (
+    "anthropic",
+    "google.generativeai",
+    "google.cloud.texttospeech",
+    "whisper",
+    "faster_whisper",
+    "ctranslate2",
+    "torch",
+    "sentence_transformers",
+    "librosa",
+    "pydub",
+    "soundfile",
+)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_importtime(target: str) -> Tuple[List[Tuple[int, int, str]], float]:
+    """Imports `target` in a fresh interpreter; returns (self_us, cumulative_us, module) rows and wall seconds."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    # import 시점 부작용 없이 측정 (config의 기본값과 동일하게 강제)
+    env["PRELOAD_MODELS"] = "false"
+    env["CREATE_DUMMY_USER"] = "false"
+    env["PRINT_ROUTES"] = "false"
+
+    code = (
+        "import time; _t = time.perf_counter(); "
+        f"import {target}; "
+        "print(time.perf_counter() - _t)"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, cwd=REPO_ROOT,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-4000:])
+        raise SystemExit(f"import {target} failed (exit code {proc.returncode})")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((int(self_us), int(cumulative_us), name.strip()))
+        except ValueError:
+            continue
+    return rows, float(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="app.main", help="module to import")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="fail if the total import time exceeds this")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    args = parser.parse_args()
+
+    rows, wall_seconds = run_importtime(args.target)
+    loaded = {name for _, _, name in rows}
+    total_ms = sum(self_us for self_us, _, _ in rows) / 1000
+
+    print(f"import {args.target}: {total_ms:.0f}ms (importtime total), {wall_seconds * 1000:.0f}ms wall, {len(rows)} modules")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:10.1f}ms {self_us / 1000:8.1f}ms  {name}")
+
+    failed = False
+    eager = [m for m in FORBIDDEN_MODULES if m in loaded]
+    if eager:
+        failed = True
+        print(f"FAIL: heavy modules imported eagerly: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        failed = True
+        print(f"FAIL: import time {total_ms:.0f}ms exceeds budget {args.budget_ms:.0f}ms")
+    if not failed:
+        print(f"OK: within budget {args.budget_ms:.0f}ms, no heavy modules imported")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+음성 인식 엔진 벤치마크 (정확도 + 실시간 배율)
+
+한국어 음성 클립 목록(manifest.jsonl: {"id", "audio", "text"})을 여러 엔진/모델 설정으로
+전사해 CER(문자 오류율), WER(어절 오류율), RTF(전사 시간 / 오디오 길이), 모델 로드 시간을 비교합니다.
+기본 클립 목록은 benchmarks/fixtures/korean_clips/ 에 있으며, 음성 파일은 저장소에 포함하지
+않으므로 --synthesize 로 TTS(Google Cloud 인증 필요)를 사용해 만들거나 실제 답변 녹음을
+같은 형식의 목록으로 지정하세요 (실제 녹음이 더 정확한 비교가 됩니다).
+
+엔진 지정: <backend>:<model>[:<compute_type>]  (backend: openai | faster)
+
+Usage:
+    python -m benchmarks.transcription_benchmark --synthesize
+    python -m benchmarks.transcription_benchmark --engines openai:small faster:small:int8 faster:small:float32 --threads 4
+"""
+import argparse
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.transcription_backends import TranscriptionBackend, create_transcription_backend
+
+DEFAULT_MANIFEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "korean_clips", "manifest.jsonl")
+SAMPLE_RATE = 16000
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def load_manifest(path: str) -> List[Dict[str, str]]:
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding="utf-8") as f:
+        clips = [json.loads(line) for line in f if line.strip()]
+    for clip in clips:
+        clip["path"] = os.path.join(base, clip["audio"])
+    return clips
+
+
+def synthesize_missing(clips: List[Dict[str, str]]) -> int:
+    """Creates missing clips from their reference text with the app's TTS."""
+    from app.utils.tts import synthesize_question_audio
+
+    created = 0
+    for clip in clips:
+        if not os.path.exists(clip["path"]):
+            with open(clip["path"], "wb") as f:
+                f.write(synthesize_question_audio(clip["text"]))
+            created += 1
+    return created
+
+
+def edit_distance(reference: List[str], hypothesis: List[str]) -> int:
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp in enumerate(hypothesis, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref != hyp))
+        previous = current
+    return previous[-1]
+
+
+def error_counts(reference: str, hypothesis: str) -> Tuple[int, int, int, int]:
+    """
+    (char errors, reference chars, word errors, reference words).
+    Punctuation is ignored; CER also ignores spacing, which Korean
+    transcripts apply inconsistently.
+    """
+    reference = _PUNCTUATION.sub("", reference)
+    hypothesis = _PUNCTUATION.sub("", hypothesis)
+    ref_chars, hyp_chars = list(reference.replace(" ", "")), list(hypothesis.replace(" ", ""))
+    ref_words, hyp_words = reference.split(), hypothesis.split()
+    return (
+        edit_distance(ref_chars, hyp_chars), len(ref_chars),
+        edit_distance(ref_words, hyp_words), len(ref_words),
+    )
+
+
+def parse_engine(spec: str) -> Tuple[str, str, Optional[str]]:
+    parts = spec.split(":")
+    if len(parts) not in (2, 3):
+        raise argparse.ArgumentTypeError(f"Engine must be <backend>:<model>[:<compute_type>], got {spec!r}")
+    return parts[0], parts[1], parts[2] if len(parts) == 3 else None
+
+
+def run_engine(spec: str, clips: List[Dict[str, Any]], args) -> Dict[str, Any]:
+    name, model_name, compute_type = parse_engine(spec)
+    options: Dict[str, Any] = {"cpu_threads": args.threads, "beam_size": args.beam_size}
+    if args.device:
+        options["device"] = args.device
+    if compute_type:
+        options["compute_type"] = compute_type
+
+    started = time.perf_counter()
+    backend: TranscriptionBackend = create_transcription_backend(name, model_name, **options)
+    load_seconds = time.perf_counter() - started
+
+    audio = [backend.load_audio(clip["path"]) for clip in clips]
+    # 첫 추론의 초기화 비용은 RTF에서 제외
+    for samples in audio[: args.warmup]:
+        backend.transcribe(samples, language="ko")
+
+    totals = {"char_errors": 0, "chars": 0, "word_errors": 0, "words": 0, "audio_seconds": 0.0, "transcribe_seconds": 0.0}
+    for clip, samples in zip(clips, audio):
+        started = time.perf_counter()
+        result = backend.transcribe(samples, language="ko")
+        elapsed = time.perf_counter() - started
+        char_errors, chars, word_errors, words = error_counts(clip["text"], result.get("text", ""))
+        duration = len(samples) / SAMPLE_RATE
+
+        totals["char_errors"] += char_errors
+        totals["chars"] += chars
+        totals["word_errors"] += word_errors
+        totals["words"] += words
+        totals["audio_seconds"] += duration
+        totals["transcribe_seconds"] += elapsed
+        if args.verbose:
+            print(f"  [{spec}] {clip['id']}: CER {char_errors / max(chars, 1) * 100:.1f}%, "
+                  f"RTF {elapsed / duration:.3f} | {result.get('text', '').strip()}")
+
+    return {
+        "engine": spec,
+        "clips": len(clips),
+        "load_seconds": round(load_seconds, 2),
+        "audio_seconds": round(totals["audio_seconds"], 2),
+        "transcribe_seconds": round(totals["transcribe_seconds"], 2),
+        "cer": round(totals["char_errors"] / max(totals["chars"], 1) * 100, 2),
+        "wer": round(totals["word_errors"] / max(totals["words"], 1) * 100, 2),
+        "rtf": round(totals["transcribe_seconds"] / max(totals["audio_seconds"], 1e-9), 4),
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST)
+    parser.add_argument("--engines", nargs="+", default=["openai:small", "faster:small:int8"])
+    parser.add_argument("--device", default=None, help="auto | cpu | cuda (default: WHISPER_DEVICE)")
+    parser.add_argument("--threads", type=int, default=0, help="CPU threads (0: library default)")
+    parser.add_argument("--beam-size", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=1, help="untimed transcriptions before measuring")
+    parser.add_argument("--synthesize", action="store_true", help="create missing clips with TTS")
+    parser.add_argument("--json", dest="json_path", help="also write the summary to this file")
+    parser.add_argument("--verbose", action="store_true", help="print every clip's transcript")
+    args = parser.parse_args(argv)
+
+    clips = load_manifest(args.manifest)
+    if args.synthesize:
+        print(f"Synthesized {synthesize_missing(clips)} missing clips")
+    missing = [clip["audio"] for clip in clips if not os.path.exists(clip["path"])]
+    if missing:
+        parser.error(f"{len(missing)} clips are missing (e.g. {missing[0]}); run with --synthesize or fix the manifest")
+
+    results = []
+    for spec in args.engines:
+        print(f"Running {spec} on {len(clips)} clips...")
+        results.append(run_engine(spec, clips, args))
+
+    print()
+    print(f"{'engine':<24} {'CER':>7} {'WER':>7} {'RTF':>8} {'x realtime':>11} {'load':>7}")
+    for result in results:
+        print(f"{result['engine']:<24} {result['cer']:>6.2f}% {result['wer']:>6.2f}% {result['rtf']:>8.4f} "
+              f"{1 / max(result['rtf'], 1e-9):>10.1f}x {result['load_seconds']:>6.1f}s")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
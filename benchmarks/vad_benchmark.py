@@ -0,0 +1,161 @@
+"""
+전사 전 무음 제거(VAD) 벤치마크
+
+답변 녹음(--files) 또는 합성 녹음(앞뒤 무음과 긴 멈춤이 있는 발화 모양의 신호)에
+에너지 기반 VAD를 적용해 Whisper에 들어가는 오디오 길이가 얼마나 줄어드는지,
+VAD 자체의 처리 시간, 합성 녹음의 경우 실제 발화 구간을 얼마나 보존하는지를 출력합니다.
+--transcribe 를 주면 Whisper로 원본/무음 제거 전사를 모두 실행해 전사 시간과
+침묵 비율(analyze_whisper_result)을 비교합니다 (Whisper 모델과 ffmpeg 필요).
+마지막으로 잘라낸 멈춤을 가로지르는 세그먼트의 침묵 비율이 원본 기준과 같은지 확인합니다.
+
+Usage:
+    python -m benchmarks.vad_benchmark --synthetic 20
+    python -m benchmarks.vad_benchmark --files answers/*.wav --transcribe
+"""
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.utils.vad import SAMPLE_RATE, remap_whisper_result, trim_silence
+
+
+def synthesize_answer(rng: np.random.Generator) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+    """
+    A speech-like recording: syllable-rate modulated harmonics separated by
+    pauses, with leading/trailing silence over a low noise floor.
+    Returns (samples, true speech regions in seconds).
+    """
+    pieces = [rng.uniform(1.0, 5.0)]  # 앞쪽 무음
+    for _ in range(rng.integers(3, 8)):
+        pieces += [rng.uniform(1.5, 8.0), rng.choice([rng.uniform(0.2, 0.5), rng.uniform(1.0, 4.0)])]
+    pieces[-1] = rng.uniform(2.0, 8.0)  # 뒤쪽 무음
+
+    total = int(sum(pieces) * SAMPLE_RATE)
+    samples = rng.normal(0.0, 0.002, total).astype(np.float32)
+    regions = []
+    cursor = 0.0
+    for index, length in enumerate(pieces):
+        if index % 2 == 1:
+            start, n = int(cursor * SAMPLE_RATE), int(length * SAMPLE_RATE)
+            t = np.arange(n) / SAMPLE_RATE
+            pitch = rng.uniform(100, 220)
+            voice = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 6))
+            envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3, 6) * t)  # 음절 단위 강약
+            samples[start:start + n] += (0.1 * voice * envelope).astype(np.float32)
+            regions.append((cursor, cursor + length))
+        cursor += length
+    return samples, regions
+
+
+def speech_recall(timing, regions: List[Tuple[float, float]]) -> float:
+    """Fraction of true speech time that survived trimming."""
+    kept = 0.0
+    for start, end in regions:
+        for _, chunk_start, duration in timing.chunks:
+            kept += max(0.0, min(end, chunk_start + duration) - max(start, chunk_start))
+    total = sum(end - start for start, end in regions)
+    return kept / total if total else 1.0
+
+
+def check_spanning_segment(rng: np.random.Generator) -> Tuple[float, float]:
+    """
+    Deterministic check of a segment that spans a removed pause: one result
+    segment covering the whole trimmed audio (as Whisper often returns for
+    short answers) must still report the cut pause as silence.
+    Returns (silence % after remapping, expected silence %).
+    """
+    from app.utils.audio_analysis import analyze_whisper_result
+
+    samples, regions = synthesize_answer(rng)
+    speech, timing = trim_silence(samples)
+    trimmed_end = len(speech) / SAMPLE_RATE
+    words = " ".join(["말"] * 20)
+    result = remap_whisper_result({"text": words, "segments": [{"start": 0.0, "end": trimmed_end, "text": words}]}, timing)
+    end = result["segments"][-1]["end"]
+    # 기대값: 원본 타임라인에서 첫 발화 구간 앞의 무음 + 잘라낸 멈춤
+    first = timing.chunks[0][1]
+    pauses = sum(following[1] - (start + duration) for (_, start, duration), following in zip(timing.chunks, timing.chunks[1:]))
+    return analyze_whisper_result(result)[1], (first + pauses) / end * 100
+
+
+def load_file(path: str) -> np.ndarray:
+    import librosa
+
+    samples, _ = librosa.load(path, sr=SAMPLE_RATE, mono=True)
+    return samples.astype(np.float32)
+
+
+def transcribe_both(model, samples: np.ndarray, speech: np.ndarray, timing) -> Tuple[float, float, float, float]:
+    """Returns (full seconds, trimmed seconds, full silence %, trimmed silence %)."""
+    from app.utils.audio_analysis import analyze_whisper_result
+
+    started = time.perf_counter()
+    full = model.transcribe(samples, language="ko")
+    full_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    trimmed = remap_whisper_result(model.transcribe(speech, language="ko"), timing) if timing.chunks else {}
+    trimmed_seconds = time.perf_counter() - started
+    return full_seconds, trimmed_seconds, analyze_whisper_result(full)[1], analyze_whisper_result(trimmed)[1]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", nargs="*", default=[], help="answer recordings (any format librosa can read)")
+    parser.add_argument("--synthetic", type=int, default=20, help="number of synthetic recordings when --files is empty")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--transcribe", action="store_true", help="also run Whisper on full and trimmed audio")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    if args.files:
+        recordings = [(path, load_file(path), None) for path in args.files]
+    else:
+        recordings = [(f"synthetic-{i}", *synthesize_answer(rng)) for i in range(args.synthetic)]
+
+    model = None
+    if args.transcribe:
+        from app.utils.model_registry import model_registry
+        model = model_registry.get("whisper")
+
+    totals = {"original": 0.0, "speech": 0.0, "vad": 0.0, "full_asr": 0.0, "trimmed_asr": 0.0}
+    recalls = []
+    print(f"{'recording':<24} {'original':>9} {'trimmed':>9} {'cut':>6} {'vad ms':>7}  extra")
+    for name, samples, regions in recordings:
+        started = time.perf_counter()
+        speech, timing = trim_silence(samples)
+        vad_seconds = time.perf_counter() - started
+        original, kept = len(samples) / SAMPLE_RATE, len(speech) / SAMPLE_RATE
+        totals["original"] += original
+        totals["speech"] += kept
+        totals["vad"] += vad_seconds
+
+        extra = ""
+        if regions is not None:
+            recalls.append(speech_recall(timing, regions))
+            extra += f"speech kept {recalls[-1] * 100:.1f}%"
+        if model is not None:
+            full_s, trimmed_s, full_silence, trimmed_silence = transcribe_both(model, samples, speech, timing)
+            totals["full_asr"] += full_s
+            totals["trimmed_asr"] += trimmed_s
+            extra += f" asr {full_s:.1f}s -> {trimmed_s:.1f}s, silence {full_silence:.1f}% vs {trimmed_silence:.1f}%"
+        print(f"{name[-24:]:<24} {original:>8.1f}s {kept:>8.1f}s {(1 - kept / original) * 100:>5.1f}% {vad_seconds * 1000:>7.1f}  {extra}")
+
+    print()
+    print(f"Audio sent to Whisper: {totals['original']:.1f}s -> {totals['speech']:.1f}s "
+          f"({(1 - totals['speech'] / max(totals['original'], 1e-9)) * 100:.1f}% less)")
+    print(f"VAD cost: {totals['vad'] * 1000 / max(totals['original'] / 60, 1e-9):.1f} ms per audio minute")
+    if recalls:
+        print(f"True speech kept: min {min(recalls) * 100:.1f}%, avg {sum(recalls) / len(recalls) * 100:.1f}%")
+    if model is not None:
+        print(f"Whisper time: {totals['full_asr']:.1f}s -> {totals['trimmed_asr']:.1f}s")
+
+    remapped, expected = check_spanning_segment(np.random.default_rng(args.seed))
+    status = "ok" if abs(remapped - expected) < 0.01 else "MISMATCH"
+    print(f"Segment spanning removed pauses: silence {remapped:.1f}% (expected {expected:.1f}%) {status}")
+
+
+if __name__ == "__main__":
+    main()